@@ -0,0 +1,96 @@
+"""
+Compares the incremental :class:`~subway.parser.RequestParser` against the previous
+``StreamReader.readuntil`` + :meth:`~subway.request.Request.parse` path.
+
+A batch of pipelined requests is delivered in segments of different sizes, the way it would be
+received from a socket, and both paths build a :class:`~subway.request.Request` out of every request.
+
+Usage: python benchmarks/parser.py [requests]
+"""
+from typing import Any, Callable, Coroutine, List
+import datetime
+import asyncio
+import types
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from subway.parser import RequestParser
+from subway.request import Request
+from subway.streams import StreamReader
+from subway.utils import CLRF
+
+REQUEST = (
+    b'GET /api/users/1234?fields=name,email HTTP/1.1\r\n'
+    b'Host: localhost:8080\r\n'
+    b'User-Agent: Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0\r\n'
+    b'Accept: text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8\r\n'
+    b'Accept-Language: en-US,en;q=0.5\r\n'
+    b'Accept-Encoding: gzip, deflate, br\r\n'
+    b'Cookie: __subway=0123456789abcdef0123456789abcdef\r\n'
+    b'Connection: keep-alive\r\n'
+    b'\r\n'
+)
+
+SEGMENT_SIZES = (1 << 20, 1460, 64)
+
+worker: Any = types.SimpleNamespace(app=None)
+
+def segments(data: bytes, size: int) -> List[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+async def feed(reader: StreamReader, parser: Any, chunks: List[bytes]) -> None:
+    for chunk in chunks:
+        reader.feed_data(chunk)
+        if parser is not None:
+            parser.feed_data(chunk)
+
+        await asyncio.sleep(0)
+
+async def readuntil_path(chunks: List[bytes], count: int) -> None:
+    reader = StreamReader()
+    feeder = asyncio.create_task(feed(reader, None, chunks))
+
+    for _ in range(count):
+        status_line = await reader.readuntil(CLRF)
+        await Request.parse(status_line, reader, None, worker, datetime.datetime.utcnow()) # type: ignore
+
+    await feeder
+
+async def parser_path(chunks: List[bytes], count: int) -> None:
+    reader = StreamReader()
+    parser = RequestParser()
+    feeder = asyncio.create_task(feed(reader, parser, chunks))
+
+    for _ in range(count):
+        head = await parser.next_head()
+        assert head is not None
+
+        reader.skip(head.size)
+        Request.from_head(head, reader, None, worker, datetime.datetime.utcnow()) # type: ignore
+
+    await feeder
+
+async def bench(func: Callable[[List[bytes], int], Coroutine[Any, Any, None]], chunks: List[bytes], count: int) -> float:
+    start = time.perf_counter()
+    await func(chunks, count)
+
+    return count / (time.perf_counter() - start)
+
+async def main(count: int) -> None:
+    data = REQUEST * count
+    print(f'{count} pipelined requests of {len(REQUEST)} bytes each\n')
+    print(f'{"segment size":>14} | {"readuntil (req/s)":>18} | {"parser (req/s)":>15} | {"speedup":>7}')
+
+    for size in SEGMENT_SIZES:
+        chunks = segments(data, size)
+
+        old = await bench(readuntil_path, chunks, count)
+        new = await bench(parser_path, chunks, count)
+
+        print(f'{size:>14} | {old:>18,.0f} | {new:>15,.0f} | {new / old:>6.2f}x')
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,80 @@
+"""
+Compares matching paths against the :class:`~subway.router.RouteTree` with the previous
+linear scan that tried every route's regex in turn.
+
+Every application is made of groups of routes the way a REST API usually is, a static listing route,
+a parameterized route for a single item and a nested parameterized route. The matched paths are drawn
+evenly from all the routes, so on average the linear scan has to go through half of them.
+
+Usage: python benchmarks/router.py [lookups]
+"""
+from typing import Any, Callable, List, Optional
+import random
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from subway.router import Router, ResolvedRoute
+
+ROUTE_COUNTS = (10, 100, 1000)
+
+async def handler(request: Any, **kwargs: Any) -> None:
+    pass
+
+def linear_match(router: Router, path: str) -> Optional[ResolvedRoute]:
+    for route in router:
+        params = route.match(path)
+        if params is not None:
+            return ResolvedRoute(route, params)
+
+    return None
+
+def create_router(count: int) -> Router:
+    router = Router()
+    templates = ('/api/v1/resource{0}', '/api/v1/resource{0}/{{id}}', '/api/v1/resource{0}/{{id}}/children/{{child}}')
+
+    for i in range(count):
+        template = templates[i % len(templates)].format(i // len(templates))
+        router.add_route(router.create_route(handler, template, 'GET', name=None))
+
+    return router
+
+def create_paths(count: int, lookups: int) -> List[str]:
+    rng = random.Random(count)
+    templates = ('/api/v1/resource{0}', '/api/v1/resource{0}/{1}', '/api/v1/resource{0}/{1}/children/{2}')
+
+    paths = []
+    for _ in range(lookups):
+        i = rng.randrange(count)
+        template = templates[i % len(templates)]
+
+        paths.append(template.format(i // len(templates), rng.randrange(1 << 20), rng.randrange(1 << 20)))
+
+    return paths
+
+def bench(func: Callable[[Router, str], Optional[ResolvedRoute]], router: Router, paths: List[str]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        func(router, path)
+
+    return (time.perf_counter() - start) / len(paths) * 1e6
+
+def main(lookups: int) -> None:
+    print(f'{lookups} lookups per run\n')
+    print(f'{"routes":>6} | {"linear (us/op)":>14} | {"tree (us/op)":>12} | {"speedup":>8}')
+
+    for count in ROUTE_COUNTS:
+        router = create_router(count)
+        paths = create_paths(count, lookups)
+
+        assert all(router.match(path) is not None for path in paths)
+
+        old = bench(linear_match, router, paths)
+        new = bench(Router.match, router, paths)
+
+        print(f'{count:>6} | {old:>14.2f} | {new:>12.2f} | {old / new:>7.1f}x')
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
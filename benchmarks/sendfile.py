@@ -0,0 +1,95 @@
+"""
+Compares :class:`~subway.response.FileResponse` sending a file with ``sendfile`` against
+reading the whole file into memory and sending it along with the headers, which is what it used to do.
+
+Usage: python benchmarks/sendfile.py [size in MiB] [downloads]
+"""
+from typing import Any, Dict
+import tempfile
+import tracemalloc
+import asyncio
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import subway
+from subway import files
+
+PORT = 8765
+
+class ReadFileResponse(subway.FileResponse):
+    async def prepare(self):
+        self.body = body = await self.file.read()
+        data = self._prepare(body)
+
+        await self.file.close()
+        return data
+
+    async def write_body(self, writer: Any) -> None:
+        return None
+
+async def download(path: str) -> int:
+    reader, writer = await asyncio.open_connection('127.0.0.1', PORT)
+    writer.write(f'GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n'.encode())
+
+    total = 0
+    while True:
+        chunk = await reader.read(1 << 20)
+        if not chunk:
+            break
+
+        total += len(chunk)
+
+    writer.close()
+    return total
+
+async def main(size: int, downloads: int) -> None:
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, 'artifact.bin')
+
+    with open(filename, 'wb') as f:
+        f.write(os.urandom(size))
+
+    app = subway.Application(port=PORT, worker_count=1)
+
+    @app.route('/sendfile')
+    async def sendfile(request: subway.Request[subway.Application]):
+        return subway.FileResponse(await files.open(filename))
+
+    @app.route('/read')
+    async def read(request: subway.Request[subway.Application]):
+        return ReadFileResponse(await files.open(filename))
+
+    await app.start()
+    results: Dict[str, Any] = {}
+
+    for path in ('/read', '/sendfile'):
+        start = time.perf_counter()
+        for _ in range(downloads):
+            await download(path)
+
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        await download(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[path] = (size * downloads / elapsed / (1 << 20), peak / (1 << 20))
+
+    await app.close()
+    os.remove(filename)
+
+    print(f'{downloads} downloads of a {size >> 20} MiB file\n')
+    print(f'{"path":>10} | {"throughput (MiB/s)":>18} | {"peak allocated (MiB)":>20}')
+
+    for path, (throughput, peak) in results.items():
+        print(f'{path:>10} | {throughput:>18,.0f} | {peak:>20,.1f}')
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    downloads = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    asyncio.run(main(size << 20, downloads))
@@ -14,6 +14,7 @@ from .headers import *
 from .files import *
 from .formdata import *
 from .workers import *
+from .supervisor import *
 from .resources import *
 from .sessions import *
 from .cookies import *
@@ -22,5 +23,8 @@ from .listeners import *
 from .base import *
 from .blueprints import *
 from .converters import *
+from .compression import *
+from .caching import *
+from .ratelimits import *
 
 from . import websockets, compat, server, http, models, streams
\ No newline at end of file
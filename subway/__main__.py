@@ -22,6 +22,7 @@ def create_arguments() -> argparse.ArgumentParser:
     create_argument(parser, '--port', '-p', type=int)
     create_argument(parser, '--path', '-P', type=str)
     create_argument(parser, '--worker-count', type=int)
+    create_argument(parser, '--workers', '-w', type=int)
 
     return parser
 
@@ -77,6 +78,9 @@ def main() -> None:
         app.worker_count = args.worker_count
         app.setup_workers()
 
+    if args.workers is not None:
+        app.settings.process_count = args.workers
+
     try:
         app.run()
     except KeyboardInterrupt:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Literal, Optional, Set, Type, TypeVar, Union, AsyncIterator
-import datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Set, Type, TypeVar, Union, AsyncIterator
 import os
 import sys
 import ssl
@@ -14,6 +13,7 @@ import traceback
 import jinja2
 import pathlib
 import types
+import copy
 
 from .types import (
     CoroFunc,
@@ -28,21 +28,25 @@ from .types import (
 from .resources import Resource
 from . import compat, utils
 from .request import Request
-from .responses import redirects, HTTPException, InternalServerError
+from .responses import redirects, HTTPException, InternalServerError, TooManyRequests
 from .errors import *
 from .router import Router, ResolvedRoute
 from .settings import Settings, Config
 from .objects import PartialRoute, Route, Listener, WebSocketRoute, Middleware
 from .views import HTTPView
 from .response import Response, JSONResponse, FileResponse, HTMLResponse, StreamResponse
+from .compression import Compression
+from .caching import CachePolicy, CacheEntry, CachedResponse, EncodedResponse, ResponseCache, SingleFlight, Flight
+from .ratelimits import RateLimiter
 from .files import File
+from .headers import Headers
 from .websockets import ServerWebSocket as WebSocket, WebSocketProtocol
 from .workers import Worker
-from .models import Model, IncompatibleType, MissingField
+from .supervisor import Supervisor
+from .models import Model
 from .url import URL
 from .base import BaseApplication
 from .blueprints import Blueprint
-from .converters import AbstractConverter
 from .cookies import Cookie
 from .multidict import MultiDict
 
@@ -52,6 +56,13 @@ T = TypeVar('T')
 
 __all__ = 'Application',
 
+# The headers kept by a ``304 Not Modified`` response, see RFC 9110 section 15.4.5.
+NOT_MODIFIED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control', 'Content-Location', 'Expires', 'Vary')
+# Request headers that would make a refreshed response a partial or ``304 Not Modified`` one.
+CONDITIONAL_HEADERS = frozenset({
+    'if-none-match', 'if-modified-since', 'if-match', 'if-unmodified-since', 'if-range', 'range'
+})
+
 
 class Application(BaseApplication):
     """
@@ -83,6 +94,9 @@ class Application(BaseApplication):
         An optional :class:`socket.socket` instance.
     worker_count: :class:`int`
         An optional integer representing the number of workers to spawn.
+    process_count: :class:`int`
+        An optional integer representing the number of processes to run the application in.
+        If greater than 1, :meth:`run` uses a :class:`~.Supervisor` to fork the processes.
     ssl: :class:`bool`
         An optional bool indicating whether to use SSL.
     ssl_context: :class:`ssl.SSLContext`
@@ -136,6 +150,17 @@ class Application(BaseApplication):
         A callback that gets called whenever there is a need to generate a cookie header value for responses.
     config: :class:`dict`
         A dict letting users store custom configuration.
+    compression: Optional[:class:`~.Compression`]
+        The compression applied to responses, set if :attr:`~.Settings.compression` is enabled.
+        It can be replaced by a customized :class:`~.Compression` instance.
+    response_cache: Optional[:class:`~.ResponseCache`]
+        The cache storing the responses of routes using :func:`~subway.cache_control`,
+        set if :attr:`~.Settings.response_cache_size` is not ``0``.
+    single_flight: :class:`~.SingleFlight`
+        Coalesces identical concurrent requests to the routes using :func:`~subway.single_flight`.
+    rate_limiter: Optional[:class:`~.RateLimiter`]
+        Limits the rate of requests to every route, ``None`` by default.
+        Routes can have their own limits with :func:`~subway.rate_limit`.
     """
     RESPONSE_HANDLERS: Dict[type, Callable[[Application, Any], MaybeCoro[Response]]] = {
         str: lambda _, body: Response(body),
@@ -146,7 +171,7 @@ class Application(BaseApplication):
         Response: lambda _, body: body,
         File: lambda _, body: FileResponse(body),
         types.AsyncGeneratorType: lambda _, body: StreamResponse(body),
-        Model: lambda _, model: JSONResponse(model.json()),
+        Model: lambda _, model: JSONResponse(model),
     }
 
     def __init__(
@@ -164,6 +189,7 @@ class Application(BaseApplication):
         ipv6: bool = False,
         sock: Optional[socket.socket] = None,
         worker_count: Optional[int] = None,
+        process_count: Optional[int] = None,
         ssl: Union[bool, ssl.SSLContext] = False,
         cookie_session_callback: Optional[CookieSessionCallback] = None,
         backlog: Optional[int] = None,
@@ -182,6 +208,7 @@ class Application(BaseApplication):
             ssl=ssl,
             backlog=backlog,
             worker_count=worker_count,
+            process_count=process_count,
             ipv6=ipv6,
         )
 
@@ -210,7 +237,22 @@ class Application(BaseApplication):
         self._lifespan_tasks: List[AsyncIterator[Any]] = []
         self._reuse_host = reuse_host
         self._reuse_port = reuse_port
+        self._socket_shared = False
         self._response_middlewares: List[ResponseMiddleware] = []
+        self._frozen = False
+        self._frozen_paths: FrozenSet[str] = frozenset()
+        self._response_handlers: Mapping[type, Callable[[Application, Any], MaybeCoro[Response]]] = self.RESPONSE_HANDLERS
+        self._cache_control_headers: Dict[Route, str] = {}
+        self._date = utils.HTTPDateCache()
+        self.compression: Optional[Compression] = Compression() if settings.compression else None
+        self.response_cache: Optional[ResponseCache] = None
+        if settings.response_cache_size:
+            self.response_cache = ResponseCache(settings.response_cache_size)
+
+        self.single_flight = SingleFlight()
+        self.rate_limiter: Optional[RateLimiter] = None
+        self._cache_policies: Dict[Route, Optional[CachePolicy]] = {}
+        self._background_tasks: Set[asyncio.Task[Any]] = set()
 
         if not reuse_host:
             self.worker_count = 1
@@ -310,100 +352,8 @@ class Application(BaseApplication):
 
         return workers
 
-    async def _transform_model(self, parameter: Parameter, request: Request[Application]) -> Any:
-        try:
-            data = await request.json(check_content_type=True)
-        except AssertionError:
-            if parameter.default is not parameter.empty:
-                return parameter.default
-
-            raise
-        
-        annotations = utils.get_union_args(parameter.annotation)
-
-        for annotation in annotations:
-            if issubclass(annotation, Model):
-                try:
-                    return annotation.from_json(data)
-                except (IncompatibleType, MissingField):
-                    continue
-
-        if parameter.default is not parameter.empty:
-            return parameter.default
-
-        raise BadModelConversion(data, parameter, annotations)
-
-    async def _transform(
-        self, 
-        parameter: Parameter, 
-        argument: str, 
-        request: Request[Application]
-    ) -> Any:
-        annotation = parameter.annotation
-
-        if getattr(annotation, '__origin__', None) is Literal:
-            if argument not in annotation.__args__:
-                if parameter.default is not parameter.empty:
-                    return parameter.default
-
-                raise BadLiteralArgument(argument, parameter, annotation.__args__)
-
-            return argument
-
-        for annotation in utils.get_union_args(annotation):
-            if isinstance(annotation, AbstractConverter):
-                return await annotation.convert(request, argument)
-            elif issubclass(annotation, AbstractConverter):
-                return await annotation().convert(request, argument) # type: ignore
-
-            try:
-                return annotation(argument)
-            except ValueError:
-                continue
-        
-        if parameter.default is not parameter.empty:
-            return parameter.default
-
-        raise FailedConversion(argument, parameter)
-
     async def _convert(self, resolved: ResolvedRoute, request: Request[Application]) -> Dict[str, Any]:
-        kwargs: Dict[str, Any] = {}
-
-        route = resolved.route
-        params = iter(route.signature.parameters.items())
-
-        try:
-            next(params)
-        except StopIteration:
-            if not route.parent:
-                raise RuntimeError(f"Route {route!r} missing request argument")
-
-            raise RuntimeError(f"Route {route!r} missing self argument")
-
-        if route.parent:
-            try:
-                next(params)
-            except StopIteration:
-                raise RuntimeError(f"Route {route!r} missing request argument")
-
-        if route.is_websocket():
-            try:
-                next(params)
-            except StopIteration:
-                raise RuntimeError(f"Route {route!r} missing websocket argument")
-
-        for key, parameter in params:
-            value = resolved.params.get(key)
-
-            if value:
-                if parameter.annotation is not inspect.Signature.empty:
-                    value = await self._transform(parameter, value, request)
-            else:
-                value = await self._transform_model(parameter, request)
-               
-            kwargs[key] = value
-            
-        return kwargs
+        return await resolved.route.binder.bind(request, resolved.params)
 
     def _validate_status_code(self, code: int):
         if 300 <= code <= 399:
@@ -422,18 +372,31 @@ class Application(BaseApplication):
         request: Request[Application], 
         route: Route, kwargs: Dict[str, Any]
     ) -> Any:
-        middlewares = route.request_middlewares.copy()
-        middlewares.extend(self.request_middlewares)
+        middlewares = route.get_middleware_chain(self.router).request
+        if not middlewares:
+            return True
+
+        if self.settings.sequential_middlewares:
+            for middleware in middlewares:
+                ret = await middleware(request, route, **kwargs)
+
+                if isinstance(ret, Response):
+                    await request.send(ret)
+                    return False
+
+                if not ret:
+                    return False
+
+            return True
 
         result = await asyncio.gather(*[middleware(request, route, **kwargs) for middleware in middlewares])
         ret = list(result)
 
         response = utils.find(lambda x: isinstance(x, Response), ret)
         if response:
-            ret.remove(response)
-
+            # The middleware answered the request, so the route itself must not run.
             await request.send(response)
-            return True
+            return False
 
         return all(ret)
 
@@ -443,8 +406,15 @@ class Application(BaseApplication):
         response: Response,
         route: Route
     ) -> Any:
-        middlewares = route.response_middlewares.copy()
-        middlewares.extend(self.response_middlewares)
+        middlewares = route.get_middleware_chain(self.router).response
+        if not middlewares:
+            return None
+
+        if self.settings.sequential_middlewares:
+            for middleware in middlewares:
+                await middleware(request, response, route)
+
+            return None
 
         return await asyncio.gather(
             *[middleware(request, response, route) for middleware in middlewares],
@@ -491,12 +461,37 @@ class Application(BaseApplication):
 
     async def _request_handler(self, request: Request[Application], websocket: Optional[WebSocket]):
         route = None
+        policy = None
+        stale = None
+        flight: Optional[Flight] = None
 
         try:
             resolved = self.router.resolve(request.url.path, request.method)
             if not resolved:
                 return
 
+            if self.rate_limiter is not None or hasattr(resolved.route, '__rate_limit__'):
+                if not await self._check_rate_limits(request, resolved.route):
+                    return
+
+            if self.response_cache is not None and request.method == 'GET':
+                policy = self.get_cache_policy(resolved.route)
+                if policy is not None and not policy.applies_to(request):
+                    policy = None
+
+            if policy is not None:
+                entry = self.response_cache.get(resolved.route, request) # type: ignore
+                if entry is not None:
+                    if entry.is_fresh():
+                        return await self._send_cached(request, entry, age=entry.age())
+
+                    if entry.is_revalidatable():
+                        self._revalidate(resolved, request, policy, entry)
+                        return await self._send_cached(request, entry, age=entry.age())
+
+                    if entry.is_usable_on_error():
+                        stale = entry
+
             kwargs = await self._convert(resolved, request)
             ret = await self._run_request_middlewares(request=request, route=resolved.route, kwargs=kwargs)
 
@@ -507,11 +502,35 @@ class Application(BaseApplication):
                 await self._handle_websocket_connection(resolved.route, request, websocket) # type: ignore
                 return
 
-            resp = resolved.route(request, **kwargs)
-            if inspect.isawaitable(resp):
-                resp = await resp
+            if request.method == 'GET' and hasattr(resolved.route, '__single_flight__'):
+                key = self.single_flight.key(resolved.route, request, resolved.route.__single_flight__['vary'])
+
+                current = self.single_flight.get(key)
+                if current is None:
+                    flight = self.single_flight.begin(key)
+                else:
+                    shared = await current.wait()
+                    if shared is not None:
+                        return await self._send_cached(request, shared)
+
+            resp = None
+            if hasattr(resolved.route, '__etag__'):
+                resp = await self._check_route_etag(resolved.route, request, kwargs)
+
+            if resp is None:
+                resp = resolved.route(request, **kwargs)
+                if inspect.isawaitable(resp):
+                    resp = await resp
 
         except Exception as exc:
+            if flight is not None:
+                self.single_flight.end(flight, resolved.route, exc=exc)
+
+            # Deliberate client errors and redirects are the current state of the resource, not a failure.
+            if stale is not None and not (isinstance(exc, HTTPException) and exc.status < 500):
+                log.exception(f'Serving a stale response to {request!r} after an error')
+                return await self._send_cached(request, stale, age=stale.age())
+
             if not route:
                 route = PartialRoute(
                     path=request.url.path,
@@ -523,11 +542,35 @@ class Application(BaseApplication):
                 request=request,
                 exc=exc
             )
+        except BaseException:
+            if flight is not None:
+                # The waiting requests run the route themselves.
+                self.single_flight.end(flight, resolved.route)
+
+            raise
+
+        if flight is None:
+            response = await self.process_response(resp, request, resolved.route)
+        else:
+            try:
+                response = await self.process_response(resp, request, resolved.route)
+            except BaseException as exc:
+                self.single_flight.end(flight, resolved.route, exc=exc if isinstance(exc, Exception) else None)
+                raise
+
+            self.single_flight.end(flight, resolved.route, response, session_cookie_name=self.settings.session_cookie_name)
+
+        if policy is not None:
+            if stale is not None and response.status >= 500:
+                return await self._send_cached(request, stale, age=stale.age())
+
+            self._store_response(resolved.route, request, response, policy)
+
+        # Added once the response was shared, the headers are specific to the client.
+        if request._rate_limit is not None:
+            response.headers.update(request._rate_limit.to_headers())
 
-        response = await self.process_response(resp, request, resolved.route)
-        
         await request.send(response, convert=False)
-        await request.close()
 
         after_request = resolved.route._after_request # type: ignore
         if after_request:
@@ -674,15 +717,22 @@ class Application(BaseApplication):
         Any
             The response handler.
         """
+        handlers = self._response_handlers
+
         type = obj.__class__
-        callback = self.RESPONSE_HANDLERS.get(type)
+        callback = handlers.get(type)
 
         if callback is not None:
             return callback
 
         for cls in type.__mro__:
-            callback = self.RESPONSE_HANDLERS.get(cls)
+            callback = handlers.get(cls)
             if callback is not None:
+                if self._frozen:
+                    # The handlers are a private snapshot by now, so the lookup through the MRO
+                    # only has to be done once per type.
+                    handlers[type] = callback # type: ignore
+
                 return callback
 
         return None
@@ -755,6 +805,19 @@ class Application(BaseApplication):
 
         return response
 
+    def _build_cache_control_header(self, route: Route) -> str:
+        parts: List[str] = []
+
+        for key, value in route.__cache_control__.items():
+            key = key.replace('_', '-')
+
+            if isinstance(value, bool):
+                parts.append(key)
+            else:
+                parts.append(f'{key}={value}')
+
+        return ', '.join(parts)
+
     def add_cache_control_header(
         self, 
         response: Response, 
@@ -772,22 +835,239 @@ class Application(BaseApplication):
             The route that was used to generate the response.
         """
         if hasattr(route, '__cache_control__') and not response.headers.get('Cache-Control'):
-            control = route.__cache_control__
-            parts: List[str] = []
+            header = self._cache_control_headers.get(route) or self._build_cache_control_header(route)
 
-            for key, value in control.items():
-                key = key.replace('_', '-')
-
-                if isinstance(value, bool):
-                    parts.append(key)
-                else:
-                    parts.append(f'{key}={value}')
-
-            header = ', '.join(parts)
             response.headers['Cache-Control'] = header
 
         return response
 
+    async def _check_route_etag(
+        self,
+        route: Route,
+        request: Request[Application],
+        kwargs: Dict[str, Any]
+    ) -> Optional[Response]:
+        options = route.__etag__
+        key = options['key']
+        if key is None:
+            return None
+
+        version = await utils.maybe_coroutine(key, request, **kwargs)
+        if version is None:
+            return None
+
+        request._etag = etag = utils.generate_etag(str(version), weak=options['weak'])
+        if request.method in ('GET', 'HEAD') and utils.etag_matches(etag, request.headers.get('If-None-Match')):
+            # The resource didn't change, so the route doesn't need to be called at all.
+            return Response(status=304, headers={'ETag': etag})
+
+        return None
+
+    def get_cache_policy(self, route: Route) -> Optional[CachePolicy]:
+        """
+        Returns how long the responses of a route are kept in the :attr:`response_cache`,
+        derived from the options of :func:`~subway.cache_control`. Returns ``None`` if they aren't cached.
+
+        Parameters
+        ----------
+        route: :class:`~subway.Route`
+            The route.
+        """
+        try:
+            return self._cache_policies[route]
+        except KeyError:
+            pass
+
+        options = getattr(route, '__cache_control__', None)
+        policy = CachePolicy.from_cache_control(options) if options is not None else None
+
+        if self._frozen:
+            self._cache_policies[route] = policy
+
+        return policy
+
+    def _store_response(self, route: Route, request: Request[Application], response: Response, policy: CachePolicy) -> None:
+        cache = self.response_cache
+        assert cache is not None
+
+        if cache.is_storable(response, self.settings.session_cookie_name):
+            cache.store(route, request, response, policy)
+
+    async def _send_cached(self, request: Request[Application], entry: EncodedResponse, *, age: Optional[int] = None) -> None:
+        headers = entry.headers
+
+        response: Response
+        if self._is_not_modified(request, headers.get('ETag'), headers.get('Last-Modified')):
+            response = Response(
+                status=304,
+                version=entry.version,
+                headers={name: headers[name] for name in NOT_MODIFIED_HEADERS if name in headers}
+            )
+        else:
+            response = CachedResponse(entry, age=age)
+
+        self.set_default_session_cookie(request, response)
+        response.headers['Date'] = self._date.value
+
+        if request._rate_limit is not None:
+            response.headers.update(request._rate_limit.to_headers())
+
+        await request.send(response, convert=False)
+
+    async def _check_rate_limits(self, request: Request[Application], route: Route) -> bool:
+        result = None
+
+        if self.rate_limiter is not None:
+            result = self.rate_limiter.hit(request)
+
+        if hasattr(route, '__rate_limit__') and (result is None or result.allowed):
+            scoped = route.__rate_limit__.hit(request, f'{route.method} {route.path}')
+
+            # The most restrictive of the two limits is reported.
+            if scoped is not None and (result is None or not scoped.allowed or scoped.remaining < result.remaining):
+                result = scoped
+
+        if result is None:
+            return True
+
+        if not result.allowed:
+            response = TooManyRequests('Too Many Requests', content_type='text/plain', headers=result.to_headers())
+            response.headers['Date'] = self._date.value
+
+            await request.send(response, convert=False)
+            return False
+
+        request._rate_limit = result
+        return True
+
+    def _revalidate(self, resolved: ResolvedRoute, request: Request[Application], policy: CachePolicy, entry: CacheEntry) -> None:
+        if entry.revalidating:
+            return
+
+        entry.revalidating = True
+
+        task = self.loop.create_task(self._refresh_cached_response(resolved, request, policy, entry))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh_cached_response(
+        self,
+        resolved: ResolvedRoute,
+        request: Request[Application],
+        policy: CachePolicy,
+        entry: CacheEntry
+    ) -> None:
+        # The refresh must produce a full response to store, whatever the triggering client already has.
+        request = copy.copy(request)
+        request.headers = Headers(
+            (name, value) for name, value in request.headers.items() if name.lower() not in CONDITIONAL_HEADERS
+        )
+        request._etag = None
+
+        try:
+            kwargs = await self._convert(resolved, request)
+
+            resp = resolved.route(request, **kwargs)
+            if inspect.isawaitable(resp):
+                resp = await resp
+
+            response = await self.process_response(resp, request, resolved.route)
+            if response.status < 500:
+                self._store_response(resolved.route, request, response, policy)
+        except Exception:
+            log.exception(f'Failed to refresh the cached response to {request!r}')
+        finally:
+            entry.revalidating = False
+
+    def _generate_etag(self, response: Response, route: Route) -> Optional[str]:
+        options = getattr(route, '__etag__', None)
+        if options is None:
+            if not self.settings.auto_etag:
+                return None
+
+            weak = False
+        elif options['key'] is not None:
+            return None
+        else:
+            weak = options['weak']
+
+        if isinstance(response, (StreamResponse, FileResponse)):
+            return None
+
+        body = response.body
+        if not isinstance(body, (bytes, bytearray, str)):
+            return None
+
+        return utils.generate_etag(body, weak=weak)
+
+    async def _not_modified(self, response: Response) -> Response:
+        not_modified = Response(status=304, version=response.version)
+        for name in NOT_MODIFIED_HEADERS:
+            value = response.headers.get(name)
+            if value is not None:
+                not_modified.headers[name] = value
+
+        not_modified.cookies = response.cookies
+
+        # The body of the original response is never sent.
+        if isinstance(response, FileResponse):
+            await response.file.close()
+        elif isinstance(response, StreamResponse):
+            aclose = getattr(response.stream, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+
+        return not_modified
+
+    async def evaluate_preconditions(
+        self,
+        request: Request[Application],
+        response: Response,
+        route: Route
+    ) -> Response:
+        """
+        Adds an ``ETag`` header to a response if the route uses :func:`~subway.etag` or :attr:`~.Settings.auto_etag`
+        is enabled, and answers the request with ``304 Not Modified`` instead if its ``If-None-Match`` header matches
+        the response's ``ETag`` or, without one, if its ``If-Modified-Since`` header is not older than the
+        response's ``Last-Modified``.
+
+        Parameters
+        ----------
+        request: :class:`~.Request`
+            The request that was sent to the server.
+        response: :class:`~subway.response.Response`
+            The response to the request.
+        route: :class:`~.Route`
+            The route that was used to generate the response.
+        """
+        if response.status != 200 or request.method not in ('GET', 'HEAD'):
+            return response
+
+        headers = response.headers
+
+        etag = headers.get('ETag')
+        if etag is None:
+            etag = request._etag or self._generate_etag(response, route)
+            if etag is not None:
+                headers['ETag'] = etag
+
+        if not self._is_not_modified(request, etag, headers.get('Last-Modified')):
+            return response
+
+        return await self._not_modified(response)
+
+    def _is_not_modified(self, request: Request[Application], etag: Optional[str], last_modified: Optional[str]) -> bool:
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag is not None and utils.etag_matches(etag, if_none_match)
+
+        if_modified_since = utils.parse_http_date(request.headers.get('If-Modified-Since'))
+        if if_modified_since is None:
+            return False
+
+        timestamp = utils.parse_http_date(last_modified)
+        return timestamp is not None and timestamp <= if_modified_since
+
     async def process_response(
         self, 
         resp: RouteResponse, 
@@ -809,12 +1089,19 @@ class Application(BaseApplication):
         response = await self.parse_response(resp)
         await self._run_response_middlewares(request, response, route)
 
+        if isinstance(response, FileResponse) and request.method == 'GET':
+            response.set_range(request.headers.get('Range'), request.headers.get('If-Range'))
+
         self.set_default_session_cookie(request, response)
         self.add_cache_control_header(response, request, route)
 
+        response = await self.evaluate_preconditions(request, response, route)
+
+        if self.compression is not None:
+            response = await self.compression.compress(request, response)
+
         if not response.headers.get('Date'):
-            now = datetime.datetime.utcnow()
-            response.headers['Date'] = now.strftime('%a, %d %b %Y %H:%M:%S GMT')
+            response.headers['Date'] = self._date.value
 
         if not response.headers.get('Server'):
             response.headers['Server'] = 'Subway'
@@ -998,6 +1285,9 @@ class Application(BaseApplication):
         """
         A set of all paths.
         """
+        if self._frozen:
+            return self._frozen_paths
+
         return {route.path for route in self.router}
 
     def url_for(self, path: str, *, is_websocket: bool = False, **kwargs: Any) -> URL:
@@ -1013,6 +1303,7 @@ class Application(BaseApplication):
         **kwargs: 
             Additional arguments to build the URL.
         """
+        path = Router.PARAM_REGEX.sub(lambda match: '{%s}' % match.group('param'), path)
         url = self._build_url(path.format(**kwargs), is_websocket=is_websocket)
         return url
 
@@ -1093,6 +1384,60 @@ class Application(BaseApplication):
         """
         await asyncio.gather(*[worker.wait_until_ready() for worker in self.workers])
 
+    def is_frozen(self) -> bool:
+        """
+        Returns whether or not the application has been frozen.
+        """
+        return self._frozen
+
+    def freeze(self) -> None:
+        """
+        Freezes the application, precomputing everything about handling requests that only depends
+        on its configuration. This is done by :meth:`start` if it wasn't done before.
+
+        This compiles the argument binder and middleware chain of every route and the ``Cache-Control``
+        header and response cache policy of the routes using :func:`~subway.cache_control`, and snapshots :attr:`RESPONSE_HANDLERS`
+        and :attr:`paths`. Once frozen, adding or removing routes or global middlewares raises
+        a :exc:`~subway.errors.RegistrationError`.
+        """
+        if self._frozen:
+            return
+
+        router = self.router
+
+        for route in router:
+            # Built ahead of time, so that the first requests don't pay for it.
+            route.get_binder()
+            route.get_middleware_chain(router)
+
+            if hasattr(route, '__cache_control__'):
+                self._cache_control_headers[route] = self._build_cache_control_header(route)
+                self._cache_policies[route] = CachePolicy.from_cache_control(route.__cache_control__)
+
+        self._response_handlers = dict(self.RESPONSE_HANDLERS)
+        self._frozen_paths = frozenset(route.path for route in router)
+
+        router.freeze()
+        self._frozen = True
+
+    def unfreeze(self) -> None:
+        """
+        Unfreezes the application, allowing routes and middlewares to be changed again.
+        """
+        if not self._frozen:
+            return
+
+        self.router.unfreeze()
+
+        self._frozen = False
+        self._frozen_paths = frozenset()
+        self._response_handlers = self.RESPONSE_HANDLERS
+        self._cache_control_headers.clear()
+        self._cache_policies.clear()
+
+        if self.response_cache is not None:
+            self.response_cache.clear()
+
     async def start(self) -> None:
         """
         Starts the application.
@@ -1109,6 +1454,9 @@ class Application(BaseApplication):
         if not self.workers:
             raise ValueError('No workers have been added to the application')
 
+        self.freeze()
+        self._date.start(self.loop)
+
         for worker in self.workers:
             await worker.serve()
 
@@ -1120,15 +1468,23 @@ class Application(BaseApplication):
     def run(self) -> None:
         """
         Starts the application but blocks until the application is closed.
+        If :attr:`~.Settings.process_count` is greater than 1, the application is run
+        in multiple processes using a :class:`~.Supervisor`.
         """
+        if self.settings.process_count > 1:
+            supervisor = Supervisor(self, self.settings.process_count)
+            return supervisor.run()
+
         loop = self.loop
         self.loop.run_until_complete(self.start())
 
         try:
             loop.run_forever()
         except (KeyboardInterrupt, OSError):
-            if not self.is_closed():
-                loop.run_until_complete(self.close())
+            pass
+
+        if not self.is_closed():
+            loop.run_until_complete(self.close())
 
         # try:
         #     self._cancel_all_tasks()
@@ -1144,11 +1500,16 @@ class Application(BaseApplication):
         for worker in self.workers:
             await worker.close()
 
+        self._date.stop()
+
         for generator in self._lifespan_tasks:
             await self._safe_anext(generator)
 
         if self.socket and not utils.socket_is_closed(self.socket):
-            self.socket.shutdown(socket.SHUT_RDWR)
+            if not self._socket_shared:
+                # Shutting down a socket inherited from a supervisor would stop every other process from accepting.
+                self.socket.shutdown(socket.SHUT_RDWR)
+
             self.socket.close()
         
         self.dispatch('shutdown')
@@ -1178,6 +1539,7 @@ class Application(BaseApplication):
         self._listeners.clear()
         self._lifespan_tasks.clear()
 
+        self.unfreeze()
         self.router.clear()
 
     def lifespan(self, callback: Callable[[], AsyncIterator[Any]]) -> Callable[[], AsyncIterator[Any]]:
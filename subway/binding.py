@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Type
+import inspect
+import enum
+
+from .errors import BadLiteralArgument, BadModelConversion, FailedConversion
+from .converters import AbstractConverter
+from .models import Model, IncompatibleType, MissingField
+from . import utils
+
+if TYPE_CHECKING:
+    from .objects import Route
+    from .request import Request
+
+__all__ = (
+    'ParameterKind',
+    'ParameterBinder',
+    'RouteBinder',
+)
+
+class ParameterKind(enum.IntEnum):
+    RAW = 0
+    LITERAL = 1
+    CONVERTED = 2
+
+class ParameterBinder:
+    """
+    Binds a single parameter of a route's callback, everything that can be known about it
+    without a request is worked out when it is created.
+
+    A parameter is taken from the path parameter with the same name if there is one,
+    and otherwise from the JSON body of the request, converted to one of its :class:`~subway.models.Model` annotations.
+
+    Parameters
+    ----------
+    parameter: :class:`inspect.Parameter`
+        The parameter to bind.
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the parameter.
+    kind: :class:`~.ParameterKind`
+        How the value of a path parameter is converted.
+    """
+    __slots__ = ('parameter', 'name', 'kind', 'default', 'literals', 'converters', 'models')
+
+    def __init__(self, parameter: inspect.Parameter) -> None:
+        self.parameter = parameter
+        self.name = parameter.name
+        self.default = parameter.default
+
+        self.literals: Tuple[Any, ...] = ()
+        self.converters: List[Tuple[bool, Callable[..., Any]]] = []
+        self.models: Tuple[Type[Model], ...] = ()
+
+        annotation = parameter.annotation
+        if annotation is inspect.Parameter.empty:
+            self.kind = ParameterKind.RAW
+            return
+
+        self.models = tuple(
+            arg for arg in utils.get_union_args(annotation) if isinstance(arg, type) and issubclass(arg, Model)
+        )
+
+        if getattr(annotation, '__origin__', None) is Literal:
+            self.kind = ParameterKind.LITERAL
+            self.literals = annotation.__args__
+
+            return
+
+        self.kind = ParameterKind.CONVERTED
+
+        for arg in utils.get_union_args(annotation):
+            if isinstance(arg, AbstractConverter):
+                self.converters.append((True, arg.convert))
+            elif isinstance(arg, type) and issubclass(arg, AbstractConverter):
+                self.converters.append((True, arg().convert)) # type: ignore
+            else:
+                self.converters.append((False, arg))
+
+    def __repr__(self) -> str:
+        return f'<ParameterBinder name={self.name!r} kind={self.kind.name}>'
+
+    def has_default(self) -> bool:
+        """
+        True if the parameter has a default value.
+        """
+        return self.default is not inspect.Parameter.empty
+
+    async def convert(self, request: Request[Any], argument: Any) -> Any:
+        """
+        Converts the value of a path parameter.
+
+        Parameters
+        ----------
+        request: :class:`~subway.request.Request`
+            The request being handled.
+        argument: Any
+            The value of the path parameter.
+        """
+        kind = self.kind
+
+        # Typed path parameters were already converted while matching the route.
+        if kind is ParameterKind.RAW or not isinstance(argument, str):
+            return argument
+
+        if kind is ParameterKind.LITERAL:
+            if argument not in self.literals:
+                if self.has_default():
+                    return self.default
+
+                raise BadLiteralArgument(argument, self.parameter, self.literals)
+
+            return argument
+
+        for is_async, converter in self.converters:
+            if is_async:
+                return await converter(request, argument)
+
+            try:
+                return converter(argument)
+            except ValueError:
+                continue
+
+        if self.has_default():
+            return self.default
+
+        raise FailedConversion(argument, self.parameter)
+
+    async def load(self, request: Request[Any]) -> Any:
+        """
+        Loads the parameter from the JSON body of a request.
+
+        Parameters
+        ----------
+        request: :class:`~subway.request.Request`
+            The request being handled.
+        """
+        try:
+            data = await request.json(check_content_type=True)
+        except AssertionError:
+            if self.has_default():
+                return self.default
+
+            raise
+
+        for model in self.models:
+            try:
+                return model.from_json(data)
+            except (IncompatibleType, MissingField):
+                continue
+
+        if self.has_default():
+            return self.default
+
+        raise BadModelConversion(data, self.parameter, self.models)
+
+class RouteBinder:
+    """
+    Binds the arguments of a route's callback from a request.
+
+    The callback's signature is inspected once, when the binder is created, so that binding
+    the arguments of a request doesn't need any introspection.
+
+    Parameters
+    ----------
+    route: :class:`~subway.objects.Route`
+        The route to bind the arguments of.
+
+    Attributes
+    ----------
+    callback: Callable[..., Coroutine[Any, Any, Any]]
+        The callback the binder was created for.
+    has_parent: :class:`bool`
+        Whether the callback is bound to a view or resource, taking a ``self`` argument.
+    parameters: List[:class:`~.ParameterBinder`]
+        The binders of the parameters passed as keyword arguments.
+    """
+    __slots__ = ('callback', 'has_parent', 'parameters')
+
+    def __init__(self, route: Route) -> None:
+        self.callback = route.callback
+        self.has_parent = bool(route.parent)
+
+        params = iter(route.signature.parameters.values())
+
+        try:
+            next(params)
+        except StopIteration:
+            if not route.parent:
+                raise RuntimeError(f"Route {route!r} missing request argument")
+
+            raise RuntimeError(f"Route {route!r} missing self argument")
+
+        if route.parent:
+            try:
+                next(params)
+            except StopIteration:
+                raise RuntimeError(f"Route {route!r} missing request argument")
+
+        if route.is_websocket():
+            try:
+                next(params)
+            except StopIteration:
+                raise RuntimeError(f"Route {route!r} missing websocket argument")
+
+        self.parameters = [ParameterBinder(parameter) for parameter in params]
+
+    def __repr__(self) -> str:
+        return f'<RouteBinder parameters={self.parameters!r}>'
+
+    def is_valid_for(self, route: Route) -> bool:
+        """
+        True if the binder can still be used for a route, i.e. its callback and parent weren't changed.
+
+        Parameters
+        ----------
+        route: :class:`~subway.objects.Route`
+            The route to check.
+        """
+        return self.callback is route.callback and self.has_parent is bool(route.parent)
+
+    async def bind(self, request: Request[Any], params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Binds the keyword arguments of the callback.
+
+        Parameters
+        ----------
+        request: :class:`~subway.request.Request`
+            The request being handled.
+        params: Dict[:class:`str`, Any]
+            The path parameters the request was matched with.
+        """
+        kwargs: Dict[str, Any] = {}
+
+        for parameter in self.parameters:
+            value: Optional[Any] = params.get(parameter.name)
+
+            if value is not None and value != '':
+                value = await parameter.convert(request, value)
+            else:
+                value = await parameter.load(request)
+
+            kwargs[parameter.name] = value
+
+        return kwargs
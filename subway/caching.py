@@ -0,0 +1,580 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Mapping, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import copy
+import time
+
+from .response import FileResponse, Response, StreamResponse, encode_header_line
+from .headers import Headers
+
+if TYPE_CHECKING:
+    from .objects import Route
+    from .request import Request
+
+__all__ = (
+    'CachePolicy',
+    'EncodedResponse',
+    'CacheEntry',
+    'CachedResponse',
+    'ResponseCacheInfo',
+    'ResponseCache',
+    'Flight',
+    'SingleFlightInfo',
+    'SingleFlight',
+)
+
+# Headers that are specific to a single response and are generated again for every cache hit.
+UNCACHED_HEADERS = frozenset({'Date', 'Connection', 'Age'})
+
+def parse_vary(value: Optional[str]) -> Tuple[str, ...]:
+    return tuple(name.strip() for name in value.split(',')) if value else ()
+
+def is_shareable(response: Response, session_cookie_name: Optional[str] = None) -> bool:
+    """
+    True if a response can be sent to other requests than the one it was created for, i.e. its body is fully known
+    and it doesn't set cookies, other than the default session cookie which is set again for every request.
+
+    Parameters
+    ----------
+    response: :class:`~subway.response.Response`
+        The response.
+    session_cookie_name: Optional[:class:`str`]
+        The name of the default session cookie.
+    """
+    if isinstance(response, (StreamResponse, FileResponse)):
+        return False
+
+    if response.body is not None and not isinstance(response.body, (bytes, bytearray, str)):
+        return False
+
+    return all(name == session_cookie_name for name in response.cookies._cookies)
+
+def copy_exception(exc: BaseException) -> BaseException:
+    """
+    Copies an exception handled by several requests, so that handling it for one of them doesn't affect the others.
+    HTTP exceptions are responses whose headers and cookies are modified while they are sent, so those are copied too.
+
+    Parameters
+    ----------
+    exc: :class:`BaseException`
+        The exception.
+    """
+    try:
+        clone = copy.copy(exc)
+    except Exception:
+        return exc
+
+    if isinstance(clone, Response):
+        clone._headers = Headers(clone._headers)
+        clone.cookies = copy.deepcopy(clone.cookies)
+
+    return clone
+
+class CachePolicy(NamedTuple):
+    """
+    How long the responses of a route are kept in a :class:`ResponseCache`, built from the
+    options given to :func:`~subway.cache_control`.
+
+    Attributes
+    ----------
+    ttl: :class:`float`
+        The amount of seconds a response is fresh for, ``s_maxage`` if given and ``max_age`` otherwise.
+    stale_while_revalidate: :class:`float`
+        The amount of seconds a stale response is still served for while it is refreshed in the background.
+    stale_if_error: :class:`float`
+        The amount of seconds a stale response is still served for if the route fails.
+    shared: :class:`bool`
+        Whether responses to requests with an ``Authorization`` header can be cached.
+    """
+    ttl: float
+    stale_while_revalidate: float
+    stale_if_error: float
+    shared: bool
+
+    @classmethod
+    def from_cache_control(cls, options: Mapping[str, Any]) -> Optional[CachePolicy]:
+        """
+        Creates a policy from the options of :func:`~subway.cache_control`.
+        Returns ``None`` if the responses must not be cached by the server.
+
+        Parameters
+        ----------
+        options: Mapping[:class:`str`, Any]
+            The options, i.e. a route's ``__cache_control__``.
+        """
+        if options.get('no_store') or options.get('no_cache') or options.get('private'):
+            return None
+
+        ttl = options.get('s_maxage')
+        if ttl is None:
+            ttl = options.get('max_age')
+
+        if not ttl or ttl <= 0:
+            return None
+
+        return cls(
+            ttl=ttl,
+            stale_while_revalidate=options.get('stale_while_revalidate') or 0,
+            stale_if_error=options.get('stale_if_error') or 0,
+            shared=bool(options.get('public') or options.get('s_maxage') is not None),
+        )
+
+    def applies_to(self, request: Request[Any]) -> bool:
+        """
+        True if the response to a request can be taken from and stored in the cache.
+
+        Parameters
+        ----------
+        request: :class:`~subway.request.Request`
+            The request.
+        """
+        return self.shared or 'Authorization' not in request.headers
+
+class EncodedResponse:
+    """
+    A response encoded once so that it can be sent to multiple requests.
+
+    Attributes
+    ----------
+    head: :class:`bytes`
+        The encoded status line and headers of the response, without the ones that change with every response.
+    body: :class:`bytes`
+        The encoded body of the response.
+    headers: Dict[:class:`str`, :class:`str`]
+        The headers of the response.
+    version: :class:`str`
+        The HTTP version of the response.
+    size: :class:`int`
+        The amount of bytes of the encoded response.
+    """
+    __slots__ = ('head', 'body', 'headers', 'version', 'size')
+
+    def __init__(self, response: Response) -> None:
+        self.headers = headers = {key: value for key, value in response.headers.items() if key not in UNCACHED_HEADERS}
+        self.version = response.version
+
+        body = response.body
+        if body is None:
+            body = b''
+        elif isinstance(body, str):
+            body = body.encode()
+
+        self.body: bytes = bytes(body) # type: ignore
+        self.head = response._encode_status_line() + b''.join(encode_header_line(key, value) for key, value in headers.items())
+        self.size = len(self.head) + len(self.body)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} size={self.size}>'
+
+class CacheEntry(EncodedResponse):
+    """
+    A response stored in a :class:`ResponseCache`.
+
+    Attributes
+    ----------
+    stored_at: :class:`float`
+        When the response was stored, as per :func:`time.monotonic`.
+    policy: :class:`CachePolicy`
+        The policy the response was stored with.
+    """
+    __slots__ = ('stored_at', 'policy', 'revalidating')
+
+    def __init__(self, response: Response, policy: CachePolicy) -> None:
+        super().__init__(response)
+
+        self.policy = policy
+        self.stored_at = time.monotonic()
+        self.revalidating = False
+
+    def __repr__(self) -> str:
+        return f'<CacheEntry size={self.size} age={self.age()}>'
+
+    def age(self) -> int:
+        """
+        The amount of whole seconds since the response was stored.
+        """
+        return int(time.monotonic() - self.stored_at)
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self.stored_at - self.policy.ttl
+
+    def is_fresh(self) -> bool:
+        """
+        True if the response can be served as is.
+        """
+        return self._elapsed() < 0
+
+    def is_revalidatable(self) -> bool:
+        """
+        True if the response is stale but can still be served while it is refreshed in the background.
+        """
+        return 0 <= self._elapsed() < self.policy.stale_while_revalidate
+
+    def is_usable_on_error(self) -> bool:
+        """
+        True if the response is stale but can still be served if the route fails.
+        """
+        return self._elapsed() < self.policy.stale_if_error
+
+    def is_expired(self) -> bool:
+        """
+        True if the response can't be served anymore.
+        """
+        elapsed = self._elapsed()
+        return elapsed >= self.policy.stale_while_revalidate and elapsed >= self.policy.stale_if_error
+
+class CachedResponse(Response):
+    """
+    A response sent from an :class:`EncodedResponse`.
+
+    Only the headers that change with every response, e.g. ``Date`` and ``Age``, and cookies are encoded,
+    everything else is sent as it was stored.
+
+    Parameters
+    ----------
+    entry: :class:`EncodedResponse`
+        The encoded response to send.
+    age: Optional[:class:`int`]
+        The value of the ``Age`` header, not sent if not given.
+    """
+    def __init__(self, entry: EncodedResponse, *, age: Optional[int] = None) -> None:
+        super().__init__(version=entry.version)
+        self.entry = entry
+
+        if age is not None:
+            self._headers['Age'] = str(age)
+
+    def _encode_status_line(self) -> bytes:
+        return self.entry.head
+
+    async def prepare_buffers(self):
+        return self._prepare_buffers(self.entry.body)
+
+class ResponseCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    entries: int
+
+class ResponseCache:
+    """
+    An in-memory cache of encoded responses, evicting the least recently used ones once the
+    size of the stored responses gets over ``max_size`` bytes.
+
+    Responses are keyed by their request's method, path and query string, as well as the values
+    of the request headers named by the ``Vary`` header of the route's last stored response.
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum amount of bytes stored.
+    """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._vary: Dict[Route, Tuple[str, ...]] = {}
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f'<ResponseCache size={self._size} max_size={self.max_size} entries={len(self._entries)}>'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def info(self) -> ResponseCacheInfo:
+        """
+        Returns statistics about the cache.
+        """
+        return ResponseCacheInfo(self._hits, self._misses, self._size, self.max_size, len(self._entries))
+
+    def _key(self, route: Route, request: Request[Any]) -> Hashable:
+        url = request.url
+        key: Tuple[Any, ...] = (request.method, url.path, url.components.query)
+
+        vary = self._vary.get(route)
+        if vary:
+            headers = request.headers
+            key += tuple(headers.get(name) for name in vary)
+
+        return key
+
+    def get(self, route: Route, request: Request[Any]) -> Optional[CacheEntry]:
+        """
+        Returns the stored response to a request, if any.
+
+        Parameters
+        ----------
+        route: :class:`~subway.objects.Route`
+            The route the request was matched with.
+        request: :class:`~subway.request.Request`
+            The request.
+        """
+        key = self._key(route, request)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.is_expired():
+            self._remove(key)
+            self._misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return entry
+
+    def is_storable(self, response: Response, session_cookie_name: Optional[str] = None) -> bool:
+        """
+        True if a response can be stored.
+
+        Only ``200 OK`` responses whose body is fully known and that don't set cookies,
+        other than the default session cookie which is set again for every hit, can be stored.
+
+        Parameters
+        ----------
+        response: :class:`~subway.response.Response`
+            The response.
+        session_cookie_name: Optional[:class:`str`]
+            The name of the default session cookie.
+        """
+        if response.status != 200 or response.body is None or not is_shareable(response, session_cookie_name):
+            return False
+
+        return response.headers.get('Vary', '').strip() != '*'
+
+    def store(
+        self,
+        route: Route,
+        request: Request[Any],
+        response: Response,
+        policy: CachePolicy
+    ) -> Optional[CacheEntry]:
+        """
+        Stores the response to a request. The response must be storable, see :meth:`is_storable`.
+
+        Parameters
+        ----------
+        route: :class:`~subway.objects.Route`
+            The route the request was matched with.
+        request: :class:`~subway.request.Request`
+            The request.
+        response: :class:`~subway.response.Response`
+            The response.
+        policy: :class:`CachePolicy`
+            How long the response is kept for.
+        """
+        vary = response.headers.get('Vary')
+        self._vary[route] = parse_vary(vary)
+
+        entry = CacheEntry(response, policy)
+        if entry.size > self.max_size:
+            return None
+
+        key = self._key(route, request)
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = entry
+        self._size += entry.size
+
+        while self._size > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+        return entry
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def clear(self) -> None:
+        """
+        Removes every stored response.
+        """
+        self._entries.clear()
+        self._vary.clear()
+        self._size = 0
+
+class Flight:
+    """
+    A single execution of a route, shared by the identical requests received while it is in progress.
+
+    Attributes
+    ----------
+    key: Hashable
+        The key of the requests sharing the execution.
+    waiters: :class:`int`
+        The amount of requests waiting for the execution, besides the one running it.
+    """
+    __slots__ = ('key', 'waiters', '_future')
+
+    def __init__(self, key: Hashable, future: asyncio.Future[Optional[EncodedResponse]]) -> None:
+        self.key = key
+        self.waiters = 0
+        self._future = future
+
+    def __repr__(self) -> str:
+        return f'<Flight key={self.key!r} waiters={self.waiters}>'
+
+    def done(self) -> bool:
+        """
+        True if the execution has finished.
+        """
+        return self._future.done()
+
+    async def wait(self) -> Optional[EncodedResponse]:
+        """
+        Waits for the execution to finish, returning its response or ``None`` if it can't be shared.
+        A copy of the exception raised by the route, if any, is raised.
+        """
+        self.waiters += 1
+
+        try:
+            return await asyncio.shield(self._future)
+        except Exception as exc:
+            # Every request gets its own copy of the exception to handle.
+            raise copy_exception(exc).with_traceback(exc.__traceback__) from None
+
+class SingleFlightInfo(NamedTuple):
+    executions: int
+    coalesced: int
+    in_flight: int
+
+class SingleFlight:
+    """
+    Coalesces identical requests to the routes using :func:`~subway.single_flight`, so that the requests received
+    while the route is already handling an identical one wait for it and are sent its response instead.
+
+    Requests are identical if they have the same method, path, query string and values for the headers named
+    by the route's ``Vary`` header, the ones given to :func:`~subway.single_flight` and :attr:`KEY_HEADERS`.
+
+    Attributes
+    ----------
+    executions: :class:`int`
+        The amount of times a route was executed on behalf of one or more requests.
+    coalesced: :class:`int`
+        The amount of requests that were sent the response of another request.
+    """
+    # The response to a request also depends on these headers, whatever the route does.
+    KEY_HEADERS: Tuple[str, ...] = ('Accept-Encoding', 'If-None-Match', 'If-Modified-Since')
+
+    def __init__(self) -> None:
+        self.executions = 0
+        self.coalesced = 0
+
+        self._flights: Dict[Hashable, Flight] = {}
+        self._vary: Dict[Route, Tuple[str, ...]] = {}
+
+    def __repr__(self) -> str:
+        return f'<SingleFlight executions={self.executions} coalesced={self.coalesced} in_flight={len(self._flights)}>'
+
+    def info(self) -> SingleFlightInfo:
+        """
+        Returns statistics about the coalesced requests.
+        """
+        return SingleFlightInfo(self.executions, self.coalesced, len(self._flights))
+
+    def key(self, route: Route, request: Request[Any], vary: Iterable[str] = ()) -> Hashable:
+        """
+        Returns the key identifying identical requests.
+
+        Parameters
+        ----------
+        route: :class:`~subway.objects.Route`
+            The route the request was matched with.
+        request: :class:`~subway.request.Request`
+            The request.
+        vary: Iterable[:class:`str`]
+            The names of other headers the response depends on.
+        """
+        url = request.url
+        headers = request.headers
+
+        names = (*self.KEY_HEADERS, *vary, *self._vary.get(route, ()))
+        return (route, request.method, url.path, url.components.query, *(headers.get(name) for name in names))
+
+    def get(self, key: Hashable) -> Optional[Flight]:
+        """
+        Returns the execution in progress for a key, if any.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the request.
+        """
+        return self._flights.get(key)
+
+    def begin(self, key: Hashable) -> Flight:
+        """
+        Registers the execution of a route for a key, the requests with the same key
+        received until :meth:`end` is called wait for it.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the request.
+        """
+        loop = asyncio.get_running_loop()
+
+        self._flights[key] = flight = Flight(key, loop.create_future())
+        self.executions += 1
+
+        return flight
+
+    def end(
+        self,
+        flight: Flight,
+        route: Route,
+        response: Optional[Response] = None,
+        *,
+        exc: Optional[BaseException] = None,
+        session_cookie_name: Optional[str] = None
+    ) -> None:
+        """
+        Finishes an execution, passing its response or exception to the waiting requests.
+        If the response can't be shared, e.g. it is streamed, the waiting requests run the route themselves.
+
+        Parameters
+        ----------
+        flight: :class:`Flight`
+            The execution.
+        route: :class:`~subway.objects.Route`
+            The route that was executed.
+        response: Optional[:class:`~subway.response.Response`]
+            The response of the execution.
+        exc: Optional[:class:`BaseException`]
+            The exception raised by the route.
+        session_cookie_name: Optional[:class:`str`]
+            The name of the default session cookie, which is not shared.
+        """
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+
+        future = flight._future
+        if future.done():
+            return
+
+        if response is not None:
+            self._vary[route] = parse_vary(response.headers.get('Vary'))
+
+        if exc is not None:
+            # The request running the route goes on to handle the exception itself, which modifies it.
+            future.set_exception(copy_exception(exc))
+            # Retrieve the exception right away, nothing might be waiting for it.
+            future.exception()
+        elif response is not None and is_shareable(response, session_cookie_name):
+            future.set_result(EncodedResponse(response))
+        else:
+            future.set_result(None)
+            return
+
+        self.coalesced += flight.waiters
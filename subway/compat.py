@@ -6,6 +6,7 @@ import sys
 import functools
 
 PY310 = sys.version_info >= (3, 10)
+PY312 = sys.version_info >= (3, 12)
 
 if TYPE_CHECKING:
     T = TypeVar('T')
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
+import asyncio
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    HAS_BROTLI = False
+else:
+    HAS_BROTLI = True
+
+try:
+    import zstandard
+except ImportError:
+    HAS_ZSTD = False
+else:
+    HAS_ZSTD = True
+
+from .response import Response, StreamResponse, FileResponse
+from .types import ResponseBody
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .request import Request
+
+__all__ = (
+    'Compressor',
+    'Compression',
+    'parse_accept_encoding',
+)
+
+COMPRESSIBLE_CONTENT_TYPES = frozenset({
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'application/xhtml+xml',
+    'application/x-javascript',
+    'application/manifest+json',
+    'image/svg+xml',
+})
+
+MAX_CACHED_NEGOTIATIONS = 256
+
+class Compressor:
+    """
+    Incrementally compresses data using a single content coding.
+
+    Parameters
+    ----------
+    encoding: :class:`str`
+        The content coding, one of ``gzip``, ``deflate``, ``br`` or ``zstd``.
+    level: Optional[:class:`int`]
+        The compression level, the coding's default is used if not given.
+    """
+    __slots__ = ('encoding', '_compress', '_flush', '_finish')
+
+    def __init__(self, encoding: str, level: Optional[int] = None) -> None:
+        self.encoding = encoding
+
+        if encoding == 'gzip' or encoding == 'deflate':
+            wbits = 16 + zlib.MAX_WBITS if encoding == 'gzip' else zlib.MAX_WBITS
+            obj = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, wbits)
+
+            self._compress: Callable[[bytes], bytes] = obj.compress
+            self._flush: Callable[[], bytes] = lambda: obj.flush(zlib.Z_SYNC_FLUSH)
+            self._finish: Callable[[], bytes] = obj.flush
+        elif encoding == 'br' and HAS_BROTLI:
+            obj = brotli.Compressor() if level is None else brotli.Compressor(quality=level)
+
+            self._compress = obj.process
+            self._flush = obj.flush
+            self._finish = obj.finish
+        elif encoding == 'zstd' and HAS_ZSTD:
+            obj = zstandard.ZstdCompressor(**({} if level is None else {'level': level})).compressobj()
+
+            self._compress = obj.compress
+            self._flush = lambda: obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            self._finish = obj.flush
+        else:
+            raise ValueError(f'Unsupported content coding {encoding!r}')
+
+    def __repr__(self) -> str:
+        return f'<Compressor encoding={self.encoding!r}>'
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses a chunk of data, the returned data may be empty if the compressor is buffering it.
+        """
+        return self._compress(data)
+
+    def flush(self) -> bytes:
+        """
+        Returns all the data compressed so far, without ending the stream.
+        """
+        return self._flush()
+
+    def finish(self) -> bytes:
+        """
+        Ends the stream, returning what is left of it.
+        """
+        return self._finish()
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """
+    Parses the value of an ``Accept-Encoding`` header into a mapping of content codings to their weight.
+
+    Parameters
+    ----------
+    value: :class:`str`
+        The value of the header, e.g. ``gzip, deflate;q=0.5, *;q=0``.
+    """
+    encodings: Dict[str, float] = {}
+
+    for item in value.split(','):
+        name, _, params = item.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+
+        weight = 1.0
+        for param in params.split(';'):
+            key, _, val = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    weight = float(val)
+                except ValueError:
+                    weight = 0.0
+
+        encodings[name] = weight
+
+    return encodings
+
+class Compression:
+    """
+    Compresses response bodies using the best content coding accepted by the client.
+
+    ``br`` and ``zstd`` are only available if the ``brotli`` and ``zstandard`` packages are installed.
+    Only bodies with a textual content type are compressed, responses that already have a ``Content-Encoding``,
+    file responses and bodies smaller than ``min_size`` bytes are sent as is.
+
+    Bodies of :class:`~subway.response.StreamResponse`\\s are compressed chunk by chunk as they are produced and sent
+    using chunked transfer encoding, so only a single chunk is held in memory at once.
+    Bodies and chunks of at least ``executor_threshold`` bytes are compressed in ``executor``, so that the event loop
+    isn't blocked while compressing them.
+
+    Parameters
+    ----------
+    encodings: Iterable[:class:`str`]
+        The content codings that can be used, in order of preference.
+    level: Optional[:class:`int`]
+        The compression level passed to every :class:`~.Compressor`.
+    min_size: :class:`int`
+        The minimum size of a body for it to be compressed.
+    executor_threshold: :class:`int`
+        The minimum size of data for it to be compressed outside of the event loop.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The executor used, the event loop's default executor is used if not given.
+
+    Attributes
+    ----------
+    encodings: Tuple[:class:`str`, ...]
+        The content codings that can be used, in order of preference.
+    level: Optional[:class:`int`]
+        The compression level.
+    min_size: :class:`int`
+        The minimum size of a body for it to be compressed.
+    executor_threshold: :class:`int`
+        The minimum size of data for it to be compressed outside of the event loop.
+    """
+    def __init__(
+        self,
+        encodings: Optional[Iterable[str]] = None,
+        *,
+        level: Optional[int] = None,
+        min_size: int = 500,
+        executor_threshold: int = 65536,
+        executor: Optional[Executor] = None
+    ) -> None:
+        if encodings is None:
+            encodings = self.available_encodings()
+
+        self.encodings: Tuple[str, ...] = tuple(encodings)
+        for encoding in self.encodings:
+            if encoding not in self.available_encodings():
+                raise ValueError(f'Unsupported content coding {encoding!r}')
+
+        self.level = level
+        self.min_size = min_size
+        self.executor_threshold = executor_threshold
+        self.executor = executor
+
+        self._negotiated: Dict[str, Optional[str]] = {}
+
+    def __repr__(self) -> str:
+        return f'<Compression encodings={self.encodings!r} min_size={self.min_size}>'
+
+    @staticmethod
+    def available_encodings() -> Tuple[str, ...]:
+        """
+        Returns the content codings supported with the installed packages, in order of preference.
+        """
+        encodings = ['gzip', 'deflate']
+        if HAS_ZSTD:
+            encodings.insert(0, 'zstd')
+        if HAS_BROTLI:
+            encodings.insert(0, 'br')
+
+        return tuple(encodings)
+
+    @staticmethod
+    def is_compressible_type(content_type: Optional[str]) -> bool:
+        """
+        True if a content type is worth compressing, i.e. it is textual.
+
+        Parameters
+        ----------
+        content_type: Optional[:class:`str`]
+            The value of a ``Content-Type`` header.
+        """
+        if not content_type:
+            return False
+
+        mimetype = content_type.partition(';')[0].strip().lower()
+        return (
+            mimetype.startswith('text/')
+            or mimetype in COMPRESSIBLE_CONTENT_TYPES
+            or mimetype.endswith(('+json', '+xml'))
+        )
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """
+        Picks the content coding to use for a request, ``None`` meaning that the body is not compressed.
+
+        Parameters
+        ----------
+        accept_encoding: Optional[:class:`str`]
+            The value of the request's ``Accept-Encoding`` header.
+        """
+        if not accept_encoding:
+            return None
+
+        try:
+            return self._negotiated[accept_encoding]
+        except KeyError:
+            pass
+
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get('*', 0.0)
+
+        encoding: Optional[str] = None
+        best = 0.0
+
+        for candidate in self.encodings:
+            weight = accepted.get(candidate, wildcard)
+            if weight > best:
+                encoding, best = candidate, weight
+
+        # The header values sent by clients are few, so the results are kept around.
+        if len(self._negotiated) < MAX_CACHED_NEGOTIATIONS:
+            self._negotiated[accept_encoding] = encoding
+
+        return encoding
+
+    def create_compressor(self, encoding: str) -> Compressor:
+        """
+        Creates a compressor for a content coding.
+
+        Parameters
+        ----------
+        encoding: :class:`str`
+            The content coding.
+        """
+        return Compressor(encoding, self.level)
+
+    def compress_body(self, encoding: str, body: bytes) -> bytes:
+        """
+        Compresses a whole body.
+
+        Parameters
+        ----------
+        encoding: :class:`str`
+            The content coding.
+        body: :class:`bytes`
+            The body to compress.
+        """
+        compressor = self.create_compressor(encoding)
+        return compressor.compress(body) + compressor.finish()
+
+    async def _run(self, func: Callable[..., bytes], *args: Any) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _compress_stream(
+        self,
+        encoding: str,
+        stream: AsyncIterator[ResponseBody],
+        body: Optional[Any]
+    ) -> AsyncIterator[bytes]:
+        compressor = self.create_compressor(encoding)
+        threshold = self.executor_threshold
+
+        if body:
+            yield compressor.compress(body.encode() if isinstance(body, str) else body)
+
+        async for chunk in stream:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+
+            if not chunk:
+                # An empty chunk asks for whatever is buffered to be flushed, including by the compressor.
+                yield compressor.flush()
+                yield b''
+            elif len(chunk) >= threshold:
+                yield await self._run(compressor.compress, chunk)
+            else:
+                yield compressor.compress(chunk)
+
+        yield compressor.finish()
+
+    def _weaken_etag(self, response: Response) -> None:
+        # A strong entity tag identifies the exact bytes of the uncompressed body,
+        # the compressed one is only semantically equivalent to it.
+        etag = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            response.headers['ETag'] = 'W/' + etag
+
+    def _add_vary(self, response: Response) -> None:
+        vary = response.headers.get('Vary')
+        if not vary:
+            response.headers['Vary'] = 'Accept-Encoding'
+        elif vary.strip() != '*' and 'accept-encoding' not in vary.lower():
+            response.headers['Vary'] = f'{vary}, Accept-Encoding'
+
+    async def compress(self, request: Request[Any], response: Response) -> Response:
+        """
+        Compresses the body of a response if the request allows it.
+        The response is modified in place and returned.
+
+        Parameters
+        ----------
+        request: :class:`~subway.request.Request`
+            The request being responded to.
+        response: :class:`~subway.response.Response`
+            The response to compress.
+        """
+        if isinstance(response, FileResponse) or request.method == 'HEAD':
+            return response
+
+        headers = response.headers
+        if 'Content-Encoding' in headers or response.status < 200 or response.status in (204, 304):
+            return response
+
+        if not self.is_compressible_type(headers.get('Content-Type', response.content_type)):
+            return response
+
+        if isinstance(response, StreamResponse):
+            self._add_vary(response)
+
+            encoding = self.negotiate(request.headers.get('Accept-Encoding'))
+            if encoding is None:
+                return response
+
+            # The iterator now produces the initial data as well.
+            response.stream = self._compress_stream(encoding, response.stream, response.body)
+            response._body = None
+
+            headers.pop('Content-Length', None)
+            headers['Content-Encoding'] = encoding
+            self._weaken_etag(response)
+
+            return response
+
+        body = response.body
+        if body is None or len(body) < self.min_size:
+            return response
+
+        self._add_vary(response)
+
+        encoding = self.negotiate(request.headers.get('Accept-Encoding'))
+        if encoding is None:
+            return response
+
+        data = body.encode() if isinstance(body, str) else bytes(body)
+        if len(data) >= self.executor_threshold:
+            compressed = await self._run(self.compress_body, encoding, data)
+        else:
+            compressed = self.compress_body(encoding, data)
+
+        if len(compressed) >= len(data):
+            return response
+
+        response.body = compressed
+        headers['Content-Encoding'] = encoding
+        self._weaken_etag(response)
+
+        return response
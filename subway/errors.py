@@ -46,4 +46,10 @@ class PartialRead(RailwayException):
         self.length = len(partial)
         self.expected = 'unspecified' if expected is None else str(expected)
 
-        super().__init__(f'Expected a total of {self.expected} bytes, but only got {self.length}')
\ No newline at end of file
+        super().__init__(f'Expected a total of {self.expected} bytes, but only got {self.length}')
+
+class HTTPParserError(RailwayException):
+    """Raised when the data received on a connection is not a valid HTTP request."""
+    def __init__(self, status: int, message: str) -> None:
+        self.status = status
+        super().__init__(message)
\ No newline at end of file
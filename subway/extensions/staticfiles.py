@@ -42,8 +42,10 @@ class StaticFiles:
 
     async def route(self, filename: str, *_: Any) -> FileResponse:
         path = self.directory / filename
-        async with files.open(path) as f:
-            return FileResponse(f)
+        # The response closes the file once it has been sent.
+        file = await files.open(path)
+
+        return FileResponse(file)
 
     def create_route(self, filename: str, app: Application) -> Route:
         callback = functools.partial(self.route, filename)
@@ -197,6 +197,40 @@ class File:
         """
         return await self.run_in_thread('read', n)
 
+    def _pread(self, n: int, offset: int) -> bytes:
+        if isinstance(self.fp, io.BytesIO):
+            with self.fp.getbuffer() as view:
+                return bytes(view[offset:offset + n])
+
+        try:
+            fd = self.fileno()
+        except (OSError, io.UnsupportedOperation):
+            fd = None
+
+        if fd is not None and hasattr(os, 'pread'):
+            return os.pread(fd, n, offset)
+
+        position = self.fp.tell()
+        try:
+            self.fp.seek(offset)
+            return self.fp.read(n)
+        finally:
+            self.fp.seek(position)
+
+    async def pread(self, n: int, offset: int) -> bytes:
+        """
+        Reads from a given position without moving the position of the file,
+        so that concurrent reads of different parts of the same file don't interfere with each other.
+
+        Parameters
+        ----------
+        n: :class:`int`
+            The number of bytes to read.
+        offset: :class:`int`
+            The position to read from.
+        """
+        return await compat.run_in_thread(self._pread, n, offset)
+
     async def readlines(self, hint: Optional[int] = None) -> List[bytes]:
         """
         Reads the file as a list of lines. 
@@ -20,6 +20,14 @@ class Headers(Dict[str, str]):
 
         return None
 
+    @property
+    def transfer_encoding(self) -> Optional[str]:
+        return self.get('Transfer-Encoding')
+
+    @property
+    def connection(self) -> Optional[str]:
+        return self.get('Connection')
+
     @property
     def charset(self) -> Optional[str]:
         content_type = self.content_type
@@ -39,6 +39,9 @@ class HTTPResponse(HTTPConnection):
         self.headers = Headers(headers)
 
         self._body: bytes = b''
+        self._chunked = 'chunked' in (self.headers.transfer_encoding or '').lower()
+        self._body_complete = False
+        self._remaining = 0 if self._chunked else self.headers.content_length or 0
 
     @property
     def hooker(self) -> Hooker:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from enum import Enum
 
-from typing import TYPE_CHECKING, Callable, Generic, List, Any, Literal, Optional, Dict, Union, NoReturn, TypeVar, overload
+from typing import TYPE_CHECKING, Callable, Generic, List, Any, Literal, NamedTuple, Optional, Dict, Tuple, Union, NoReturn, TypeVar, overload
 import inspect
 import re
 
@@ -10,11 +10,13 @@ from .responses import HTTPException
 from .response import Response
 from .request import Request
 from .errors import RegistrationError
+from .binding import RouteBinder
 from . import utils
 
 if TYPE_CHECKING:
     from .router import Router
     from .resources import Resource
+    from .ratelimits import RateLimiter
 
 class MiddlewareType(str, Enum):
     request = 'request'
@@ -29,6 +31,7 @@ __all__ = (
     'WebSocketRoute',
     'Middleware',
     'MiddlewareType',
+    'MiddlewareChain',
     'Listener',
     'route',
     'websocket_route',
@@ -36,6 +39,13 @@ __all__ = (
     'listener',
 )
 
+class MiddlewareChain(NamedTuple):
+    router: Router
+    router_version: int
+    route_version: int
+    request: Tuple[Middleware, ...]
+    response: Tuple[Middleware, ...]
+
 class Object:
     """
     A base object.
@@ -113,6 +123,9 @@ class Route(Object):
         The coroutine function used by the route.
     """
     __cache_control__: Dict[str, Any]
+    __etag__: Dict[str, Any]
+    __single_flight__: Dict[str, Any]
+    __rate_limit__: RateLimiter
 
     def __init__(
         self, 
@@ -126,6 +139,15 @@ class Route(Object):
         if hasattr(callback, '__cache_control__'):
             self.__cache_control__ = callback.__cache_control__
 
+        if hasattr(callback, '__etag__'):
+            self.__etag__ = callback.__etag__
+
+        if hasattr(callback, '__single_flight__'):
+            self.__single_flight__ = callback.__single_flight__
+
+        if hasattr(callback, '__rate_limit__'):
+            self.__rate_limit__ = callback.__rate_limit__
+
         self._router = router
 
         self.path: str = path
@@ -137,6 +159,9 @@ class Route(Object):
         self._request_middlewares: List[Middleware] = []
         self._response_middlewares: List[Middleware] = []
         self._after_request = None
+        self._binder: Optional[RouteBinder] = None
+        self._middlewares_version = 0
+        self._middleware_chain: Optional[MiddlewareChain] = None
 
         self.__doc__ = inspect.getdoc(callback)
         super().__init__(callback)
@@ -175,6 +200,52 @@ class Route(Object):
         """
         return inspect.signature(self.callback)
 
+    @property
+    def binder(self) -> RouteBinder:
+        """
+        The binder of the route's arguments, see :meth:`get_binder`.
+        """
+        return self.get_binder()
+
+    def get_binder(self) -> RouteBinder:
+        """
+        Returns the binder of the route's arguments. It is built the first time it's needed
+        and rebuilt if the callback of the route changes.
+        """
+        binder = self._binder
+        if binder is None or not binder.is_valid_for(self):
+            self._binder = binder = RouteBinder(self)
+
+        return binder
+
+    def get_middleware_chain(self, router: Router) -> MiddlewareChain:
+        """
+        Returns the middlewares to run for this route, the route's own followed by the router's.
+        The chain is built once and only rebuilt after the middlewares of either of them change.
+
+        Parameters
+        ----------
+        router: :class:`~subway.router.Router`
+            The router whose global middlewares are run for this route.
+        """
+        chain = self._middleware_chain
+
+        if (
+            chain is None
+            or chain.router is not router
+            or chain.router_version != router.middlewares_version
+            or chain.route_version != self._middlewares_version
+        ):
+            self._middleware_chain = chain = MiddlewareChain(
+                router=router,
+                router_version=router.middlewares_version,
+                route_version=self._middlewares_version,
+                request=(*self._request_middlewares, *router.request_middlewares),
+                response=(*self._response_middlewares, *router.response_middlewares),
+            )
+
+        return chain
+
     @property
     def request_middlewares(self) -> List[Middleware]:
         """
@@ -232,6 +303,7 @@ class Route(Object):
         """
         self._request_middlewares.clear()
         self._response_middlewares.clear()
+        self._middlewares_version += 1
 
     def add_status_code_handler(
         self, 
@@ -342,6 +414,7 @@ class Route(Object):
 
         middleware = Middleware(MiddlewareType.request, callback, route=self)
         self._request_middlewares.append(middleware)
+        self._middlewares_version += 1
 
         return middleware
 
@@ -355,6 +428,8 @@ class Route(Object):
                 The middleware to remove.
         """
         self._request_middlewares.remove(middleware)
+        self._middlewares_version += 1
+
         return middleware
 
     def request_middleware(self, callback: RequestMiddleware) -> Middleware:
@@ -401,6 +476,7 @@ class Route(Object):
 
         middleware = Middleware(MiddlewareType.response, callback, route=self)
         self._response_middlewares.append(middleware)
+        self._middlewares_version += 1
 
         return middleware
 
@@ -414,6 +490,8 @@ class Route(Object):
             The coroutine function used by the middleware.
         """
         self._response_middlewares.remove(middleware)
+        self._middlewares_version += 1
+
         return middleware
 
     def response_middleware(self, callback: ResponseMiddleware) -> Middleware:
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+from typing import Deque, List, Mapping, NamedTuple, Optional, Tuple
+from collections import deque
+import asyncio
+import enum
+import re
+
+from .headers import Headers
+from .errors import HTTPParserError
+from . import compat
+
+__all__ = (
+    'ParserState',
+    'RequestHead',
+    'RequestParser',
+    'get_body_framing',
+    'parse_chunk_size',
+)
+
+CHUNK_SIZE_REGEX = re.compile(rb'[0-9A-Fa-f]{1,16}')
+
+# Header names that decide where a request's body ends, matched case-insensitively.
+FRAMING_HEADERS = {
+    'content-length': 'Content-Length',
+    'transfer-encoding': 'Transfer-Encoding',
+}
+
+class ParserState(enum.IntEnum):
+    HEAD = 0
+    BODY = 1
+    CHUNK_SIZE = 2
+    CHUNK_DATA = 3
+    CHUNK_END = 4
+    TRAILERS = 5
+    UPGRADED = 6
+    ERROR = 7
+
+class RequestHead(NamedTuple):
+    method: str
+    path: str
+    version: str
+    headers: Headers
+    size: int
+    chunked: bool = False
+    content_length: int = 0
+
+def get_body_framing(headers: Mapping[str, str]) -> Tuple[bool, int]:
+    """
+    Works out how the body of a request is framed from its headers, whatever the case of their names.
+
+    Parameters
+    ----------
+    headers: Mapping[:class:`str`, :class:`str`]
+        The headers of the request.
+
+    Returns
+    -------
+    Tuple[:class:`bool`, :class:`int`]
+        Whether the body is chunked and, if it isn't, its length.
+
+    Raises
+    ------
+    HTTPParserError: If the framing is invalid or ambiguous, e.g. both ``Transfer-Encoding``
+        and ``Content-Length`` are sent, or several different lengths are.
+    """
+    lengths: List[str] = []
+    codings: List[str] = []
+
+    for name, value in headers.items():
+        name = name.lower()
+        if name == 'content-length':
+            lengths.extend(length.strip() for length in value.split(','))
+        elif name == 'transfer-encoding':
+            codings.extend(coding.strip().lower() for coding in value.split(',') if coding.strip())
+
+    if codings:
+        if lengths:
+            raise HTTPParserError(400, 'Both Transfer-Encoding and Content-Length headers were sent')
+
+        # Anything not ending with chunked has no way of telling where the body ends.
+        if codings[-1] != 'chunked':
+            raise HTTPParserError(400, 'Unsupported Transfer-Encoding header')
+
+        return True, 0
+
+    if not lengths:
+        return False, 0
+
+    if len(set(lengths)) > 1:
+        raise HTTPParserError(400, 'Conflicting Content-Length headers')
+
+    length = lengths[0]
+    if not (length.isascii() and length.isdigit()):
+        raise HTTPParserError(400, 'Invalid Content-Length header')
+
+    return False, int(length)
+
+def parse_chunk_size(line: bytes) -> int:
+    """
+    Parses the size of a chunk from its size line, without the terminating CRLF.
+    The size must only be made of hexadecimal digits, optionally followed by chunk extensions, which are ignored.
+
+    Parameters
+    ----------
+    line: :class:`bytes`
+        The size line.
+
+    Raises
+    ------
+    ValueError: If the line is not a valid size line.
+    """
+    if b'\r' in line or b'\n' in line:
+        raise ValueError('Chunk size lines must end with a single CRLF')
+
+    size = line.split(b';', 1)[0]
+    if CHUNK_SIZE_REGEX.fullmatch(size) is None:
+        raise ValueError(f'Invalid chunk size {size!r}')
+
+    return int(size, 16)
+
+class RequestParser:
+    """
+    A push-style HTTP/1.1 request parser.
+
+    Data is fed to the parser as it is received on the connection and it is tokenized in a single pass,
+    keeping track of where every request head ends and how its body is framed (``Content-Length`` or chunked),
+    so that pipelined requests can be parsed ahead without the body ever being copied.
+    The body itself is left to be read off the :class:`~subway.streams.StreamReader`.
+
+    Parameters
+    ----------
+    max_head_size: :class:`int`
+        The maximum size of a request line and its headers.
+    loop: :class:`asyncio.AbstractEventLoop`
+        The event loop used.
+
+    Attributes
+    ----------
+    state: :class:`~.ParserState`
+        The current state of the parser.
+    """
+    def __init__(self, *, max_head_size: int = 65536, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.loop = loop or compat.get_running_loop()
+        self.max_head_size = max_head_size
+        self.state = ParserState.HEAD
+
+        self._head = bytearray()
+        self._scanned = 0
+        self._line = bytearray()
+        self._remaining = 0
+        self._held = bytearray()
+        self._resume_state = ParserState.HEAD
+        self._heads: Deque[RequestHead] = deque()
+        self._error: Optional[HTTPParserError] = None
+        self._waiter: Optional[asyncio.Future[None]] = None
+        self._eof = False
+
+    def __repr__(self) -> str:
+        return f'<RequestParser state={self.state.name}>'
+
+    def _wakeup(self) -> None:
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _fail(self, error: HTTPParserError) -> None:
+        self.state = ParserState.ERROR
+        self._error = error
+
+        self._wakeup()
+
+    def _parse_head(self, data: bytes, pos: int) -> int:
+        head = self._head
+
+        if not head:
+            # Fast path, the whole head was received at once and can be sliced out directly.
+            end = data.find(b'\r\n\r\n', pos)
+            if end != -1 and end + 4 - pos <= self.max_head_size:
+                self._on_head(data[pos:end + 4])
+                return end + 4
+
+        start = len(head)
+
+        head += data[pos:pos + self.max_head_size + 4 - start]
+        end = head.find(b'\r\n\r\n', max(self._scanned - 3, 0))
+
+        if end == -1:
+            self._scanned = len(head)
+            if self._scanned > self.max_head_size:
+                self._fail(HTTPParserError(431, 'Request head is too large'))
+
+            return pos + (len(head) - start)
+
+        end += 4
+        if end > self.max_head_size:
+            self._fail(HTTPParserError(431, 'Request head is too large'))
+            return len(data)
+
+        raw = bytes(head[:end])
+
+        head.clear()
+        self._scanned = 0
+
+        self._on_head(raw)
+        return pos + (end - start)
+
+    def _on_head(self, raw: bytes) -> None:
+        size = len(raw)
+        lines = raw.lstrip(b'\r\n').split(b'\r\n')
+
+        try:
+            method, path, version = lines[0].decode('latin-1').split(' ')
+        except ValueError:
+            return self._fail(HTTPParserError(400, 'Malformed request line'))
+
+        headers = Headers()
+        for line in lines[1:]:
+            if not line:
+                break
+
+            name, _, value = line.partition(b':')
+            if not value:
+                continue
+
+            key = name.decode('latin-1').strip()
+            text = value.decode('latin-1').strip()
+
+            canonical = FRAMING_HEADERS.get(key.lower())
+            if canonical is not None:
+                # Repeated framing headers are all kept, so that conflicting ones can be rejected.
+                key = canonical
+                if key in headers:
+                    text = f'{headers[key]}, {text}'
+
+            headers[key] = text
+
+        try:
+            chunked, length = get_body_framing(headers)
+        except HTTPParserError as exc:
+            return self._fail(exc)
+
+        if chunked:
+            self.state = ParserState.CHUNK_SIZE
+        elif length:
+            self._remaining = length
+            self.state = ParserState.BODY
+
+        if headers.get('Upgrade'):
+            # Whatever comes after this belongs to another protocol, unless the upgrade is refused.
+            self._resume_state = self.state
+            self.state = ParserState.UPGRADED
+
+        self._heads.append(RequestHead(method, path, version, headers, size, chunked, length))
+        self._wakeup()
+
+    def _parse_line(self, data: bytes, pos: int) -> int:
+        end = data.find(b'\n', pos)
+        if end == -1:
+            self._line += data[pos:]
+            if len(self._line) > self.max_head_size:
+                self._fail(HTTPParserError(400, 'Chunk line is too large'))
+
+            return len(data)
+
+        self._line += data[pos:end]
+        line = bytes(self._line)
+        self._line.clear()
+
+        # Lines are only ever ended by CRLF, the body decoder reading them must see the same lines.
+        if not line.endswith(b'\r'):
+            self._fail(HTTPParserError(400, 'Chunk lines must end with CRLF'))
+            return len(data)
+
+        line = line[:-1]
+
+        state = self.state
+        if state is ParserState.CHUNK_SIZE:
+            try:
+                size = parse_chunk_size(line)
+            except ValueError:
+                self._fail(HTTPParserError(400, 'Invalid chunk size'))
+                return len(data)
+
+            if size:
+                self._remaining = size
+                self.state = ParserState.CHUNK_DATA
+            else:
+                self.state = ParserState.TRAILERS
+        elif state is ParserState.CHUNK_END:
+            if line:
+                self._fail(HTTPParserError(400, 'Chunk data is longer than its size'))
+                return len(data)
+
+            self.state = ParserState.CHUNK_SIZE
+        elif not line:
+            # An empty line ends the trailers, and with that the whole request.
+            self.state = ParserState.HEAD
+
+        return end + 1
+
+    def feed_data(self, data: bytes) -> None:
+        """
+        Feeds data received on the connection to the parser.
+
+        Parameters
+        ----------
+        data: :class:`bytes`
+            The data to feed.
+        """
+        pos = 0
+        length = len(data)
+
+        while pos < length:
+            state = self.state
+
+            if state is ParserState.HEAD:
+                pos = self._parse_head(data, pos)
+            elif state is ParserState.BODY or state is ParserState.CHUNK_DATA:
+                size = min(self._remaining, length - pos)
+
+                pos += size
+                self._remaining -= size
+
+                if not self._remaining:
+                    self.state = ParserState.HEAD if state is ParserState.BODY else ParserState.CHUNK_END
+            elif state is ParserState.UPGRADED:
+                self._held += data[pos:]
+                return
+            elif state is ParserState.ERROR:
+                return
+            else:
+                pos = self._parse_line(data, pos)
+
+    def feed_eof(self) -> None:
+        """
+        Signals the parser that no more data will be received.
+        """
+        self._eof = True
+        self._wakeup()
+
+    def resume(self) -> None:
+        """
+        Resumes parsing after an upgrade request was refused.
+        """
+        if self.state is not ParserState.UPGRADED:
+            return
+
+        held = bytes(self._held)
+
+        self._held.clear()
+        self.state = self._resume_state
+
+        self.feed_data(held)
+
+    def at_eof(self) -> bool:
+        """
+        True if there are no more requests to be received.
+        """
+        return self._eof and not self._heads
+
+    async def next_head(self, *, timeout: Optional[float] = None) -> Optional[RequestHead]:
+        """
+        Waits for the next request head to be parsed.
+
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The amount of seconds to wait for.
+
+        Returns
+        -------
+        Optional[:class:`~.RequestHead`]
+            The parsed request head or ``None`` if the connection was closed.
+
+        Raises
+        ------
+        asyncio.TimeoutError: If the timeout expires.
+        HTTPParserError: If the received data is not a valid HTTP request.
+        """
+        while not self._heads:
+            if self._error is not None:
+                raise self._error
+
+            if self._eof:
+                return None
+
+            if self._waiter is not None:
+                raise RuntimeError('Already waiting for a request')
+
+            self._waiter = self.loop.create_future()
+            try:
+                await asyncio.wait_for(self._waiter, timeout)
+            finally:
+                self._waiter = None
+
+        return self._heads.popleft()
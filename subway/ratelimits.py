@@ -0,0 +1,497 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+from collections import OrderedDict
+import contextlib
+import ipaddress
+import math
+import time
+
+if TYPE_CHECKING:
+    from .request import Request
+
+__all__ = (
+    'RateLimitResult',
+    'RateLimitAlgorithm',
+    'TokenBucket',
+    'SlidingWindow',
+    'RateLimitStorage',
+    'MemoryStorage',
+    'RateLimiter',
+    'rate_limit',
+)
+
+State = Tuple[float, ...]
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+class RateLimitResult(NamedTuple):
+    """
+    The outcome of counting a request against a rate limit.
+
+    Attributes
+    ----------
+    allowed: :class:`bool`
+        Whether the request is allowed.
+    limit: :class:`int`
+        The number of requests allowed in a period.
+    remaining: :class:`int`
+        The number of requests still allowed right now.
+    reset: :class:`float`
+        The number of seconds until the quota is fully available again.
+    retry_after: :class:`float`
+        The number of seconds to wait before the request would be allowed, ``0`` if it is.
+    """
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: float
+    retry_after: float
+
+    def to_headers(self) -> Dict[str, str]:
+        """
+        Returns the ``RateLimit-*`` headers describing the result, and ``Retry-After`` if the request isn't allowed.
+        """
+        headers = {
+            'RateLimit-Limit': str(self.limit),
+            'RateLimit-Remaining': str(self.remaining),
+            'RateLimit-Reset': str(math.ceil(self.reset)),
+        }
+
+        if not self.allowed:
+            headers['Retry-After'] = str(max(math.ceil(self.retry_after), 1))
+
+        return headers
+
+class RateLimitAlgorithm(ABC):
+    """
+    An algorithm counting requests against a limit, keeping a fixed size state per key.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The number of requests allowed in a period.
+    period: :class:`float`
+        The length of a period, in seconds.
+    """
+    __slots__ = ('limit', 'period')
+
+    def __init__(self, limit: int, period: float) -> None:
+        if limit <= 0:
+            raise ValueError('limit must be greater than 0')
+
+        if period <= 0:
+            raise ValueError('period must be greater than 0')
+
+        self.limit = limit
+        self.period = period
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} limit={self.limit} period={self.period}>'
+
+    @abstractmethod
+    def hit(self, state: Optional[State], now: float, cost: int = 1) -> Tuple[State, float, RateLimitResult]:
+        """
+        Counts a request.
+
+        Parameters
+        ----------
+        state: Optional[Tuple[:class:`float`, ...]]
+            The state of the key, ``None`` if it has none.
+        now: :class:`float`
+            The current time of a monotonic clock.
+        cost: :class:`int`
+            How many requests the request counts as.
+
+        Returns
+        -------
+        Tuple[Tuple[:class:`float`, ...], :class:`float`, :class:`~.RateLimitResult`]
+            The new state of the key, the time after which it is the same as having no state, and the result.
+        """
+        raise NotImplementedError
+
+class TokenBucket(RateLimitAlgorithm):
+    """
+    A token bucket holding up to ``burst`` tokens, refilled with ``limit`` tokens every ``period`` seconds.
+    A request takes a token and is rejected if there is none left.
+
+    The state of a key is the number of tokens in its bucket and when it was last refilled.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The number of requests allowed in a period.
+    period: :class:`float`
+        The length of a period, in seconds.
+    burst: Optional[:class:`int`]
+        The size of the bucket, defaults to ``limit``.
+    """
+    __slots__ = ('burst', 'rate')
+
+    def __init__(self, limit: int, period: float, *, burst: Optional[int] = None) -> None:
+        super().__init__(limit, period)
+
+        self.burst = limit if burst is None else burst
+        self.rate = limit / period
+
+    def hit(self, state: Optional[State], now: float, cost: int = 1) -> Tuple[State, float, RateLimitResult]:
+        burst, rate = self.burst, self.rate
+
+        if state is None:
+            tokens = float(burst)
+        else:
+            tokens, updated = state
+            tokens = min(burst, tokens + (now - updated) * rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+            retry_after = 0.0
+        else:
+            retry_after = (cost - tokens) / rate
+
+        reset = (burst - tokens) / rate
+        result = RateLimitResult(allowed, burst, int(tokens), reset, retry_after)
+
+        return (tokens, now), now + reset, result
+
+class SlidingWindow(RateLimitAlgorithm):
+    """
+    A sliding window counter, allowing ``limit`` requests in the last ``period`` seconds.
+
+    Instead of keeping the time of every request, the count of the previous fixed window is weighted
+    by how much of it overlaps with the sliding one, so the state of a key is the start of the current window,
+    and the counts of the current and previous windows.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The number of requests allowed in a period.
+    period: :class:`float`
+        The length of a period, in seconds.
+    """
+    __slots__ = ()
+
+    def hit(self, state: Optional[State], now: float, cost: int = 1) -> Tuple[State, float, RateLimitResult]:
+        limit, period = self.limit, self.period
+
+        start = now - now % period
+        current = previous = 0.0
+
+        if state is not None:
+            last_start, last_current, last_previous = state
+
+            if last_start == start:
+                current, previous = last_current, last_previous
+            elif last_start == start - period:
+                previous = last_current
+
+        elapsed = (now - start) / period
+        estimated = previous * (1 - elapsed) + current
+
+        allowed = estimated + cost <= limit
+        if allowed:
+            current += cost
+            estimated += cost
+            retry_after = 0.0
+        elif current + cost <= limit:
+            # Allowed once enough of the previous window has slid out.
+            retry_after = ((1 - (limit - current - cost) / previous) - elapsed) * period
+        else:
+            # Allowed in the next window, once enough of this one has slid out.
+            retry_after = (1 - elapsed) * period
+            if cost <= limit:
+                retry_after += max(1 - (limit - cost) / current, 0) * period
+
+        reset = (1 - elapsed) * period if current or previous else 0.0
+        result = RateLimitResult(allowed, limit, max(int(limit - estimated), 0), reset, retry_after)
+
+        return (start, current, previous), start + 2 * period, result
+
+class RateLimitStorage(ABC):
+    """
+    Stores the state of rate limited keys.
+
+    Access to a key is done under :meth:`lock`, so that a storage shared between processes can make
+    counting a request atomic. States are tuples of floats with a fixed size per algorithm.
+    """
+
+    @abstractmethod
+    def get(self, key: str, now: float) -> Optional[State]:
+        """
+        Returns the state of a key, or ``None`` if it has none or it expired.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key.
+        now: :class:`float`
+            The current time of a monotonic clock.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, state: State, expires_at: float) -> None:
+        """
+        Sets the state of a key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key.
+        state: Tuple[:class:`float`, ...]
+            The new state.
+        expires_at: :class:`float`
+            The time after which the state can be discarded.
+        """
+        raise NotImplementedError
+
+    def lock(self, key: str) -> ContextManager[Any]:
+        """
+        Returns a context manager held while a key is being read and updated.
+        The default one does nothing, which is enough for a storage only used by a single event loop.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key.
+        """
+        return contextlib.nullcontext()
+
+    def clear(self) -> None:
+        """
+        Removes every stored state.
+        """
+
+class MemoryStorage(RateLimitStorage):
+    """
+    Stores states in the memory of the process, so every worker process has its own counts.
+
+    Keys are kept in the order they were last updated, idle keys are evicted from the front as new states
+    are set, and the least recently updated ones are evicted once there are more than ``max_keys`` of them.
+
+    Parameters
+    ----------
+    max_keys: :class:`int`
+        The maximum number of keys kept.
+    """
+    def __init__(self, max_keys: int = 65536) -> None:
+        self.max_keys = max_keys
+        self._states: OrderedDict[str, Tuple[State, float]] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f'<MemoryStorage keys={len(self)} max_keys={self.max_keys}>'
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, key: str, now: float) -> Optional[State]:
+        try:
+            state, expires_at = self._states[key]
+        except KeyError:
+            return None
+
+        if expires_at <= now:
+            return None
+
+        return state
+
+    def set(self, key: str, state: State, expires_at: float) -> None:
+        states = self._states
+
+        states[key] = (state, expires_at)
+        states.move_to_end(key)
+
+        now = time.monotonic()
+        while states:
+            _, (_, oldest) = next(iter(states.items()))
+            if oldest > now and len(states) <= self.max_keys:
+                break
+
+            states.popitem(last=False)
+
+    def clear(self) -> None:
+        self._states.clear()
+
+def peer_host(request: Request[Any]) -> str:
+    """
+    Returns the host of the peer a request was received from, ignoring any header sent with it.
+
+    Parameters
+    ----------
+    request: :class:`~subway.request.Request`
+        The request.
+    """
+    peername = request.writer.get_extra_info('peername')
+    if isinstance(peername, (tuple, list)):
+        return peername[0]
+
+    # Unix sockets have no peer address, all of their requests come from the same local process.
+    return str(peername or '')
+
+class RateLimiter:
+    """
+    Limits the rate of requests per key, by default the client's host.
+
+    Parameters
+    ----------
+    algorithm: :class:`~.RateLimitAlgorithm`
+        The algorithm counting requests.
+    key: Optional[Callable[[:class:`~subway.request.Request`], Optional[:class:`str`]]]
+        A function returning the key a request is counted under, or ``None`` for it to not be limited.
+        Defaults to :meth:`client_host`.
+    storage: Optional[:class:`~.RateLimitStorage`]
+        Where states are stored, defaults to a :class:`~.MemoryStorage`.
+    trusted_proxies: Iterable[:class:`str`]
+        The addresses or networks, e.g. ``10.0.0.0/8``, of the proxies whose ``X-Forwarded-For`` header is trusted.
+
+    Attributes
+    ----------
+    algorithm: :class:`~.RateLimitAlgorithm`
+        The algorithm counting requests.
+    storage: :class:`~.RateLimitStorage`
+        Where states are stored.
+    trusted_proxies: List[Union[:class:`ipaddress.IPv4Network`, :class:`ipaddress.IPv6Network`]]
+        The networks of the trusted proxies.
+    """
+    def __init__(
+        self,
+        algorithm: RateLimitAlgorithm,
+        *,
+        key: Optional[Callable[[Request[Any]], Optional[str]]] = None,
+        storage: Optional[RateLimitStorage] = None,
+        trusted_proxies: Iterable[str] = ()
+    ) -> None:
+        self.algorithm = algorithm
+        self.key = key or self.client_host
+        self.storage = storage if storage is not None else MemoryStorage()
+        self.trusted_proxies: List[Network] = [ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies]
+
+    def __repr__(self) -> str:
+        return f'<RateLimiter algorithm={self.algorithm!r} storage={self.storage!r}>'
+
+    def is_trusted_proxy(self, host: str) -> bool:
+        """
+        True if a host is one of the trusted proxies.
+
+        Parameters
+        ----------
+        host: :class:`str`
+            The host.
+        """
+        if not self.trusted_proxies:
+            return False
+
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+
+        return any(address in network for network in self.trusted_proxies)
+
+    def client_host(self, request: Request[Any]) -> str:
+        """
+        Keys a request by the host of its client.
+
+        This is the address of the connection's peer. If the peer is a trusted proxy, it is the address in
+        ``X-Forwarded-For`` right before the trusted proxies that the request went through.
+        The header is never read otherwise, since clients can send any value in it.
+
+        Parameters
+        ----------
+        request: :class:`~subway.request.Request`
+            The request.
+        """
+        host = peer_host(request)
+        if not self.is_trusted_proxy(host):
+            return host
+
+        forwarded = request.headers.get('X-Forwarded-For')
+        if not forwarded:
+            return host
+
+        # Each proxy appends the address it received the request from, so only the last ones can be trusted.
+        for address in reversed(forwarded.split(',')):
+            host = address.strip()
+            if not self.is_trusted_proxy(host):
+                break
+
+        return host
+
+    def hit(self, request: Request[Any], scope: str = '', cost: int = 1) -> Optional[RateLimitResult]:
+        """
+        Counts a request, returning ``None`` if it isn't limited.
+
+        Parameters
+        ----------
+        request: :class:`~subway.request.Request`
+            The request.
+        scope: :class:`str`
+            Prefixed to the request's key, so that a storage can be shared between limits.
+        cost: :class:`int`
+            How many requests the request counts as.
+        """
+        key = self.key(request)
+        if key is None:
+            return None
+
+        key = f'{scope}|{key}'
+        storage = self.storage
+
+        with storage.lock(key):
+            now = time.monotonic()
+            state, expires_at, result = self.algorithm.hit(storage.get(key, now), now, cost)
+            storage.set(key, state, expires_at)
+
+        return result
+
+def rate_limit(
+    limit: int,
+    period: float,
+    *,
+    algorithm: str = 'token_bucket',
+    burst: Optional[int] = None,
+    key: Optional[Callable[[Request[Any]], Optional[str]]] = None,
+    storage: Optional[RateLimitStorage] = None,
+    trusted_proxies: Iterable[str] = ()
+) -> Callable[..., Any]:
+    """
+    A decorator used to limit the rate of requests to a route, per client by default.
+    Requests over the limit are answered with ``429 Too Many Requests`` and a ``Retry-After`` header,
+    and ``RateLimit-*`` headers are added to the route's responses.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        The number of requests allowed in a period.
+    period: :class:`float`
+        The length of a period, in seconds.
+    algorithm: :class:`str`
+        Either ``token_bucket`` or ``sliding_window``, see :class:`~.TokenBucket` and :class:`~.SlidingWindow`.
+    burst: Optional[:class:`int`]
+        The size of the bucket of the ``token_bucket`` algorithm.
+    key: Optional[Callable[[:class:`~subway.request.Request`], Optional[:class:`str`]]]
+        A function returning the key a request is counted under, see :class:`~.RateLimiter`.
+    storage: Optional[:class:`~.RateLimitStorage`]
+        Where states are stored, defaults to a :class:`~.MemoryStorage`.
+    trusted_proxies: Iterable[:class:`str`]
+        The addresses or networks of the proxies whose ``X-Forwarded-For`` header is trusted, see :class:`~.RateLimiter`.
+    """
+    impl: RateLimitAlgorithm
+    if algorithm == 'token_bucket':
+        impl = TokenBucket(limit, period, burst=burst)
+    elif algorithm == 'sliding_window':
+        if burst is not None:
+            raise TypeError('burst is only supported by the token_bucket algorithm')
+
+        impl = SlidingWindow(limit, period)
+    else:
+        raise ValueError(f'Unknown rate limit algorithm {algorithm!r}')
+
+    limiter = RateLimiter(impl, key=key, storage=storage, trusted_proxies=trusted_proxies)
+
+    def decorator(obj: Any) -> Any:
+        obj.__rate_limit__ = limiter
+        return obj
+
+    return decorator
@@ -11,13 +11,13 @@ from urllib.parse import parse_qsl
 from subway.multidict import ImmutableMultiDict
 
 from .errors import PartialRead
+from .parser import get_body_framing, parse_chunk_size
 from .url import URL
 from .headers import Headers
 from .response import Response
 from .cookies import Cookie, CookieJar
 from .sessions import CookieSession, AbstractRequestSession
-from .responses import HTTPException, Redirection, SwitchingProtocols, redirects, responses
-from .response import StreamResponse
+from .responses import BadRequest, HTTPException, Redirection, SwitchingProtocols, redirects, responses
 from .formdata import FormData
 from .streams import StreamReader, StreamWriter
 from .types import ResponseBody, ResponseStatus, RouteResponse, StrURL, Address
@@ -25,7 +25,9 @@ from .utils import to_url, GUID, CLRF, parse_headers, loads
 
 if TYPE_CHECKING:
     from .objects import Route, WebSocketRoute
-    from .workers import Worker
+    from .ratelimits import RateLimitResult
+    from .workers import Worker, ResponseSlot
+    from .parser import RequestHead
     from .app import Application
 
     SessionT = TypeVar('SessionT', bound=AbstractRequestSession)
@@ -39,33 +41,126 @@ __all__ = (
 
 class HTTPConnection(ABC):
     _body: bytes
+    _remaining: int
+    _chunked: bool
+    _body_complete: bool
     headers: Headers
 
+    def _invalid_chunk(self, message: str) -> BadRequest:
+        # The end of the body is unknown, so the connection can't be used for another request.
+        self._remaining = -1
+        return BadRequest(message, headers={'Connection': 'close'})
+
+    async def _stream_chunked(self, timeout: Optional[float]) -> AsyncIterator[bytes]:
+        reader = self.get_reader()
+
+        # A negative amount of remaining bytes marks a body that could not be decoded.
+        while not self._body_complete and self._remaining >= 0:
+            try:
+                if not self._remaining:
+                    line = await reader.readuntil(CLRF, timeout=timeout)
+
+                    try:
+                        size = parse_chunk_size(line)
+                    except ValueError:
+                        raise self._invalid_chunk('Invalid chunk size') from None
+
+                    if not size:
+                        # Trailer fields are not exposed, they are skipped up to the terminating empty line.
+                        while True:
+                            line = await reader.readuntil(CLRF, timeout=timeout)
+                            if b'\n' in line:
+                                raise self._invalid_chunk('Trailer lines must end with CRLF')
+
+                            if not line:
+                                break
+
+                        self._body_complete = True
+                        return
+
+                    self._remaining = size
+
+                chunk = await reader.read(min(self._remaining, 65536), timeout=timeout)
+                self._remaining -= len(chunk)
+
+                if not self._remaining and await reader.readuntil(CLRF, timeout=timeout):
+                    raise self._invalid_chunk('Chunk data is longer than its size')
+            except asyncio.TimeoutError:
+                return
+            except PartialRead:
+                self._remaining = -1
+                return
+
+            yield chunk
+
     async def stream(self, *, timeout: Optional[float] = None) -> AsyncIterator[bytes]:
         """
         The body of the request as a stream.
+        Only the bytes announced by the ``Content-Length`` header are read, 
+        so the reader is left at the start of the next request on the connection.
+
+        Bodies sent using chunked transfer encoding are decoded as they are received,
+        yielding the data of every chunk without buffering the whole body.
 
         Parameters
         ----------
         timeout: Optional[:class:`float`]
             The timeout to use.
+
+        Raises
+        ------
+        BadRequest: If the chunked body is malformed.
         """
-        if not self.headers.content_length:
+        if self._chunked:
+            async for chunk in self._stream_chunked(timeout):
+                yield chunk
+
+            return
+
+        if not self._content_length:
             yield b''
             return
 
         reader = self.get_reader()
-        while not reader.at_eof():
+        while self._remaining > 0:
             try:
-                chunk = await reader.read(65536, timeout=timeout)
+                chunk = await reader.read(min(self._remaining, 65536), timeout=timeout)
             except asyncio.TimeoutError:
                 break
             except PartialRead as e:
                 chunk = e.partial
+                self._remaining = 0
             
+            self._remaining -= len(chunk)
             yield chunk
 
-        yield reader.reset()
+    async def discard(self, *, timeout: Optional[float] = None) -> None:
+        """
+        Reads and throws away the part of the body that was not consumed by the route.
+        This is required before another request can be read off the same connection.
+
+        Parameters
+        ----------
+        timeout: Optional[:class:`float`]
+            The timeout to use.
+        """
+        async for _ in self.stream(timeout=timeout):
+            pass
+
+    def has_body(self) -> bool:
+        """
+        True if the request carries a body.
+        """
+        return self._chunked or self._content_length > 0
+
+    def is_body_consumed(self) -> bool:
+        """
+        True if the whole body of the request has been read off the connection.
+        """
+        if self._chunked:
+            return self._body_complete
+
+        return self._remaining <= 0
 
     async def read(self, *, timeout: Optional[float] = None) -> bytes:
         """
@@ -81,9 +176,11 @@ class HTTPConnection(ABC):
         :class:`bytes`
             The body of the request as bytes.
         """
+        chunks = [self._body]
         async for chunk in self.stream(timeout=timeout):
-            self._body += chunk
+            chunks.append(chunk)
 
+        self._body = b''.join(chunks)
         return self._body
 
     async def text(self, *, encoding: Optional[str] = None, timeout: Optional[float] = None) -> str:
@@ -159,6 +256,8 @@ class Request(Generic[AppT], HTTPConnection):
         The route that the request was sent to.
     worker: 
         The worker that the request was sent to.
+    keep_alive: :class:`bool`
+        Whether the connection should be kept open after the response has been sent.
     """
     def __init__(
         self,
@@ -170,7 +269,10 @@ class Request(Generic[AppT], HTTPConnection):
         reader: StreamReader,
         writer: StreamWriter,
         worker: Worker,
-        created_at: datetime.datetime
+        created_at: datetime.datetime,
+        *,
+        chunked: bool = False,
+        content_length: int = 0
     ):
         self._encoding = "utf-8"
         self._app = app
@@ -185,7 +287,17 @@ class Request(Generic[AppT], HTTPConnection):
         self.route: Optional[Union[Route, WebSocketRoute]] = None
         self.created_at: datetime.datetime = created_at
 
+        self._chunked = chunked
+        self._content_length = content_length
+        self._body_complete = False
+        self._remaining = content_length
         self._closed = False
+        self._responded = False
+        self._slot: Optional[ResponseSlot] = None
+        self._etag: Optional[str] = None
+        self._rate_limit: Optional[RateLimitResult] = None
+
+        self.keep_alive: bool = self.should_keep_alive()
 
     async def send(
         self,
@@ -211,12 +323,38 @@ class Request(Generic[AppT], HTTPConnection):
             if not isinstance(response, Response):
                 raise ValueError('When convert is passed in as False, response must be a Response object')
 
-        data = await response.prepare()
-        await self.writer.write(data, drain=True)
+        connection = response.headers.get('Connection')
+        if connection is None:
+            response.headers['Connection'] = 'keep-alive' if self.keep_alive else 'close'
+        elif connection.lower() == 'close':
+            self.keep_alive = False
 
-        if isinstance(response, StreamResponse):
-            async for chunk in response:
-                await self.writer.write(chunk, drain=True)
+        self._responded = True
+
+        # Subclasses that customize prepare() are sent through it, it returns the whole response.
+        streamed = type(response).prepare is Response.prepare
+        if streamed:
+            buffers = await response.prepare_buffers()
+        else:
+            buffers = [await response.prepare()]
+
+        if self._slot is not None:
+            # Pipelined requests must be answered in the order they were received.
+            if not await self._slot.wait():
+                return
+
+        await self.writer.writelines(buffers, drain=True)
+
+        try:
+            if streamed:
+                await response.write_body(self.writer)
+        except BaseException:
+            # The response is cut short, the connection can't be used for anything else.
+            self.keep_alive = False
+            raise
+
+        if self._slot is not None:
+            self._slot.release(keep_alive=self.keep_alive)
 
         # self.writer.write_eof()
 
@@ -225,6 +363,8 @@ class Request(Generic[AppT], HTTPConnection):
         Closes the connection.
         """
         if not self.is_closed():
+            self._closed = True
+
             self.writer.close()
             await self.writer.wait_closed()
 
@@ -266,6 +406,20 @@ class Request(Generic[AppT], HTTPConnection):
         """
         return self._closed
 
+    def is_responded(self) -> bool:
+        """
+        True if a response has been sent for this request.
+        """
+        return self._responded
+
+    def should_keep_alive(self) -> bool:
+        """
+        Whether the client asked for the connection to be kept open after this request.
+        Only HTTP/1.1 is served, its connections are persistent unless ``Connection: close`` is sent.
+        """
+        connection = (self.headers.connection or '').lower()
+        return 'close' not in connection
+
     def is_websocket(self) -> bool:
         """
         True if the request is a websocket request.
@@ -576,6 +730,7 @@ class Request(Generic[AppT], HTTPConnection):
 
         hdrs = await reader.readuntil(CLRF * 2)
         headers = Headers(parse_headers(hdrs))
+        chunked, content_length = get_body_framing(headers)
 
         return cls(
             method=method,
@@ -586,7 +741,32 @@ class Request(Generic[AppT], HTTPConnection):
             reader=reader,
             writer=writer,
             worker=worker,
-            created_at=created_at
+            created_at=created_at,
+            chunked=chunked,
+            content_length=content_length
+        )
+
+    @classmethod
+    def from_head(
+        cls,
+        head: RequestHead,
+        reader: StreamReader,
+        writer: StreamWriter,
+        worker: Worker,
+        created_at: datetime.datetime
+    ) -> Request[Application]:
+        return cls(
+            method=head.method,
+            url=head.path,
+            version=head.version,
+            headers=head.headers,
+            app=worker.app,
+            reader=reader,
+            writer=writer,
+            worker=worker,
+            created_at=created_at,
+            chunked=head.chunked,
+            content_length=head.content_length
         )
 
     def __repr__(self) -> str:
@@ -1,26 +1,38 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, overload, AsyncIterator
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, overload, AsyncIterator
+from email.utils import formatdate
+import asyncio
+import dataclasses
+import secrets
 import enum
 import mimetypes
+import os
+import io
+import stat
 
 from .cookies import Cookie, CookieJar
 from .files import File
 from .headers import Headers
 from .multidict import MultiDict
-from .types import AnyBody, JSONResponseBody, ResponseBody, ResponseHeaders, ResponseStatus
-from .utils import CLRF, dumps
+from .models import Model
+from .types import AnyBody, BytesLike, JSONResponseBody, ResponseBody, ResponseHeaders, ResponseStatus
+from .utils import CLRF, dumps_bytes, etag_matches, file_etag, parse_range
 
 if TYPE_CHECKING:
     from .objects import Route
+    from .streams import StreamWriter
 
 __all__ = (
     'Response',
     'HTTPStatus',
     'HTMLResponse',
     'JSONResponse',
+    'StreamResponse',
     'FileResponse',
     'cache_control',
+    'etag',
+    'single_flight',
 )
 
 class HTTPStatus(enum.IntEnum):
@@ -106,6 +118,84 @@ class HTTPStatus(enum.IntEnum):
     NOT_EXTENDED = 510, 'Not Extended'
     NETWORK_AUTHENTICATION_REQUIRED = 511, 'Network Authentication Required'
 
+# The status line of every known status for the versions responses are sent with.
+STATUS_LINES: Dict[Tuple[str, int], bytes] = {
+    (version, status.value): f'HTTP/{version} {status.value} {status.description}\r\n'.encode()
+    for version in ('1.1', '1.0') for status in HTTPStatus
+}
+
+# Headers whose values come from a small set, their encoded lines are cached instead of being encoded every time.
+CACHED_HEADERS = frozenset((
+    'Server', 'Content-Type', 'Connection', 'Accept-Ranges', 'Transfer-Encoding', 'Cache-Control', 'Vary',
+))
+MAX_CACHED_HEADER_LINES = 1024
+# Bodies at least this large are handed to the transport as a separate buffer instead of being copied after the head.
+VECTORED_WRITE_THRESHOLD = 16384
+HEADER_LINES: Dict[Tuple[str, str], bytes] = {}
+
+def encode_header_line(key: str, value: str) -> bytes:
+    """
+    Encodes a header line, using the cached encoding of the line for :data:`CACHED_HEADERS`.
+
+    Parameters
+    ----------
+    key: :class:`str`
+        The name of the header.
+    value: :class:`str`
+        The value of the header.
+    """
+    if key not in CACHED_HEADERS:
+        return f'{key}: {value}\r\n'.encode()
+
+    line = HEADER_LINES.get((key, value))
+    if line is None:
+        line = f'{key}: {value}\r\n'.encode()
+        if len(HEADER_LINES) < MAX_CACHED_HEADER_LINES:
+            HEADER_LINES[(key, value)] = line
+
+    return line
+
+def get_body_length(body: Union[str, bytes, bytearray]) -> int:
+    """
+    Returns the length of a body once it is encoded, ``str`` bodies being sent UTF-8 encoded.
+
+    Parameters
+    ----------
+    body: Union[:class:`str`, :class:`bytes`, :class:`bytearray`]
+        The body.
+    """
+    if isinstance(body, str) and not body.isascii():
+        return len(body.encode())
+
+    return len(body)
+
+class BodyBuffer:
+    """
+    Collects the data written by :meth:`Response.write_body` in memory, standing in for a
+    :class:`~subway.streams.StreamWriter`.
+
+    Attributes
+    ----------
+    data: :class:`bytearray`
+        The data written so far.
+    """
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    async def _drain(self) -> None:
+        return None
+
+    def write(self, data: BytesLike, *, drain: bool = False) -> Any:
+        self.data += data
+        if drain:
+            return self._drain()
+
+    def writelines(self, data: List[BytesLike], *, drain: bool = False) -> Any:
+        for buffer in data:
+            self.data += buffer
+
+        if drain:
+            return self._drain()
 
 class Response:
     """
@@ -152,7 +242,7 @@ class Response:
 
         if body is not None:
             self._headers['Content-Type'] = self._content_type
-            self._headers['Content-Length'] = str(len(body))
+            self._headers['Content-Length'] = str(get_body_length(body))
 
         self.cookies = CookieJar()
 
@@ -168,7 +258,7 @@ class Response:
         self._body = value
 
         self._headers['Content-Type'] = self.content_type
-        self._headers['Content-Length'] = str(len(value))
+        self._headers['Content-Length'] = str(get_body_length(value))
 
     @property
     def status(self) -> HTTPStatus:
@@ -227,36 +317,114 @@ class Response:
         name = self.__class__.__name__
         return f'<{name} status={self.status} content_type={self.content_type!r} version={self.version!r}>'
 
-    def _prepare(self, body: Any) -> bytes:
-        response = [f'HTTP/{self.version} {self.status} {self.status.description}']
+    def _encode_status_line(self) -> bytes:
+        status = self._status
+
+        line = STATUS_LINES.get((self.version, status))
+        if line is None:
+            line = f'HTTP/{self.version} {status.value} {status.description}\r\n'.encode()
+
+        return line
+
+    def _prepare_buffers(self, body: Any) -> List[BytesLike]:
+        response = bytearray(self._encode_status_line())
+
+        for key, value in self._headers.items():
+            response += encode_header_line(key, value)
 
-        response.extend(f'{k}: {v}' for k, v in self._headers.items())
         if self.cookies:
-            response.append(self.cookies.encode())
+            response += self.cookies.encode().encode()
+            response += CLRF
 
-        response = CLRF.join(part.encode() for part in response)
-        response += CLRF * 2
+        response += CLRF
 
-        if body is not None:
-            if not isinstance(body, (bytes, bytearray, str)):
-                raise TypeError(f'body must be bytes, bytearray or str, not {type(body)}')
+        if body is None:
+            return [response]
+
+        if isinstance(body, str):
+            body = body.encode()
+        elif not isinstance(body, (bytes, bytearray)):
+            raise TypeError(f'body must be bytes, bytearray or str, not {type(body)}')
 
-            if isinstance(body, str):
-                body = body.encode()
-            elif isinstance(body, bytearray):
-                body = bytes(body)
+        if len(body) >= VECTORED_WRITE_THRESHOLD:
+            return [response, memoryview(body)]
 
-            response += body
+        response += body
+        return [response]
 
-        return response
+    def _prepare(self, body: Any) -> bytes:
+        return b''.join(self._prepare_buffers(body))
+
+    async def prepare_buffers(self) -> List[BytesLike]:
+        """
+        Encodes the response into a list of buffers to be written in order.
+        Large bodies are kept in their own buffer so that they don't have to be copied after the headers.
+        """
+        return self._prepare_buffers(self.body)
 
     async def prepare(self) -> bytes:
         """
-        Encodes the response into a sendable bytes object.
+        Encodes the whole response, body included, into a sendable bytes object.
+
+        The part of the body written by :meth:`write_body`, e.g. a stream or a file, is read into memory.
+        Use :meth:`prepare_buffers` followed by :meth:`write_body` to send a response without buffering it.
         """
-        return self._prepare(self.body)
+        buffers = await self.prepare_buffers()
+
+        body = BodyBuffer()
+        await self.write_body(body) # type: ignore
+
+        buffers.append(body.data)
+        return b''.join(buffers)
+
+    async def write_body(self, writer: StreamWriter) -> None:
+        """
+        Writes the part of the body that is not included in the buffers returned by :meth:`prepare_buffers`.
+        Nothing is written by default.
+
+        Parameters
+        ----------
+        writer: :class:`~subway.streams.StreamWriter`
+            The writer to write to.
+        """
+        return None
 
 class StreamResponse(Response):
+    """
+    A class used to build a response whose body is produced by an asynchronous iterator.
+
+    Unless a ``Content-Length`` header is given, the body is sent using chunked transfer encoding
+    so that the connection can be kept alive after it. Small chunks are coalesced until at least ``buffer_size``
+    bytes are buffered before being written, yielding an empty chunk flushes whatever is buffered.
+
+    Parameters
+    ----------
+    stream: AsyncIterator[Union[:class:`str`, :class:`bytes`]]
+        The iterator producing the body.
+    body: Optional[Union[:class:`str`, :class:`bytes`]]
+        Data sent before the iterator's.
+    status: :class:`int`
+        The status code of the response.
+    content_type: :class:`str`
+        The content type of the response.
+    headers: :class:`dict`
+        The headers of the response.
+    version: :class:`str`
+        The HTTP version of the response.
+    buffer_size: :class:`int`
+        The minimum size of a written chunk, ``0`` writes every chunk as soon as it is produced.
+    trailers: Optional[Iterable[:class:`str`]]
+        The names of the trailer fields sent after a chunked body, see :meth:`set_trailer`.
+
+    Attributes
+    ----------
+    stream: AsyncIterator[Union[:class:`str`, :class:`bytes`]]
+        The iterator producing the body.
+    buffer_size: :class:`int`
+        The minimum size of a written chunk.
+    trailers: List[:class:`str`]
+        The names of the declared trailer fields.
+    """
     def __init__(
         self,
         stream: AsyncIterator[ResponseBody],
@@ -265,10 +433,20 @@ class StreamResponse(Response):
         status: Optional[ResponseStatus] = None, 
         content_type: Optional[str] = None, 
         headers: Optional[ResponseHeaders] = None, 
-        version: Optional[str] = None
+        version: Optional[str] = None,
+        buffer_size: int = 8192,
+        trailers: Optional[Iterable[str]] = None
     ):
         super().__init__(body=body, status=status, content_type=content_type, headers=headers, version=version)
         self.stream = stream
+        self.buffer_size = buffer_size
+        self.trailers: List[str] = list(trailers or ())
+
+        self._trailer_values: Dict[str, str] = {}
+
+        if body is not None and not (headers and 'Content-Length' in headers):
+            # The length of the initial data says nothing about the length of the whole body.
+            self._headers.pop('Content-Length', None)
 
     def __aiter__(self):
         return self
@@ -280,6 +458,92 @@ class StreamResponse(Response):
 
         return chunk
 
+    def is_chunked(self) -> bool:
+        """
+        True if the body is sent using chunked transfer encoding.
+        """
+        return 'Content-Length' not in self._headers
+
+    def set_trailer(self, name: str, value: str) -> None:
+        """
+        Sets the value of a trailer field, sent once the whole body has been sent.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the trailer field, it must have been declared in the constructor.
+        value: :class:`str`
+            The value of the trailer field.
+
+        Raises
+        ------
+        ValueError: If the trailer field was not declared.
+        """
+        if name.lower() not in (trailer.lower() for trailer in self.trailers):
+            raise ValueError(f'Trailer {name!r} was not declared')
+
+        self._trailer_values[name] = value
+
+    @staticmethod
+    def _encode_chunk(chunk: Any) -> bytes:
+        return b'%x\r\n%s\r\n' % (len(chunk), chunk)
+
+    async def prepare_buffers(self) -> List[BytesLike]:
+        """
+        Encodes the response's status line and headers.
+        The body is written by :meth:`write_body`.
+        """
+        if not self.is_chunked():
+            return self._prepare_buffers(self.body)
+
+        self._headers['Transfer-Encoding'] = 'chunked'
+        if self.trailers:
+            self._headers['Trailer'] = ', '.join(self.trailers)
+
+        return self._prepare_buffers(None)
+
+    async def write_body(self, writer: StreamWriter) -> None:
+        """
+        Writes the body produced by the iterator.
+
+        Parameters
+        ----------
+        writer: :class:`~subway.streams.StreamWriter`
+            The writer to write to.
+        """
+        if not self.is_chunked():
+            async for chunk in self:
+                await writer.write(chunk, drain=True)
+
+            return
+
+        buffer = bytearray()
+        body = self.body
+
+        if body:
+            buffer += body.encode() if isinstance(body, str) else body
+
+        async for chunk in self:
+            if not buffer and len(chunk) >= self.buffer_size:
+                # Big enough on its own, no need to copy it into the buffer.
+                if chunk:
+                    await writer.writelines([b'%x\r\n' % len(chunk), chunk, CLRF], drain=True)
+
+                continue
+
+            buffer += chunk
+            if buffer and (not chunk or len(buffer) >= self.buffer_size):
+                await writer.write(self._encode_chunk(buffer), drain=True)
+                buffer = bytearray()
+
+        tail = [self._encode_chunk(buffer)] if buffer else []
+        tail.append(b'0\r\n')
+
+        tail.extend(f'{name}: {value}\r\n'.encode() for name, value in self._trailer_values.items())
+        tail.append(CLRF)
+
+        await writer.write(b''.join(tail), drain=True)
+
 class HTMLResponse(Response):
     """
     A class used to build an HTML response
@@ -302,6 +566,21 @@ class HTMLResponse(Response):
 class JSONResponse(Response):
     """
     A class used to build a JSON response
+
+    The body is serialized once, straight to UTF-8 encoded bytes (using ``orjson`` when it is installed).
+    Besides the types natively supported, :class:`~subway.multidict.MultiDict`\\s, :class:`~subway.models.Model`\\s,
+    dataclasses and objects with a ``__dict__`` are serialized through :meth:`default_json_dump`.
+
+    Parameters
+    ----------
+    body: Any
+        The object to serialize.
+    status: :class:`int`
+        The status code of the response.
+    headers: :class:`dict`
+        The headers of the response.
+    version: :class:`str`
+        The HTTP version of the response.
     """
     def __init__(
         self,
@@ -310,12 +589,8 @@ class JSONResponse(Response):
         headers: Optional[ResponseHeaders] = None,
         version: Optional[str] = None
     ) -> None:
-
-        if body is not None:
-            body = dumps(body, default=self.default_json_dump) # type: ignore
-
         super().__init__(
-            body=dumps(body) if body is not None else None,
+            body=dumps_bytes(body, default=self.default_json_dump) if body is not None else None,
             status=status,
             content_type='application/json',
             headers=headers,
@@ -323,14 +598,48 @@ class JSONResponse(Response):
         )
 
     def default_json_dump(self, obj: Any) -> Any:
+        """
+        Converts an object that can't be serialized as is to something that can.
+
+        Parameters
+        ----------
+        obj: Any
+            The object to convert.
+
+        Raises
+        ------
+        TypeError: If the object can't be converted.
+        """
         if isinstance(obj, MultiDict):
             return obj._dict
-        return obj.__dict__
+
+        if isinstance(obj, Model):
+            return obj.json()
+
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return dataclasses.asdict(obj)
+
+        try:
+            return obj.__dict__
+        except AttributeError:
+            raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable') from None
 
 class FileResponse(Response):
     """
     A class used to build a file response
 
+    Files on disk are not read into memory, the headers are written first and the file is then sent
+    with :meth:`asyncio.loop.sendfile` (``os.sendfile``) straight from the file descriptor to the socket.
+    When that's not possible, e.g. over TLS, the file is sent in chunks read in a thread.
+    The file is closed once it has been sent.
+
+    Range requests are supported, see :meth:`set_range`. A single range is answered with a
+    ``206 Partial Content`` response, multiple ranges with a ``multipart/byteranges`` body and ranges that
+    can't be satisfied with a ``416 Range Not Satisfiable`` response.
+
+    For files on disk, the ``Last-Modified`` and ``ETag`` headers are derived from the file's modification time
+    and size, without reading it, letting the application answer conditional requests with ``304 Not Modified``.
+
     Parameters
     ----------
     file: :class:`~subway.file.File`
@@ -341,15 +650,33 @@ class FileResponse(Response):
         The headers of the response.
     version: :class:`str`
         The HTTP version of the response.
+    use_sendfile: :class:`bool`
+        Whether to use ``sendfile`` when possible.
+    chunk_size: :class:`int`
+        The size of the chunks read when ``sendfile`` can't be used.
     """
     def __init__(
         self,
         file: File,
         status: Optional[ResponseStatus] = None,
         headers: Optional[ResponseHeaders] = None,
-        version: Optional[str] = None
+        version: Optional[str] = None,
+        *,
+        use_sendfile: bool = True,
+        chunk_size: int = 65536
     ) -> None:
         self.file = file
+        self.use_sendfile = use_sendfile
+        self.chunk_size = chunk_size
+
+        self._offset = 0
+        self._size = 0
+        self._data: Optional[bytes] = None
+        self._parts: Optional[List[Tuple[bytes, int, int]]] = None
+        self._closing_delimiter = b''
+        self._range: Optional[str] = None
+        self._if_range: Optional[str] = None
+        self._last_modified: Optional[str] = None
 
         super().__init__(
             status=status,
@@ -358,6 +685,13 @@ class FileResponse(Response):
             version=version
         )
 
+        self._stat_result = result = self._stat()
+        if result is not None:
+            self._last_modified = formatdate(result.st_mtime, usegmt=True)
+
+            self._headers.setdefault('Last-Modified', self._last_modified)
+            self._headers.setdefault('ETag', file_etag(result))
+
     def get_content_type(self) -> str:
         """
         Gets the content type of the response. 
@@ -374,15 +708,187 @@ class FileResponse(Response):
 
         return content_type
 
-    async def prepare(self):
+    def _stat(self) -> Optional[os.stat_result]:
+        try:
+            result = os.fstat(self.file.fileno())
+        except (OSError, io.UnsupportedOperation):
+            return None
+
+        # Only regular files have a known size and can be sent with sendfile.
+        return result if stat.S_ISREG(result.st_mode) else None
+
+    def set_range(self, range: Optional[str], if_range: Optional[str] = None) -> None:
+        """
+        Sets the ranges of the file that were requested.
+        This gets called with the request's headers before the response is sent.
+
+        Parameters
+        ----------
+        range: Optional[:class:`str`]
+            The value of the ``Range`` header.
+        if_range: Optional[:class:`str`]
+            The value of the ``If-Range`` header. The ranges are only sent if it matches the
+            entity tag or the modification date of the file, otherwise the whole file is.
+        """
+        self._range = range
+        self._if_range = if_range
+
+    def _get_ranges(self) -> Optional[List[Tuple[int, int]]]:
+        if self._range is None or self.status != HTTPStatus.OK:
+            return None
+
+        if_range = self._if_range
+        if if_range is not None:
+            if if_range.lstrip().startswith(('"', 'W/')):
+                etag = self._headers.get('ETag')
+                if etag is None or not etag_matches(etag, if_range, weak=False):
+                    return None
+            elif if_range != self._last_modified:
+                return None
+
+        return parse_range(self._range, self._size)
+
+    def _prepare_ranges(self, ranges: List[Tuple[int, int]]) -> None:
+        size = self._size
+
+        if not ranges:
+            self._status = HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+            self._headers['Content-Range'] = f'bytes */{size}'
+            self._headers['Content-Length'] = '0'
+
+            self._parts = []
+            return
+
+        self._status = HTTPStatus.PARTIAL_CONTENT
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+
+            self._headers['Content-Type'] = self.content_type
+            self._headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+            self._headers['Content-Length'] = str(end - start + 1)
+
+            self._parts = [(b'', start, end - start + 1)]
+            return
+
+        boundary = secrets.token_hex(16)
+        self._parts = parts = []
+
+        for start, end in ranges:
+            head = (
+                f'--{boundary}\r\nContent-Type: {self.content_type}\r\n'
+                f'Content-Range: bytes {start}-{end}/{size}\r\n\r\n'
+            )
+            # Every part but the first one is preceded by the line break ending the previous part.
+            head = head.encode() if not parts else CLRF + head.encode()
+
+            parts.append((head, start, end - start + 1))
+
+        self._closing_delimiter = f'\r\n--{boundary}--\r\n'.encode()
+
+        self._headers['Content-Type'] = f'multipart/byteranges; boundary={boundary}'
+        self._headers['Content-Length'] = str(
+            sum(len(head) + count for head, _, count in parts) + len(self._closing_delimiter)
+        )
+
+    async def prepare_buffers(self) -> List[BytesLike]:
         """
-        Encodes the response into a sendable bytes object.
+        Encodes the response into a list of buffers.
+        For files on disk, only the status line and headers are encoded while the file is sent by :meth:`write_body`.
         """
-        self.body = body = await self.file.read()
-        data = self._prepare(body)
+        result = self._stat_result
+        if result is None:
+            self._data = data = await self.file.read()
+            self._size = len(data)
 
-        await self.file.close()
-        return data
+            await self.file.close()
+        else:
+            self._offset = self.file.tell()
+            self._size = max(result.st_size - self._offset, 0)
+
+        self._headers['Accept-Ranges'] = 'bytes'
+
+        ranges = self._get_ranges()
+        if ranges is not None:
+            self._prepare_ranges(ranges)
+            return self._prepare_buffers(None)
+
+        if self._data is not None:
+            self._parts = []
+
+            self.body = self._data
+            return self._prepare_buffers(self._data)
+
+        self._headers['Content-Type'] = self.content_type
+        self._headers['Content-Length'] = str(self._size)
+
+        self._parts = [(b'', 0, self._size)]
+        return self._prepare_buffers(None)
+
+    async def _send_chunks(self, writer: StreamWriter, offset: int, count: int) -> None:
+        while count > 0:
+            chunk = await self.file.pread(min(self.chunk_size, count), offset)
+            if not chunk:
+                break
+
+            offset += len(chunk)
+            count -= len(chunk)
+
+            await writer.write(chunk, drain=True)
+
+    async def write_body(self, writer: StreamWriter) -> None:
+        """
+        Sends the file if it was not included in the buffers returned by :meth:`prepare_buffers`.
+
+        Parameters
+        ----------
+        writer: :class:`~subway.streams.StreamWriter`
+            The writer to write to.
+        """
+        if self._parts is None:
+            return
+
+        try:
+            for head, start, count in self._parts:
+                if head:
+                    writer.write(head)
+
+                if self._data is not None:
+                    await writer.write(memoryview(self._data)[start:start + count], drain=True)
+                else:
+                    await self.send_file(writer, self._offset + start, count)
+
+            if self._closing_delimiter:
+                await writer.write(self._closing_delimiter, drain=True)
+        finally:
+            await self.file.close()
+
+    async def send_file(self, writer: StreamWriter, offset: int, count: int) -> None:
+        """
+        Sends a part of the file, using ``sendfile`` when possible.
+
+        Parameters
+        ----------
+        writer: :class:`~subway.streams.StreamWriter`
+            The writer to write to.
+        offset: :class:`int`
+            The position in the file to start sending from.
+        count: :class:`int`
+            The amount of bytes to send.
+        """
+        if not count:
+            return
+
+        if self.use_sendfile and not isinstance(writer, BodyBuffer) and writer.get_extra_info('sslcontext') is None:
+            loop = asyncio.get_running_loop()
+
+            try:
+                await loop.sendfile(writer.transport, self.file.fp, offset, count, fallback=False) # type: ignore
+                return
+            except (asyncio.SendfileNotAvailableError, NotImplementedError):
+                pass
+
+        await self._send_chunks(writer, offset, count)
 
 @overload
 def cache_control(
@@ -429,3 +935,43 @@ def cache_control(**kwargs: Any) -> Callable[..., Any]:
         return obj
 
     return decorator
+
+def etag(key: Optional[Callable[..., Any]] = None, *, weak: bool = False) -> Callable[..., Any]:
+    """
+    A decorator used to add an ``ETag`` header to a route's responses,
+    answering requests whose ``If-None-Match`` header matches it with ``304 Not Modified``.
+
+    Parameters
+    ----------
+    key: Optional[Callable[..., Any]]
+        A function, or coroutine function, called with the request and the route's keyword arguments
+        before the route is, returning the current version of the resource, or ``None`` if it doesn't have one.
+        The entity tag is derived from it, so that a ``304 Not Modified`` response is sent without calling the route.
+        If not given, the entity tag is generated by hashing the response's body.
+    weak: :class:`bool`
+        Whether the entity tag is weak.
+    """
+    def decorator(obj: Any) -> Any:
+        obj.__etag__ = {'key': key, 'weak': weak}
+        return obj
+
+    return decorator
+
+def single_flight(*, vary: Iterable[str] = ()) -> Callable[..., Any]:
+    """
+    A decorator used to coalesce identical concurrent ``GET`` requests to a route, see :class:`~subway.caching.SingleFlight`.
+    The route is executed once for all of them and its encoded response is sent to each one, an exception raised
+    by it is handled for each one as well.
+
+    The response must only depend on the request's path, query string and the headers given in ``vary``.
+
+    Parameters
+    ----------
+    vary: Iterable[:class:`str`]
+        The names of other request headers the route's response depends on.
+    """
+    def decorator(obj: Any) -> Any:
+        obj.__single_flight__ = {'vary': tuple(vary)}
+        return obj
+
+    return decorator
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, List, Dict, NamedTuple, Optional, Tuple, Union, TypeVar, Any, NoReturn
-from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Dict, NamedTuple, Optional, Pattern, Tuple, Union, TypeVar, Any, NoReturn
+import uuid
 import re
 import copy
 
@@ -12,30 +12,286 @@ from .responses import NotFound, MethodNotAllowed
 from .objects import Middleware, Route, WebSocketRoute, MiddlewareType
 
 if TYPE_CHECKING:
-    from typing_extensions import ParamSpec
-
     RouteT = TypeVar('RouteT', bound=Route)
 
-    T = TypeVar('T')
-    P = ParamSpec('P')
-    
-    def lru_cache(maxsize: Optional[int] = 128) -> Callable[[Callable[P, T]], Callable[P, T]]:
-        ...
-
 __all__ = (
     'Router',
 )
 
-ROUTE_CACHE_MAXSIZE = 2048 * 1024
+# A parameter's type may be a regex with one level of nested braces, e.g. {code:[A-Z]{3}}.
+PARAM_REGEX = re.compile(r"{(?P<param>\w+)(?::(?P<type>(?:[^{}]|{[^{}]*})+))?}")
+
+class ParamType(NamedTuple):
+    regex: str
+    converter: Callable[[str], Any]
+
+PARAM_TYPES: Dict[str, ParamType] = {
+    'str': ParamType(r'[^/]+', str),
+    'int': ParamType(r'-?\d+', int),
+    'float': ParamType(r'-?\d+(?:\.\d+)?', float),
+    'uuid': ParamType(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}', uuid.UUID),
+}
+
+def get_param_type(type: Optional[str]) -> ParamType:
+    """
+    Returns the type of a path parameter from its ``{name:type}`` spec.
+    Types that are not one of :data:`PARAM_TYPES` are used as a regex and their values are left as strings.
+
+    Parameters
+    ----------
+    type: Optional[:class:`str`]
+        The type of the parameter.
+    """
+    if type is None:
+        return PARAM_TYPES['str']
+
+    param_type = PARAM_TYPES.get(type)
+    if param_type is not None:
+        return param_type
+
+    try:
+        re.compile(type)
+    except re.error as exc:
+        raise RegistrationError(f'Invalid regex for path parameter: {type!r} ({exc})') from None
+
+    return ParamType(type, str)
 
 class ResolvedRoute(NamedTuple):
     route: Route
-    params: Dict[str, str]
+    params: Dict[str, Any]
 
     @classmethod
     def from_route(cls, route: Route):
         return cls(route=route, params={})
 
+class RouteNode:
+    """
+    A node of a :class:`~.RouteTree`.
+
+    Static children are keyed by their first segment and hold the whole run of static segments
+    leading to them, so chains of nodes with a single static child are compressed into one edge.
+    """
+    __slots__ = ('static', 'patterns', 'params', 'routes')
+
+    def __init__(self) -> None:
+        self.static: Dict[str, Tuple[List[str], RouteNode]] = {}
+        self.patterns: Dict[str, Tuple[Pattern[str], Dict[str, Callable[[str], Any]], RouteNode]] = {}
+        self.params: Dict[str, RouteNode] = {}
+        self.routes: Dict[str, Union[Route, WebSocketRoute]] = {}
+
+    def __repr__(self) -> str:
+        return f'<RouteNode routes={list(self.routes)}>'
+
+class RouteTree:
+    """
+    A radix tree of routes keyed on path segments.
+
+    Matching walks the tree one segment at a time, trying static segments first, then segments
+    that have typed parameters (e.g. ``{id:int}``) or mix static text with parameters (e.g. ``{name}.txt``)
+    and finally plain ``{param}`` segments, backtracking if a branch doesn't lead to a route.
+    A parameter never spans more than one segment.
+
+    Typed parameters are validated while matching and their values are converted, so two routes can
+    differ only by the type of a parameter.
+    """
+    PARAM_REGEX = PARAM_REGEX
+
+    def __init__(self) -> None:
+        self.root = RouteNode()
+
+    def __repr__(self) -> str:
+        return f'<RouteTree root={self.root!r}>'
+
+    @staticmethod
+    def split(path: str) -> List[str]:
+        """
+        Splits a path into its segments.
+
+        Parameters
+        ----------
+        path: :class:`str`
+            The path to split.
+        """
+        return path.split('/')
+
+    def compile_segment(self, segment: str) -> Tuple[Pattern[str], Dict[str, Callable[[str], Any]]]:
+        """
+        Compiles a segment that has typed parameters or mixes static text with parameters.
+
+        Parameters
+        ----------
+        segment: :class:`str`
+            The segment to compile.
+
+        Returns
+        -------
+        Tuple[:class:`re.Pattern`, Dict[:class:`str`, Callable[[:class:`str`], Any]]]
+            The compiled segment and the converters of its parameters.
+        """
+        regex = r""
+        converters: Dict[str, Callable[[str], Any]] = {}
+        last_pos = 0
+
+        for match in self.PARAM_REGEX.finditer(segment):
+            name = match.group("param")
+            param_type = get_param_type(match.group("type"))
+
+            regex += re.escape(segment[last_pos:match.start()])
+            regex += r"(?P<%s>%s)" % (name, param_type.regex)
+
+            if param_type.converter is not str:
+                converters[name] = param_type.converter
+
+            last_pos = match.end()
+
+        regex += re.escape(segment[last_pos:])
+
+        try:
+            return re.compile(regex), converters
+        except re.error as exc:
+            raise RegistrationError(f'Invalid path segment: {segment!r} ({exc})') from None
+
+    def insert(self, route: Union[Route, WebSocketRoute]) -> None:
+        """
+        Inserts a route into the tree, replacing any route with the same path and method.
+
+        Parameters
+        ----------
+        route: :class:`~subway.objects.Route`
+            The route to insert.
+        """
+        segments = self.split(route.raw_path)
+        node = self.root
+        index = 0
+
+        while index < len(segments):
+            segment = segments[index]
+
+            match = self.PARAM_REGEX.fullmatch(segment)
+            if match and match.group('type') in (None, 'str'):
+                node = node.params.setdefault(match.group('param'), RouteNode())
+                index += 1
+
+                continue
+
+            if self.PARAM_REGEX.search(segment):
+                if segment not in node.patterns:
+                    pattern, converters = self.compile_segment(segment)
+                    node.patterns[segment] = (pattern, converters, RouteNode())
+
+                node = node.patterns[segment][2]
+                index += 1
+
+                continue
+
+            end = index + 1
+            while end < len(segments) and not self.PARAM_REGEX.search(segments[end]):
+                end += 1
+
+            run = segments[index:end]
+            edge = node.static.get(segment)
+
+            if edge is None:
+                child = RouteNode()
+                node.static[segment] = (run, child)
+
+                node = child
+                index = end
+
+                continue
+
+            label, child = edge
+
+            common = 1
+            while common < min(len(label), len(run)) and label[common] == run[common]:
+                common += 1
+
+            if common < len(label):
+                # The new route diverges in the middle of the edge, so it has to be split in two.
+                middle = RouteNode()
+                middle.static[label[common]] = (label[common:], child)
+
+                node.static[segment] = (label[:common], middle)
+                child = middle
+
+            node = child
+            index += common
+
+        node.routes[route.method] = route
+
+    def find(
+        self,
+        segments: List[str],
+        method: Optional[str] = None
+    ) -> Optional[Tuple[RouteNode, Dict[str, Any]]]:
+        """
+        Finds the node a path leads to.
+
+        Parameters
+        ----------
+        segments: List[:class:`str`]
+            The segments of the path.
+        method: Optional[:class:`str`]
+            If given, only nodes that have a route with this method are considered.
+
+        Returns
+        -------
+        Optional[Tuple[:class:`~.RouteNode`, Dict[:class:`str`, Any]]]
+            The node and the matched parameters, converted to their types.
+        """
+        return self._find(self.root, segments, 0, method)
+
+    def _find(
+        self,
+        node: RouteNode,
+        segments: List[str],
+        index: int,
+        method: Optional[str]
+    ) -> Optional[Tuple[RouteNode, Dict[str, Any]]]:
+        if index == len(segments):
+            routes = node.routes
+            if routes and (method is None or method in routes):
+                return node, {}
+
+            return None
+
+        segment = segments[index]
+
+        edge = node.static.get(segment)
+        if edge is not None:
+            label, child = edge
+            end = index + len(label)
+
+            if end == index + 1 or segments[index:end] == label:
+                found = self._find(child, segments, end, method)
+                if found is not None:
+                    return found
+
+        if not segment:
+            return None
+
+        for pattern, converters, child in node.patterns.values():
+            match = pattern.fullmatch(segment)
+            if match is None:
+                continue
+
+            found = self._find(child, segments, index + 1, method)
+            if found is not None:
+                params = found[1]
+                for name, value in match.groupdict().items():
+                    converter = converters.get(name)
+                    params[name] = converter(value) if converter is not None else value
+
+                return found
+
+        for name, child in node.params.items():
+            found = self._find(child, segments, index + 1, method)
+            if found is not None:
+                found[1][name] = segment
+                return found
+
+        return None
+
 class Router:
     """
     A route handler.
@@ -53,8 +309,11 @@ class Router:
         A dictionary of routes.
     middlewares: 
         A list of middleware callbacks.
+    middlewares_version: :class:`int`
+        Incremented whenever a middleware is added or removed,
+        letting routes know their compiled middleware chains are out of date.
     """
-    PARAM_REGEX = re.compile(r"{(?P<param>\w+)}")
+    PARAM_REGEX = PARAM_REGEX
 
     def __init__(self, url_prefix: Optional[str] = None) -> None:
         """
@@ -67,6 +326,32 @@ class Router:
         self.routes: Dict[Tuple[str, str], Union[Route, WebSocketRoute]] = {}
         self.request_middlewares: List[Middleware] = []
         self.response_middlewares: List[Middleware] = []
+        self.tree = RouteTree()
+        self.middlewares_version = 0
+        self._frozen = False
+
+    def _ensure_not_frozen(self) -> None:
+        if self._frozen:
+            raise RegistrationError('Routes and middlewares cannot be changed once the router is frozen')
+
+    def freeze(self) -> None:
+        """
+        Freezes the router, any attempt at adding or removing routes or middlewares raises a
+        :exc:`~subway.errors.RegistrationError` until it's unfrozen.
+        """
+        self._frozen = True
+
+    def unfreeze(self) -> None:
+        """
+        Unfreezes the router.
+        """
+        self._frozen = False
+
+    def is_frozen(self) -> bool:
+        """
+        True if the router is frozen.
+        """
+        return self._frozen
 
     def union(self, other: Router) -> Router:
         """
@@ -77,10 +362,12 @@ class Router:
         other: :class:`~subway.Router`
             The router to merge with.
         """
+        self._ensure_not_frozen()
         routes = [self.add_route(route) for route in other]
 
         self.request_middlewares.extend(other.request_middlewares)
         self.response_middlewares.extend(other.response_middlewares)
+        self.middlewares_version += 1
 
         return self
 
@@ -88,14 +375,17 @@ class Router:
         """
         Clears the router.
         """
+        self._ensure_not_frozen()
+
         self.routes.clear()
+        self.tree = RouteTree()
         self.response_middlewares.clear()
         self.request_middlewares.clear()
+        self.middlewares_version += 1
 
-    @lru_cache(maxsize=ROUTE_CACHE_MAXSIZE)
     def match(self, path: str) -> Optional[ResolvedRoute]:
         """
-        Matches a path to a route. Can be slow.
+        Matches a path to a route, regardless of its method.
 
         Parameters
         ----------
@@ -107,12 +397,15 @@ class Router:
         :class:`~.ResolvedRoute`
             The resolved route.
         """
-        for route in self:
-            params = route.match(path)
-            if params is not None:
-                return ResolvedRoute(route, params)
+        found = self.tree.find(self.tree.split(path))
+        if found is None:
+            return None
+
+        node, params = found
+        route = next(iter(node.routes.values()))
+
+        return ResolvedRoute(route, params)
 
-    @lru_cache(maxsize=ROUTE_CACHE_MAXSIZE)
     def resolve(self, path: str, method: str) -> Optional[ResolvedRoute]:
         """
         Resolves a route.
@@ -130,20 +423,23 @@ class Router:
             The resolved route.
         """
         if path.endswith('/') and not path == '/':
-            return self.resolve(path[:-1], method)
+            path = path[:-1]
 
         resolved = self.resolve_from_path(path, method)
         if resolved is not None:
             return resolved
 
-        resolved = self.match(path)
-        if not resolved:
-            raise NotFound(f'Route {path!r} was not found.')
+        segments = self.tree.split(path)
+
+        found = self.tree.find(segments, method)
+        if found is None:
+            if self.tree.find(segments) is None:
+                raise NotFound(f'Route {path!r} was not found.')
 
-        if resolved.route.method != method:
             raise MethodNotAllowed(f'Method {method!r} is not allowed for route {path!r}.')
 
-        return resolved
+        node, params = found
+        return ResolvedRoute(node.routes[method], params)
 
     def resolve_from_path(self, path: Union[Route, str], method: str) -> Optional[ResolvedRoute]:
         """
@@ -179,11 +475,14 @@ class Router:
         last_pos = 0
 
         for match in self.PARAM_REGEX.finditer(path):
+            type = match.group("type")
+
             regex += path[last_pos:match.start()]
-            regex += r"(?P<%s>.+)" % match.group("param")
+            regex += r"(?P<%s>%s)" % (match.group("param"), ".+" if type is None else get_param_type(type).regex)
 
             last_pos = match.end()
 
+        regex += path[last_pos:]
         return regex
 
     def store_route(self, route: RouteT) -> RouteT:
@@ -195,6 +494,9 @@ class Router:
         route: :class:`~subway.objects.Route`
             The route to store.
         """
+        self._ensure_not_frozen()
+
+        self.tree.insert(route)
         self.routes[(route.raw_path, route.method)] = route
         return route
 
@@ -208,6 +510,7 @@ class Router:
             The route to add.
         """
         assert route.raw_path is not None
+        self._ensure_not_frozen()
 
         if not isinstance(route, (Route, WebSocketRoute)):
             fmt = 'Expected Route or WebSocketRoute but got {0!r} instead'
@@ -234,7 +537,16 @@ class Router:
         route: :class:`~subway.objects.Route`
             The route to remove.
         """
-        return self.routes.pop((route.raw_path, route.method), None)  # type: ignore
+        self._ensure_not_frozen()
+
+        removed = self.routes.pop((route.raw_path, route.method), None)
+        if removed is not None:
+            # Removing routes is rare enough that rebuilding the tree is simpler than pruning it.
+            self.tree = RouteTree()
+            for route in self:
+                self.tree.insert(route)
+
+        return removed  # type: ignore
 
     def websocket(
         self, 
@@ -292,11 +604,15 @@ class Router:
         return middleware
         
     def add_middleware(self, middleware: Middleware) -> None:
+        self._ensure_not_frozen()
+
         if middleware.type is MiddlewareType.request:
             self.request_middlewares.append(middleware)
         else:
             self.response_middlewares.append(middleware)
 
+        self.middlewares_version += 1
+
     def request_middleware(self, callback: RequestMiddleware) -> Middleware:
         """
         A decorator for registering a middleware callback.
@@ -318,7 +634,10 @@ class Router:
         middleware: :class:`~subway.objects.Middleware`
             The middleware to remove.
         """
-        return self.request_middlewares.remove(middleware)
+        self._ensure_not_frozen()
+
+        self.request_middlewares.remove(middleware)
+        self.middlewares_version += 1
 
     def response_middleware(self, callback: ResponseMiddleware) -> Middleware:
         """
@@ -341,7 +660,10 @@ class Router:
         middleware: :class:`~subway.objects.Middleware`
             The middleware to remove.
         """
-        return self.response_middlewares.remove(middleware)
+        self._ensure_not_frozen()
+
+        self.response_middlewares.remove(middleware)
+        self.middlewares_version += 1
 
     def create_route(
         self, 
@@ -1,4 +1,6 @@
-from typing import Any, Optional, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
 import asyncio
 import sys
 import ssl
@@ -7,6 +9,9 @@ import socket
 from subway import compat
 from subway.streams import StreamReader, StreamWriter, start_server, start_unix_server
 
+if TYPE_CHECKING:
+    from subway.parser import RequestParser
+
 __all__ = [
     'BaseServer',
     'TCPServer',
@@ -113,6 +118,22 @@ class BaseServer:
         self._server = None
         self._closed = True
 
+    def create_parser(self) -> Optional[RequestParser]:
+        """
+        Creates the parser fed with the data received on a new connection.
+        Returns ``None`` by default, meaning that the received data is only fed to the reader.
+        To be subclassed and overriden by users.
+        """
+        return None
+
+    def get_read_buffer_limits(self) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """
+        Returns the high-water and low-water limits for read flow control of every connection.
+        Returns ``None`` by default, meaning that the reader's default limits are used.
+        To be subclassed and overriden by users.
+        """
+        return None
+
     async def on_transport_connect(self, reader: StreamReader, writer: StreamWriter) -> None:
         """
         A callback called on a new connection.
@@ -194,6 +215,8 @@ class TCPServer(BaseServer):
             host=self.host,
             port=self.port,
             connection_callback=self.on_transport_connect,
+            parser_factory=self.create_parser,
+            read_buffer_limits=self.get_read_buffer_limits(),
             sock=sock,
             ssl=self._ssl_context,
             start_serving=False,
@@ -260,6 +283,8 @@ class UnixServer(BaseServer):
         self._server = server = await start_unix_server(
             path=self.path,
             connection_callback=self.on_transport_connect,
+            parser_factory=self.create_parser,
+            read_buffer_limits=self.get_read_buffer_limits(),
             sock=sock,
         )
         await server.start_serving()
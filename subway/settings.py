@@ -25,10 +25,28 @@ class SettingsDict(TypedDict):
     worker_count: int
     session_cookie_name: str
     backlog: int
+    keep_alive_timeout: float
+    max_requests_per_connection: int
+    max_pipelined_requests: int
+    process_count: int
+    read_buffer_high_water: int
+    read_buffer_low_water: int
+    sequential_middlewares: bool
+    max_connections: int
+    max_inflight_requests: int
+    max_loop_lag: float
+    overload_retry_after: int
+    compression: bool
+    auto_etag: bool
+    response_cache_size: int
 
 class Settings:
     __slots__ = (
-        'host', 'port', 'path', 'ipv6', 'ssl', 'worker_count', 'session_cookie_name', 'backlog'
+        'host', 'port', 'path', 'ipv6', 'ssl', 'worker_count', 'session_cookie_name', 'backlog',
+        'keep_alive_timeout', 'max_requests_per_connection', 'max_pipelined_requests', 'process_count',
+        'read_buffer_high_water', 'read_buffer_low_water',
+        'sequential_middlewares', 'max_connections', 'max_inflight_requests', 'max_loop_lag',
+        'overload_retry_after', 'compression', 'auto_etag', 'response_cache_size'
     )
 
     def __init__(
@@ -41,7 +59,21 @@ class Settings:
         ssl: Union[bool, _ssl.SSLContext] = False,
         worker_count: Optional[int] = None,
         session_cookie_name: Optional[str] = None,
-        backlog: Optional[int] = None
+        backlog: Optional[int] = None,
+        keep_alive_timeout: Optional[float] = None,
+        max_requests_per_connection: Optional[int] = None,
+        max_pipelined_requests: Optional[int] = None,
+        process_count: Optional[int] = None,
+        read_buffer_high_water: Optional[int] = None,
+        read_buffer_low_water: Optional[int] = None,
+        sequential_middlewares: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_inflight_requests: Optional[int] = None,
+        max_loop_lag: Optional[float] = None,
+        overload_retry_after: Optional[int] = None,
+        compression: Optional[bool] = None,
+        auto_etag: Optional[bool] = None,
+        response_cache_size: Optional[int] = None
     ):
         self.host = host
         self.path = path
@@ -79,6 +111,91 @@ class Settings:
             backlog = 200
         self.backlog = backlog
 
+        if keep_alive_timeout is not None:
+            if not isinstance(keep_alive_timeout, (int, float)) or keep_alive_timeout < 0:
+                raise TypeError('keep_alive_timeout must be a positive number')
+        else:
+            keep_alive_timeout = 5.0
+        self.keep_alive_timeout = keep_alive_timeout
+
+        if max_requests_per_connection is not None:
+            if not isinstance(max_requests_per_connection, int) or max_requests_per_connection < 0:
+                raise TypeError('max_requests_per_connection must be a positive integer')
+        else:
+            max_requests_per_connection = 1000
+        self.max_requests_per_connection = max_requests_per_connection
+
+        if max_pipelined_requests is not None:
+            if not isinstance(max_pipelined_requests, int) or max_pipelined_requests < 1:
+                raise TypeError('max_pipelined_requests must be an integer greater than 0')
+        else:
+            max_pipelined_requests = 16
+        self.max_pipelined_requests = max_pipelined_requests
+
+        if process_count is not None:
+            if not isinstance(process_count, int) or process_count < 1:
+                raise TypeError('process_count must be an integer greater than 0')
+        else:
+            process_count = 1
+        self.process_count = process_count
+
+        if read_buffer_high_water is not None:
+            if not isinstance(read_buffer_high_water, int) or read_buffer_high_water < 1:
+                raise TypeError('read_buffer_high_water must be an integer greater than 0')
+        else:
+            read_buffer_high_water = 262144
+        self.read_buffer_high_water = read_buffer_high_water
+
+        if read_buffer_low_water is not None:
+            if not isinstance(read_buffer_low_water, int) or read_buffer_low_water < 0:
+                raise TypeError('read_buffer_low_water must be a positive integer')
+        else:
+            read_buffer_low_water = read_buffer_high_water // 4
+        self.read_buffer_low_water = read_buffer_low_water
+
+        if read_buffer_low_water > read_buffer_high_water:
+            raise ValueError('read_buffer_low_water must not be greater than read_buffer_high_water')
+
+        self.sequential_middlewares = bool(sequential_middlewares)
+
+        if max_connections is not None:
+            if not isinstance(max_connections, int) or max_connections < 0:
+                raise TypeError('max_connections must be a positive integer')
+        else:
+            max_connections = 0
+        self.max_connections = max_connections
+
+        if max_inflight_requests is not None:
+            if not isinstance(max_inflight_requests, int) or max_inflight_requests < 0:
+                raise TypeError('max_inflight_requests must be a positive integer')
+        else:
+            max_inflight_requests = 0
+        self.max_inflight_requests = max_inflight_requests
+
+        if max_loop_lag is not None:
+            if not isinstance(max_loop_lag, (int, float)) or max_loop_lag < 0:
+                raise TypeError('max_loop_lag must be a positive number')
+        else:
+            max_loop_lag = 0.0
+        self.max_loop_lag = max_loop_lag
+
+        if overload_retry_after is not None:
+            if not isinstance(overload_retry_after, int) or overload_retry_after < 0:
+                raise TypeError('overload_retry_after must be a positive integer')
+        else:
+            overload_retry_after = 1
+        self.overload_retry_after = overload_retry_after
+
+        self.compression = bool(compression)
+        self.auto_etag = bool(auto_etag)
+
+        if response_cache_size is not None:
+            if not isinstance(response_cache_size, int) or response_cache_size < 0:
+                raise TypeError('response_cache_size must be a positive integer')
+        else:
+            response_cache_size = 0
+        self.response_cache_size = response_cache_size
+
         self.ensure_host()
 
     def __getitem__(self, item: str):
@@ -152,7 +269,21 @@ class Settings:
         ssl: Union[bool, _ssl.SSLContext] = False,
         worker_count: Optional[int] = None,
         session_cookie_name: Optional[str] = None,
-        backlog: Optional[int] = None
+        backlog: Optional[int] = None,
+        keep_alive_timeout: Optional[float] = None,
+        max_requests_per_connection: Optional[int] = None,
+        max_pipelined_requests: Optional[int] = None,
+        process_count: Optional[int] = None,
+        read_buffer_high_water: Optional[int] = None,
+        read_buffer_low_water: Optional[int] = None,
+        sequential_middlewares: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_inflight_requests: Optional[int] = None,
+        max_loop_lag: Optional[float] = None,
+        overload_retry_after: Optional[int] = None,
+        compression: Optional[bool] = None,
+        auto_etag: Optional[bool] = None,
+        response_cache_size: Optional[int] = None
     ) -> None:
         if host is not None:
             self.host = host
@@ -168,6 +299,34 @@ class Settings:
             self.session_cookie_name = session_cookie_name
         if backlog is not None:
             self.backlog = backlog
+        if keep_alive_timeout is not None:
+            self.keep_alive_timeout = keep_alive_timeout
+        if max_requests_per_connection is not None:
+            self.max_requests_per_connection = max_requests_per_connection
+        if max_pipelined_requests is not None:
+            self.max_pipelined_requests = max_pipelined_requests
+        if process_count is not None:
+            self.process_count = process_count
+        if read_buffer_high_water is not None:
+            self.read_buffer_high_water = read_buffer_high_water
+        if read_buffer_low_water is not None:
+            self.read_buffer_low_water = read_buffer_low_water
+        if sequential_middlewares is not None:
+            self.sequential_middlewares = sequential_middlewares
+        if max_connections is not None:
+            self.max_connections = max_connections
+        if max_inflight_requests is not None:
+            self.max_inflight_requests = max_inflight_requests
+        if max_loop_lag is not None:
+            self.max_loop_lag = max_loop_lag
+        if overload_retry_after is not None:
+            self.overload_retry_after = overload_retry_after
+        if compression is not None:
+            self.compression = compression
+        if auto_etag is not None:
+            self.auto_etag = auto_etag
+        if response_cache_size is not None:
+            self.response_cache_size = response_cache_size
 
         self.ipv6 = ipv6 or self.ipv6
         self.ensure_host()
@@ -181,7 +340,21 @@ class Settings:
             'ssl': self.ssl,
             'worker_count': self.worker_count,
             'session_cookie_name': self.session_cookie_name,
-            'backlog': self.backlog
+            'backlog': self.backlog,
+            'keep_alive_timeout': self.keep_alive_timeout,
+            'max_requests_per_connection': self.max_requests_per_connection,
+            'max_pipelined_requests': self.max_pipelined_requests,
+            'process_count': self.process_count,
+            'read_buffer_high_water': self.read_buffer_high_water,
+            'read_buffer_low_water': self.read_buffer_low_water,
+            'sequential_middlewares': self.sequential_middlewares,
+            'max_connections': self.max_connections,
+            'max_inflight_requests': self.max_inflight_requests,
+            'max_loop_lag': self.max_loop_lag,
+            'overload_retry_after': self.overload_retry_after,
+            'compression': self.compression,
+            'auto_etag': self.auto_etag,
+            'response_cache_size': self.response_cache_size
         }
 
 class Config(dict):
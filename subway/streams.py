@@ -1,4 +1,6 @@
-from typing import Callable, List, Literal, Tuple, Optional, Any, overload, TypedDict, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, List, Literal, Tuple, Optional, Any, overload, TypedDict, Union
 import asyncio
 import socket
 import ssl
@@ -7,6 +9,14 @@ from . import compat, utils
 from .types import BytesLike, Coro
 from .errors import PartialRead
 
+if TYPE_CHECKING:
+    from .parser import RequestParser
+
+ParserFactory = Callable[[], Optional['RequestParser']]
+
+# Buffers at least this large are written on their own instead of being joined with their neighbours.
+LARGE_BUFFER_SIZE = 16384
+
 class Peercert(TypedDict, total=False):
     subject: Tuple[Tuple[Tuple[str, str]]]
     issuer: Tuple[Tuple[Tuple[str, str]]]
@@ -118,14 +128,38 @@ class StreamWriter:
         """
         Writes a list of data to the transport.
 
+        On Python 3.12+ the buffers are sent with a single vectored write. Before that,
+        :meth:`asyncio.WriteTransport.writelines` joins them into a new bytes object, so small buffers are
+        joined while large ones are written on their own to avoid copying them.
+
         Parameters
         ----------
-        data: List[Union[:class:`bytearray`, :class:`bytes`]]
+        data: List[Union[:class:`bytearray`, :class:`bytes`, :class:`memoryview`]]
             list of data to write.
         drain: :class:`bool`
             Whether to wait until all data has been written.
         """
-        self._transport.writelines(data)
+        transport = self._transport
+
+        if compat.PY312 or len(data) < 2:
+            transport.writelines(data)
+        else:
+            pending: List[BytesLike] = []
+
+            for buffer in data:
+                if len(buffer) < LARGE_BUFFER_SIZE:
+                    pending.append(buffer)
+                    continue
+
+                if pending:
+                    transport.write(b''.join(pending))
+                    pending.clear()
+
+                transport.write(buffer)
+
+            if pending:
+                transport.write(b''.join(pending))
+
         if drain:
             return self.drain()
 
@@ -220,18 +254,33 @@ class StreamWriter:
 
 class StreamReader:
     """
+    Received data is kept in a single buffer and reading it only advances an offset into that buffer,
+    so the data that is left is never copied. The consumed part is dropped once the buffer is drained or
+    once it makes up most of the buffer.
+
+    Once a transport is attached, reading from it is paused when more than the high-water limit
+    of data is buffered and resumed when it drops to the low-water limit,
+    see :meth:`set_read_buffer_limits`.
+
     Attributes
     ----------
-    buffer: :class:`bytearray`
-        A bytearray containing the data.
     loop: :class:`asyncio.AbstractEventLoop`
         A reference to the event loop.
     """
+    _compact_threshold = 65536
 
     def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
-        self.buffer: bytearray = bytearray()
         self.loop = loop or compat.get_running_loop()
 
+        self._buffer = bytearray()
+        self._offset = 0
+
+        self._transport: Optional[asyncio.BaseTransport] = None
+        self._paused = False
+        self._high_water = 0
+        self._low_water = 0
+        self.set_read_buffer_limits()
+
         self._waiter: Optional[asyncio.Future[None]] = None
         self._eof = False
 
@@ -252,6 +301,8 @@ class StreamReader:
         if self._waiter is not None:
             raise RuntimeError('Already waiting for data')
 
+        # Whoever waits needs more data than what is buffered, regardless of the limits.
+        self.resume_reading()
         self._waiter = self.loop.create_future()
 
         try:
@@ -259,6 +310,126 @@ class StreamReader:
         finally:
             self._waiter = None
 
+    def _peek(self, nbytes: int) -> bytes:
+        with memoryview(self._buffer) as view:
+            return view[self._offset:self._offset + nbytes].tobytes()
+
+    def _consume(self, nbytes: int) -> None:
+        self._offset += nbytes
+
+        if self._offset == len(self._buffer):
+            self._buffer.clear()
+            self._offset = 0
+        elif self._offset >= self._compact_threshold and self._offset * 2 >= len(self._buffer):
+            del self._buffer[:self._offset]
+            self._offset = 0
+
+        if self._paused and self.size() <= self._low_water:
+            self.resume_reading()
+
+    def _take(self, nbytes: int) -> bytes:
+        data = self._peek(nbytes)
+        self._consume(nbytes)
+
+        return data
+
+    @property
+    def buffer(self) -> bytes:
+        """
+        A copy of the data that is buffered and was not read yet.
+        """
+        return self._peek(self.size())
+
+    def size(self) -> int:
+        """
+        Returns the amount of bytes that are buffered and were not read yet.
+        """
+        return len(self._buffer) - self._offset
+
+    def set_transport(self, transport: asyncio.BaseTransport) -> None:
+        """
+        Sets the transport the reader is fed from, which enables read flow control.
+
+        Parameters
+        ----------
+        transport: :class:`asyncio.BaseTransport`
+            The transport to use.
+        """
+        self._transport = transport
+
+    def set_read_buffer_limits(self, high: Optional[int] = None, low: Optional[int] = None) -> None:
+        """
+        Sets the high-water and low-water limits for read flow control.
+
+        Parameters
+        ------------
+        high: Optional[:class:`int`]
+            The high-water limit, defaults to 256 KiB or 4 times the low-water limit if it's given.
+        low: Optional[:class:`int`]
+            The low-water limit, defaults to a quarter of the high-water limit.
+
+        Raises
+        ------
+        ValueError: If the limits are negative or the high-water limit is lower than the low-water limit.
+        """
+        if high is None:
+            high = 262144 if low is None else 4 * low
+
+        if low is None:
+            low = high // 4
+
+        if not high >= low >= 0:
+            raise ValueError(f'high ({high!r}) must be >= low ({low!r}) must be >= 0')
+
+        self._high_water = high
+        self._low_water = low
+
+        if self.size() > high:
+            self.pause_reading()
+        elif self.size() <= low:
+            self.resume_reading()
+
+    def get_read_buffer_limits(self) -> Tuple[int, int]:
+        """
+        Returns the high-water and low-water limits for read flow control.
+        """
+        return self._high_water, self._low_water
+
+    def is_reading_paused(self) -> bool:
+        """
+        True if reading from the transport is currently paused.
+        """
+        return self._paused
+
+    def pause_reading(self) -> None:
+        """
+        Pauses reading from the transport until :meth:`resume_reading` is called.
+        This is called once the high-water limit is exceeded.
+        """
+        transport = self._transport
+        if transport is None or transport.is_closing():
+            return
+
+        self._paused = True
+
+        # Reading may have been resumed behind our back, e.g. by loop.sendfile, so the transport is checked too.
+        if transport.is_reading(): # type: ignore
+            transport.pause_reading() # type: ignore
+
+    def resume_reading(self) -> None:
+        """
+        Resumes reading from the transport.
+        This is called once the buffered data drops to the low-water limit.
+        """
+        if not self._paused:
+            return
+
+        self._paused = False
+
+        transport = self._transport
+        if transport is not None and not transport.is_closing() and not transport.is_reading(): # type: ignore
+            transport.resume_reading() # type: ignore
+
     def at_eof(self) -> bool:
         """
         Returns whether the reader has reached EOF.
@@ -269,10 +440,13 @@ class StreamReader:
         """
         Resets the reader's buffer.
         """
-        data = self.buffer
-        self.buffer = bytearray()
+        data = self._peek(self.size())
 
-        return bytes(data)
+        self._buffer.clear()
+        self._offset = 0
+
+        self.resume_reading()
+        return data
 
     def feed_data(self, data: BytesLike) -> None:
         """
@@ -286,7 +460,10 @@ class StreamReader:
         if self._eof:
             raise RuntimeError('Cannot feed data after EOF')
 
-        self.buffer.extend(data)
+        self._buffer.extend(data)
+
+        if self.size() > self._high_water:
+            self.pause_reading()
 
         if self._waiter:
             try:
@@ -306,6 +483,25 @@ class StreamReader:
 
         self._eof = True
 
+    def skip(self, nbytes: int) -> int:
+        """
+        Discards up to ``nbytes`` of the data that is already buffered, without waiting for more.
+
+        Parameters
+        ----------
+        nbytes: :class:`int`
+            Number of bytes to discard.
+
+        Returns
+        -------
+        :class:`int`
+            The number of bytes actually discarded.
+        """
+        nbytes = min(nbytes, self.size())
+        self._consume(nbytes)
+
+        return nbytes
+
     async def read(
         self, 
         nbytes: Optional[int] = None, 
@@ -329,7 +525,7 @@ class StreamReader:
         ------
         asyncio.TimeoutError: If the timeout expires.
         """
-        if not self.buffer:
+        if not self.size():
             if wait:
                 await self._wait_for_data(timeout=timeout)
             else:
@@ -338,17 +534,56 @@ class StreamReader:
         if not nbytes:
             return self.reset()
 
-        while nbytes > len(self.buffer):
+        while nbytes > self.size():
             if self.at_eof():
                 buffer = self.reset()
                 raise PartialRead(buffer, nbytes)
 
             await self._wait_for_data(timeout=timeout)
 
-        data = self.buffer[:nbytes]
-        self.buffer = self.buffer[nbytes:]
+        return self._take(nbytes)
 
-        return bytes(data)
+    async def readinto(
+        self,
+        buffer: Union[bytearray, memoryview],
+        *,
+        timeout: Optional[float] = None,
+        wait: bool = True
+    ) -> int:
+        """
+        Reads data off the stream directly into a buffer owned by the caller.
+        At most ``len(buffer)`` bytes are read, returning as soon as any data is available.
+
+        Parameters
+        ----------
+        buffer: Union[:class:`bytearray`, :class:`memoryview`]
+            The writable buffer to read into.
+        timeout: Optional[:class:`float`]
+            Timeout to wait for the read to complete.
+        wait: :class:`bool`
+            Whether to wait for data to be available.
+
+        Returns
+        -------
+        :class:`int`
+            The number of bytes read, ``0`` if the stream reached EOF.
+
+        Raises
+        ------
+        asyncio.TimeoutError: If the timeout expires.
+        """
+        if not self.size():
+            if not wait or self.at_eof():
+                return 0
+
+            await self._wait_for_data(timeout=timeout)
+
+        with memoryview(buffer) as target, memoryview(self._buffer) as view:
+            nbytes = min(target.nbytes, self.size())
+            target[:nbytes] = view[self._offset:self._offset + nbytes]
+
+        self._consume(nbytes)
+        return nbytes
 
     async def readuntil(
         self, 
@@ -376,28 +611,30 @@ class StreamReader:
         ------
         asyncio.TimeoutError: If the timeout expires.
         """
-        if not self.buffer:
+        if not self.size():
             if wait:
                 await self._wait_for_data(timeout=timeout)
             else:
                 return b''
 
-        pos = self.buffer.find(delimiter)
+        pos = self._buffer.find(delimiter, self._offset)
         while pos == -1:
             if self.at_eof():
                 buffer = self.reset()
                 raise PartialRead(buffer, None)
 
+            # Only the newly received data (and the end of what was already searched,
+            # in case the delimiter is split between the two) has to be searched again.
+            start = max(len(self._buffer) - len(delimiter) + 1, self._offset)
+
             await self._wait_for_data(timeout=timeout)
-            pos = self.buffer.find(delimiter)
+            pos = self._buffer.find(delimiter, start)
 
-        if include:
-            data = self.buffer[:pos + len(delimiter)]
-        else:
-            data = self.buffer[:pos]
+        end = pos + len(delimiter)
+        data = self._peek((end if include else pos) - self._offset)
 
-        self.buffer = self.buffer[pos + len(delimiter):]
-        return bytes(data)
+        self._consume(end - self._offset)
+        return data
 
     async def readline(
         self, 
@@ -471,19 +708,34 @@ class StreamProtocol(asyncio.Protocol):
         self,
         loop: asyncio.AbstractEventLoop,
         connection_callback: Callable[[StreamReader, StreamWriter], Any],
+        *,
+        parser_factory: Optional[ParserFactory] = None,
+        read_buffer_limits: Optional[Tuple[Optional[int], Optional[int]]] = None
     ) -> None:
         self.loop = loop
         self.connection_callback = connection_callback
+        self.parser_factory = parser_factory
+        self.parser = parser_factory() if parser_factory else None
+        self.read_buffer_limits = read_buffer_limits
         self.reader = StreamReader(loop)
+
+        if read_buffer_limits is not None:
+            self.reader.set_read_buffer_limits(*read_buffer_limits)
         self.writer: Optional[StreamWriter] = None
         self.paused = False
         self.waiter = loop.create_future()
 
     def __call__(self) -> Any:
-        return self.__class__(self.loop, self.connection_callback)
+        return self.__class__(
+            self.loop,
+            self.connection_callback,
+            parser_factory=self.parser_factory,
+            read_buffer_limits=self.read_buffer_limits
+        )
 
     def connection_made(self, transport: Any) -> None:
         self.writer = writer = StreamWriter(transport, self.waiter)
+        self.reader.set_transport(transport)
 
         if utils.iscoroutinefunction(self.connection_callback):
             self.loop.create_task(self.connection_callback(self.reader, writer))
@@ -498,13 +750,23 @@ class StreamProtocol(asyncio.Protocol):
 
         self.writer = None
         self.reader.reset()
+        self.reader.feed_eof()
+
+        if self.parser is not None:
+            self.parser.feed_eof()
 
     def data_received(self, data: bytes) -> None:
         self.reader.feed_data(data)
 
+        if self.parser is not None:
+            self.parser.feed_data(data)
+
     def eof_received(self) -> None:
         self.reader.feed_eof()
 
+        if self.parser is not None:
+            self.parser.feed_eof()
+
     def resume_writing(self) -> None:
         if not self.writer or not self.paused:
             return
@@ -545,6 +807,9 @@ async def start_server(
     connection_callback: Callable[[StreamReader, StreamWriter], Any],
     host: Optional[str] = None,
     port: Optional[int] = None,
+    *,
+    parser_factory: Optional[ParserFactory] = None,
+    read_buffer_limits: Optional[Tuple[Optional[int], Optional[int]]] = None,
     **kwargs: Any
 ) -> asyncio.AbstractServer:
     """
@@ -558,11 +823,19 @@ async def start_server(
         The host to listen on.
     port: Optional[:class:`int`]
         The port to listen on.
+    parser_factory: Optional[Callable[[], Optional[:class:`~subway.parser.RequestParser`]]]
+        A callable creating a parser for every new connection. Received data is fed to the parser
+        as well as to the reader.
+    read_buffer_limits: Optional[Tuple[Optional[:class:`int`], Optional[:class:`int`]]]
+        The high-water and low-water limits for read flow control of every connection,
+        see :meth:`StreamReader.set_read_buffer_limits`.
     **kwargs: Any
         Additional keyword arguments to pass to :meth:`asyncio.loop.create_server`.
     """
     loop = kwargs.pop('loop', None) or compat.get_running_loop()
-    protocol = StreamProtocol(loop, connection_callback)
+    protocol = StreamProtocol(
+        loop, connection_callback, parser_factory=parser_factory, read_buffer_limits=read_buffer_limits
+    )
 
     server = await loop.create_server(protocol, host=host, port=port, **kwargs)  # type: ignore
     return server
@@ -571,6 +844,9 @@ async def start_server(
 async def start_unix_server(
     connection_callback: Callable[[StreamReader, StreamWriter], Any],
     path: Optional[str] = None,
+    *,
+    parser_factory: Optional[ParserFactory] = None,
+    read_buffer_limits: Optional[Tuple[Optional[int], Optional[int]]] = None,
     **kwargs: Any
 ) -> asyncio.AbstractServer:
     """
@@ -586,12 +862,20 @@ async def start_unix_server(
         The callback to call when a connection is made.
     path: Optional[:class:`str`]
         The path of the unix domain socket.
+    parser_factory: Optional[Callable[[], Optional[:class:`~subway.parser.RequestParser`]]]
+        A callable creating a parser for every new connection. Received data is fed to the parser
+        as well as to the reader.
+    read_buffer_limits: Optional[Tuple[Optional[:class:`int`], Optional[:class:`int`]]]
+        The high-water and low-water limits for read flow control of every connection,
+        see :meth:`StreamReader.set_read_buffer_limits`.
     **kwargs: Any
         Additional keyword arguments to pass to :meth:`asyncio.loop.create_unix_server`.
 
     """
     loop = kwargs.pop('loop', None) or compat.get_running_loop()
-    protocol = StreamProtocol(loop, connection_callback)
+    protocol = StreamProtocol(
+        loop, connection_callback, parser_factory=parser_factory, read_buffer_limits=read_buffer_limits
+    )
 
     server = await loop.create_unix_server(protocol, path=path, **kwargs)  # type: ignore
     return server
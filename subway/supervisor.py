@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Set
+from multiprocessing.connection import wait
+import multiprocessing
+import logging
+import signal
+import time
+import os
+
+from . import compat, utils
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+    from .app import Application
+
+__all__ = 'Supervisor',
+
+log = logging.getLogger(__name__)
+
+class Supervisor:
+    """
+    Runs an application in multiple processes, each one having its own event loop.
+
+    If the application has ``reuse_port`` enabled, every process binds its own socket and
+    the kernel load balances connections between them using ``SO_REUSEPORT``.
+    Otherwise, the listening socket is created once and inherited by all the processes.
+
+    Processes that crash are restarted. ``SIGINT`` and ``SIGTERM`` are forwarded to the processes
+    in order to shut them down gracefully, while ``SIGHUP`` restarts all of them.
+
+    Parameters
+    ----------
+    app: :class:`~subway.app.Application`
+        The application to run.
+    count: :class:`int`
+        The number of processes to run.
+    restart_delay: :class:`float`
+        The amount of seconds to wait before restarting a crashed process.
+
+    Attributes
+    ----------
+    app: :class:`~subway.app.Application`
+        The application to run.
+    count: :class:`int`
+        The number of processes to run.
+    restart_delay: :class:`float`
+        The amount of seconds to wait before restarting a crashed process.
+    """
+    def __init__(self, app: Application, count: int, *, restart_delay: float = 1.0) -> None:
+        if count < 1:
+            raise ValueError('count must be greater than 0')
+
+        try:
+            self._context = multiprocessing.get_context('fork')
+        except ValueError:
+            raise RuntimeError('Running multiple processes is not supported on this platform') from None
+
+        self.app = app
+        self.count = count
+        self.restart_delay = restart_delay
+
+        self._processes: Dict[int, BaseProcess] = {}
+        self._restarting: Set[int] = set()
+        self._stopping = False
+
+    def __repr__(self) -> str:
+        return f'<Supervisor count={self.count}>'
+
+    @property
+    def processes(self) -> Dict[int, BaseProcess]:
+        """
+        A mapping of process indexes to the currently running processes.
+        """
+        return self._processes.copy()
+
+    def is_stopping(self) -> bool:
+        """
+        True if the supervisor was asked to stop.
+        """
+        return self._stopping
+
+    def _serve(self, index: int) -> None:
+        # Running in the child process from here on, the handlers installed by the supervisor
+        # must not run here.
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, signal.SIG_DFL)
+
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        self._processes.clear()
+        app = self.app
+
+        loop = compat.new_event_loop()
+        compat.set_event_loop(loop)
+
+        app.loop = loop
+        app.setup_workers()
+
+        if app.reuse_port:
+            app.socket = None
+        else:
+            app._socket_shared = True
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, loop.stop)
+
+        loop.run_until_complete(app.start())
+        log.info(f'[Supervisor] Process {index} started serving.')
+
+        try:
+            loop.run_forever()
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+                signal.signal(sig, signal.SIG_IGN)
+
+            if not app.is_closed():
+                loop.run_until_complete(app.close())
+
+            loop.close()
+
+    def spawn(self, index: int) -> BaseProcess:
+        """
+        Starts a new process.
+
+        Parameters
+        ----------
+        index: :class:`int`
+            The index of the process.
+        """
+        process = self._context.Process(target=self._serve, args=(index,), name=f'subway-{index}')
+        process.start()
+
+        self._processes[index] = process
+        log.info(f'[Supervisor] Spawned process {index} (pid {process.pid}).')
+
+        return process
+
+    def forward(self, sig: int) -> None:
+        """
+        Sends a signal to all of the running processes.
+
+        Parameters
+        ----------
+        sig: :class:`int`
+            The signal to send.
+        """
+        for process in self._processes.values():
+            if process.is_alive() and process.pid is not None:
+                try:
+                    os.kill(process.pid, sig)
+                except ProcessLookupError:
+                    pass
+
+    def stop(self, *_: Any) -> None:
+        """
+        Stops all of the processes.
+        """
+        self._stopping = True
+        self.forward(signal.SIGTERM)
+
+    def restart(self, *_: Any) -> None:
+        """
+        Gracefully restarts all of the processes.
+        """
+        self._restarting.update(self._processes.keys())
+        self.forward(signal.SIGTERM)
+
+    def _reap(self, index: int) -> None:
+        process = self._processes.pop(index)
+        process.join()
+
+        if self._stopping:
+            return
+
+        if index in self._restarting:
+            self._restarting.discard(index)
+            self.spawn(index)
+
+            return
+
+        if process.exitcode == 0:
+            log.info(f'[Supervisor] Process {index} (pid {process.pid}) exited.')
+            return
+
+        log.warning(f'[Supervisor] Process {index} (pid {process.pid}) exited with code {process.exitcode}, restarting.')
+        time.sleep(self.restart_delay)
+
+        self.spawn(index)
+
+    def run(self) -> None:
+        """
+        Starts all of the processes and blocks until they have all exited.
+        """
+        app = self.app
+
+        if not app.reuse_port and (not app.socket or utils.socket_is_closed(app.socket)):
+            app.socket = app.create_socket()
+
+        utils.add_signal_handler(signal.SIGINT, self.stop)
+        utils.add_signal_handler(signal.SIGTERM, self.stop)
+
+        if hasattr(signal, 'SIGHUP'):
+            utils.add_signal_handler(signal.SIGHUP, self.restart)
+
+        for index in range(self.count):
+            self.spawn(index)
+
+        while self._processes:
+            sentinels = {process.sentinel: index for index, process in self._processes.items()}
+            ready = wait(list(sentinels), timeout=1.0)
+
+            for sentinel in ready:
+                self._reap(sentinels[sentinel]) # type: ignore
+
+        if app.socket and not utils.socket_is_closed(app.socket):
+            app.socket.close()
+
+        log.info('[Supervisor] All processes exited.')
@@ -3,7 +3,10 @@ from types import FrameType
 
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Type, Tuple, Union, TypeVar, List, Iterator, overload, Literal
 from pathlib import Path
+from email.utils import formatdate, parsedate_tz, mktime_tz
 import warnings
+import hashlib
+import re
 import functools
 import json
 import signal
@@ -12,6 +15,7 @@ import socket
 import os
 import asyncio
 import inspect
+import time
 
 try:
     import orjson
@@ -28,7 +32,8 @@ from .types import (
     Header, 
     ParsedResult, 
     StripedResult, 
-    NonStripedResult
+    NonStripedResult,
+    BytesLike
 )
 from .url import URL
 
@@ -48,6 +53,7 @@ __all__ = (
     'SETTING_ENV_PREFIX',
     'VALID_METHODS',
     'dumps',
+    'dumps_bytes',
     'loads',
     'add_signal_handler',
     'find',
@@ -71,7 +77,15 @@ __all__ = (
     'get_union_args',
     'parse_headers',
     'parse_http_data',
+    'parse_range',
+    'generate_etag',
+    'file_etag',
+    'parse_etags',
+    'etag_matches',
+    'parse_http_date',
     'deprecated',
+    'HTTPDateCache',
+    'LoopLagMonitor',
 )
 
 LOCALHOST = '127.0.0.1'
@@ -79,6 +93,7 @@ LOCALHOST_V6 = '::1'
 GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
 CLRF = b'\r\n'
 SETTING_ENV_PREFIX = 'subway_'
+ETAG_REGEX = re.compile(r'(?:W/)?"[^"]*"')
 VALID_METHODS = (
     "GET",
     "POST",
@@ -94,12 +109,18 @@ if HAS_ORJSON:
         data = orjson.dumps(obj, **kwargs)
         return data.decode('utf-8')
 
+    def dumps_bytes(obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return orjson.dumps(obj, default=default)
+
     def loads(obj: str, **kwargs: Any) -> Any:
         return orjson.loads(obj)
 else:
     def dumps(obj: Any, **kwargs: Any) -> str:
         return json.dumps(obj, **kwargs)
 
+    def dumps_bytes(obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return json.dumps(obj, default=default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
     def loads(obj: str, **kwargs: Any) -> Any:
         return json.loads(obj, **kwargs)
 
@@ -486,6 +507,276 @@ def parse_headers(raw_headers: bytes) -> Iterator[Header]:
 
         yield Header(name.decode().strip(), value.decode().strip())
 
+class HTTPDateCache:
+    """
+    Keeps the value of the ``Date`` header, which only changes once per second, instead of formatting
+    the current date for every response.
+
+    Once started, the value is refreshed by a timer on the event loop at the start of every second.
+    Otherwise, it is refreshed when read if the second changed.
+    """
+    def __init__(self) -> None:
+        self._second = int(time.time())
+        self._value = formatdate(self._second, usegmt=True)
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def __repr__(self) -> str:
+        return f'<HTTPDateCache value={self._value!r}>'
+
+    @property
+    def value(self) -> str:
+        """
+        The current date, formatted as per :rfc:`9110#section-5.6.7`.
+        """
+        if self._handle is None and int(time.time()) != self._second:
+            self.refresh()
+
+        return self._value
+
+    def refresh(self) -> None:
+        """
+        Formats the current date.
+        """
+        self._second = int(time.time())
+        self._value = formatdate(self._second, usegmt=True)
+
+    def _tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.refresh()
+
+        now = time.time()
+        self._handle = loop.call_later(1 - (now - int(now)), self._tick, loop)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Starts refreshing the date once per second.
+
+        Parameters
+        ----------
+        loop: :class:`asyncio.AbstractEventLoop`
+            The event loop to schedule the refreshes with.
+        """
+        if self._handle is not None:
+            return
+
+        self._tick(loop)
+
+    def stop(self) -> None:
+        """
+        Stops refreshing the date.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs callbacks, which grows as the loop gets busier.
+
+    Once started, a timer is scheduled every ``interval`` seconds and the lag is how much later
+    than scheduled it actually ran.
+
+    Parameters
+    ----------
+    interval: :class:`float`
+        The amount of seconds between two measurements.
+    """
+    def __init__(self, interval: float = 0.1) -> None:
+        self.interval = interval
+        self._lag = 0.0
+        self._expected = 0.0
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def __repr__(self) -> str:
+        return f'<LoopLagMonitor lag={self._lag!r}>'
+
+    @property
+    def lag(self) -> float:
+        """
+        The lag of the event loop in seconds, as of the last measurement.
+        """
+        return self._lag
+
+    def _tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        now = loop.time()
+        self._lag = max(now - self._expected, 0.0)
+
+        self._expected = now + self.interval
+        self._handle = loop.call_at(self._expected, self._tick, loop)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Starts measuring the lag of an event loop.
+
+        Parameters
+        ----------
+        loop: :class:`asyncio.AbstractEventLoop`
+            The event loop to measure.
+        """
+        if self._handle is not None:
+            return
+
+        self._expected = loop.time()
+        self._tick(loop)
+
+    def stop(self) -> None:
+        """
+        Stops measuring the lag.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        self._lag = 0.0
+
+def parse_range(value: str, size: int, *, max_ranges: int = 32) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parses the value of a ``Range`` header.
+
+    Parameters
+    ----------
+    value: :class:`str`
+        The value of the header, e.g. ``bytes=0-499, -500``.
+    size: :class:`int`
+        The size of the representation the ranges apply to.
+    max_ranges: :class:`int`
+        The maximum amount of ranges accepted, more than that and the header is ignored.
+
+    Returns
+    -------
+    Optional[List[Tuple[:class:`int`, :class:`int`]]]
+        ``None`` if the header is invalid and should be ignored, an empty list if none of the ranges
+        can be satisfied, otherwise a list of ``(start, end)`` tuples where ``end`` is inclusive.
+        Overlapping ranges are coalesced.
+    """
+    unit, _, spec = value.partition('=')
+    if unit.strip().lower() != 'bytes':
+        return None
+
+    ranges: List[Tuple[int, int]] = []
+    for part in spec.split(','):
+        first, sep, last = part.strip().partition('-')
+        if not sep or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+            return None
+
+        if not first:
+            # A suffix range, the last N bytes.
+            start, end = max(size - int(last), 0), size - 1
+            if not int(last):
+                continue
+        else:
+            start, end = int(first), int(last) if last else size - 1
+            if last and end < start:
+                return None
+
+        if start >= size:
+            continue
+
+        ranges.append((start, min(end, size - 1)))
+
+    if len(ranges) > max_ranges:
+        return None
+
+    ordered = sorted(ranges)
+    if any(start <= previous_end + 1 for (_, previous_end), (start, _) in zip(ordered, ordered[1:])):
+        ranges = []
+        for start, end in ordered:
+            if ranges and start <= ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+            else:
+                ranges.append((start, end))
+
+    return ranges
+
+def generate_etag(data: Union[BytesLike, str], *, weak: bool = False) -> str:
+    """
+    Generates an entity tag by hashing some data.
+
+    Parameters
+    ----------
+    data: Union[:class:`bytes`, :class:`bytearray`, :class:`memoryview`, :class:`str`]
+        The data to hash, usually a response's body.
+    weak: :class:`bool`
+        Whether the entity tag is weak.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+
+    tag = f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+    return 'W/' + tag if weak else tag
+
+def file_etag(result: os.stat_result, *, weak: bool = False) -> str:
+    """
+    Generates an entity tag for a file from its modification time and size, without reading it.
+
+    Parameters
+    ----------
+    result: :class:`os.stat_result`
+        The result of calling :func:`os.stat` on the file.
+    weak: :class:`bool`
+        Whether the entity tag is weak.
+    """
+    tag = f'"{result.st_mtime_ns:x}-{result.st_size:x}"'
+    return 'W/' + tag if weak else tag
+
+def parse_etags(value: str) -> List[str]:
+    """
+    Parses the entity tags of an ``If-Match`` or ``If-None-Match`` header.
+
+    Parameters
+    ----------
+    value: :class:`str`
+        The value of the header, e.g. ``"a", W/"b"`` or ``*``.
+    """
+    return ETAG_REGEX.findall(value)
+
+def etag_matches(etag: str, value: Optional[str], *, weak: bool = True) -> bool:
+    """
+    True if an entity tag matches one of the entity tags of a header.
+
+    Parameters
+    ----------
+    etag: :class:`str`
+        The entity tag, e.g. ``"a"`` or ``W/"a"``.
+    value: Optional[:class:`str`]
+        The value of an ``If-Match``, ``If-None-Match`` or ``If-Range`` header.
+    weak: :class:`bool`
+        Whether to use the weak comparison, where the entity tags only have to have the same opaque tag, or
+        the strong comparison, where both also have to be strong (see :rfc:`9110#section-8.8.3.2`).
+    """
+    if not value:
+        return False
+
+    if value.strip() == '*':
+        return True
+
+    if weak:
+        opaque = etag[2:] if etag.startswith('W/') else etag
+        return any((tag[2:] if tag.startswith('W/') else tag) == opaque for tag in parse_etags(value))
+
+    return not etag.startswith('W/') and etag in parse_etags(value)
+
+def parse_http_date(value: Optional[str]) -> Optional[int]:
+    """
+    Parses an HTTP date, e.g. the value of a ``Last-Modified`` header, into a timestamp.
+    Returns ``None`` if the value is not a valid date.
+
+    Parameters
+    ----------
+    value: Optional[:class:`str`]
+        The date to parse.
+    """
+    if not value:
+        return None
+
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+
+    try:
+        return mktime_tz(parsed)
+    except (OverflowError, ValueError):
+        return None
+
 @overload
 def parse_http_data(data: bytes) -> StripedResult:
     ...
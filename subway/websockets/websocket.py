@@ -24,6 +24,7 @@ class WebSocketProtocol(StreamProtocol):
         self.reader = reader
         self.writer = writer
         self.waiter = waiter
+        self.parser = None
 
     async def wait_until_connected(self) -> None:
         await asyncio.sleep(0)
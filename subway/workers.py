@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Optional, Set, Tuple
 import asyncio
 import logging
 import datetime
 
-from .utils import CLRF
 from .server import TCPServer
 from .request import Request
+from .parser import RequestParser
 from .streams import StreamWriter, StreamReader
-from .errors import PartialRead
-from .responses import HTTPVersionNotSupported
-from . import websockets
+from .errors import HTTPParserError, PartialRead
+from .responses import BadRequest, HTTPException, HTTPVersionNotSupported, ServiceUnavailable, responses
+from . import websockets, utils
 
 if TYPE_CHECKING:
     from .app import Application
@@ -19,13 +19,107 @@ if TYPE_CHECKING:
 __all__ = 'Worker',
 
 log = logging.getLogger(__name__)
-    
+
+class ResponseSlot:
+    """
+    The place of a single response inside of a :class:`ResponseQueue`.
+    """
+    def __init__(self, queue: ResponseQueue, previous: Optional[asyncio.Future[bool]], done: asyncio.Future[bool]) -> None:
+        self.queue = queue
+        self._previous = previous
+        self._done = done
+
+    async def wait(self) -> bool:
+        """
+        Waits until all the responses before this one have been written.
+        Returns ``False`` if the connection is going to be closed before it's this response's turn.
+        """
+        if self._previous is None:
+            return True
+
+        keep_alive = await self._previous
+        if not keep_alive:
+            self.release(keep_alive=False)
+
+        return keep_alive
+
+    def release(self, *, keep_alive: bool = True) -> None:
+        """
+        Marks the response as written, letting the next response in the queue be written.
+
+        Parameters
+        ----------
+        keep_alive: :class:`bool`
+            Whether the connection is kept open after this response.
+        """
+        if self._done.done():
+            return
+
+        if not keep_alive:
+            self.queue.close()
+
+        self._done.set_result(keep_alive)
+
+class ResponseQueue:
+    """
+    A per-connection queue making sure that responses to pipelined requests are written
+    in the same order the requests were received in, even if their handlers finish out of order.
+    ``on_close`` is called once one of the responses closes the connection.
+    """
+    def __init__(self, loop: asyncio.AbstractEventLoop, on_close: Optional[Callable[[], Any]] = None) -> None:
+        self.loop = loop
+        self.on_close = on_close
+        self._tail: Optional[asyncio.Future[bool]] = None
+        self._closing = False
+
+    def slot(self) -> ResponseSlot:
+        """
+        Reserves the next place in the queue.
+        """
+        done = self.loop.create_future()
+        slot = ResponseSlot(self, self._tail, done)
+
+        self._tail = done
+        return slot
+
+    def close(self) -> None:
+        """
+        Marks the connection as closing, no more responses are written after the current one.
+        """
+        if self._closing:
+            return
+
+        self._closing = True
+        if self.on_close is not None:
+            self.on_close()
+
+    def is_closing(self) -> bool:
+        """
+        True if one of the responses in the queue closes the connection.
+        """
+        return self._closing
+
 class Worker(TCPServer):
     """
     A worker class used by the application to handle requests.
     This class is responsible for handling requests from clients and forwarding them to the application. 
     It also handles incoming websocket requests.
 
+    Connections are persistent (HTTP keep-alive), a single connection is used to serve requests until either
+    the client asks for it to be closed, it stays idle for longer than :attr:`~.Settings.keep_alive_timeout` or
+    it served :attr:`~.Settings.max_requests_per_connection` requests.
+
+    Pipelined requests are parsed ahead and dispatched concurrently, up to :attr:`~.Settings.max_pipelined_requests`
+    per connection, while their responses are still written back in the order the requests were received.
+
+    Reading from a connection is paused while more than :attr:`~.Settings.read_buffer_high_water` bytes
+    of it are buffered and resumed once they drop to :attr:`~.Settings.read_buffer_low_water`.
+
+    Load is shed once the worker is overloaded: new connections past :attr:`~.Settings.max_connections`
+    and requests received while :attr:`~.Settings.max_inflight_requests` are being handled or while the event loop
+    lags behind by more than :attr:`~.Settings.max_loop_lag` seconds are answered with a pre-encoded
+    ``503 Service Unavailable`` carrying a ``Retry-After`` header, and their connection is closed.
+
     Parameters
     ----------
     app: :class:`~subway.app.Application`
@@ -48,6 +142,12 @@ class Worker(TCPServer):
         self._ready = asyncio.Event()
         self._serving = False
 
+        self._connections = 0
+        self._inflight_requests = 0
+        self._shed_requests = 0
+        self._lag_monitor = utils.LoopLagMonitor()
+        self._overloaded_response = b''
+
         super().__init__(loop=app.loop)
 
     @property
@@ -57,6 +157,76 @@ class Worker(TCPServer):
         """
         return self.app.connection_read_timeout
 
+    @property
+    def keep_alive_timeout(self) -> float:
+        """
+        The amount of seconds an idle connection is kept open while waiting for the next request.
+        """
+        return self.app.settings.keep_alive_timeout
+
+    @property
+    def max_requests_per_connection(self) -> int:
+        """
+        The maximum amount of requests served over a single connection. ``0`` means no limit.
+        """
+        return self.app.settings.max_requests_per_connection
+
+    @property
+    def max_pipelined_requests(self) -> int:
+        """
+        The maximum amount of requests handled concurrently on a single connection.
+        """
+        return self.app.settings.max_pipelined_requests
+
+    @property
+    def max_connections(self) -> int:
+        """
+        The maximum amount of connections served at once. ``0`` means no limit.
+        """
+        return self.app.settings.max_connections
+
+    @property
+    def max_inflight_requests(self) -> int:
+        """
+        The maximum amount of requests handled at once across all connections. ``0`` means no limit.
+        """
+        return self.app.settings.max_inflight_requests
+
+    @property
+    def max_loop_lag(self) -> float:
+        """
+        The amount of seconds the event loop can lag behind before requests are shed. ``0`` disables it.
+        """
+        return self.app.settings.max_loop_lag
+
+    @property
+    def connections(self) -> int:
+        """
+        The amount of connections currently served.
+        """
+        return self._connections
+
+    @property
+    def inflight_requests(self) -> int:
+        """
+        The amount of requests currently being handled.
+        """
+        return self._inflight_requests
+
+    @property
+    def shed_requests(self) -> int:
+        """
+        The amount of connections and requests that were answered with a ``503`` because the worker was overloaded.
+        """
+        return self._shed_requests
+
+    @property
+    def loop_lag(self) -> float:
+        """
+        The current lag of the event loop in seconds, always ``0`` unless :attr:`max_loop_lag` is set.
+        """
+        return self._lag_monitor.lag
+
     def __repr__(self) -> str:
         return '<Worker id={0.id}>'.format(self)
 
@@ -66,13 +236,50 @@ class Worker(TCPServer):
         """
         return self._serving
 
+    def is_overloaded(self) -> bool:
+        """
+        True if new requests should be shed, because either too many are being handled or the event loop is lagging.
+        """
+        max_inflight_requests = self.max_inflight_requests
+        if max_inflight_requests and self._inflight_requests >= max_inflight_requests:
+            return True
+
+        max_loop_lag = self.max_loop_lag
+        return bool(max_loop_lag) and self._lag_monitor.lag > max_loop_lag
+
     async def wait_until_ready(self):
         """
         Waits until the worker is fully ready to serve requests.
         """
         await self._ready.wait()
 
+    def create_parser(self) -> RequestParser:
+        """
+        Creates the parser that incrementally parses the requests received on a new connection.
+        """
+        return RequestParser(loop=self.loop)
+
+    def get_read_buffer_limits(self) -> Tuple[int, int]:
+        """
+        Returns the high-water and low-water limits for read flow control of every connection.
+        """
+        settings = self.app.settings
+        return settings.read_buffer_high_water, settings.read_buffer_low_water
+
+    async def create_overloaded_response(self) -> bytes:
+        """
+        Encodes the response sent to shed load once, when the worker starts serving.
+        """
+        headers = {'Retry-After': str(self.app.settings.overload_retry_after), 'Connection': 'close'}
+        response = ServiceUnavailable('Service Unavailable', content_type='text/plain', headers=headers)
+
+        return await response.prepare()
+
     async def serve(self, *args: Any, **kwargs: Any) -> None: 
+        self._overloaded_response = await self.create_overloaded_response()
+        if self.max_loop_lag:
+            self._lag_monitor.start(self.loop)
+
         await super().serve(sock=self.app.socket)
 
         self._ready.set()
@@ -87,38 +294,156 @@ class Worker(TCPServer):
         except ValueError:
             pass
 
+        self._lag_monitor.stop()
         self._ready.clear()
         self.app.dispatch('worker_shutdown', self)
         log.info(f'[Worker-{self.id}] Stopped serving.')
 
         self._serving = False
 
+    async def _handle_request(self, request: Request[Application], semaphore: asyncio.Semaphore) -> None:
+        try:
+            await self.app._request_handler(request=request, websocket=None)
+        except Exception:
+            log.exception(f'[Worker-{self.id}] Unhandled exception while handling {request!r}')
+        finally:
+            assert request._slot is not None
+            request._slot.release(keep_alive=request.keep_alive and request.is_responded())
+
+            self._inflight_requests -= 1
+            semaphore.release()
+
+    async def _shed(self, writer: StreamWriter) -> None:
+        self._shed_requests += 1
+        await writer.write(self._overloaded_response, drain=True)
+
     async def on_transport_connect(self, reader: StreamReader, writer: StreamWriter) -> None:
         """
         This function gets called whenever a new connection gets made.
         """
+        if self.max_connections and self._connections >= self.max_connections:
+            await self._shed(writer)
+            writer.close()
+
+            return
+
+        self._connections += 1
         try:
-            status_line = await reader.readuntil(CLRF, timeout=self.connection_read_timeout)
-        except (asyncio.TimeoutError, KeyboardInterrupt, PartialRead):
-            return writer.close()
+            return await self._handle_connection(reader, writer)
+        finally:
+            self._connections -= 1
 
+    async def _handle_connection(self, reader: StreamReader, writer: StreamWriter) -> None:
         peername = writer.get_extra_info('peername')
-        created_at = datetime.datetime.utcnow()
+        parser: RequestParser = writer.get_protocol().parser # type: ignore
+        timeout = self.connection_read_timeout
+        served = 0
+
+        # Stop waiting for more requests as soon as a response closes the connection.
+        queue = ResponseQueue(self.loop, on_close=parser.feed_eof)
+        semaphore = asyncio.Semaphore(self.max_pipelined_requests)
+        pending: Set[asyncio.Task[None]] = set()
+
+        while not queue.is_closing():
+            # Everything buffered before the next head was consumed, whatever is left is at most
+            # a partial head that can only be completed by reading more.
+            reader.resume_reading()
+
+            try:
+                head = await parser.next_head(timeout=timeout)
+            except asyncio.TimeoutError:
+                if not pending:
+                    break
+
+                # The connection isn't idle while there are still requests being handled.
+                await asyncio.wait(pending)
+                continue
+            except HTTPParserError as exc:
+                if pending:
+                    await asyncio.wait(pending)
+
+                if not queue.is_closing():
+                    cls = responses.get(exc.status, BadRequest)
+                    response = cls(str(exc), headers={'Connection': 'close'})
+
+                    await writer.write(await response.prepare(), drain=True)
+
+                break
+            except KeyboardInterrupt:
+                break
+
+            # The head was parsed from data that is also buffered by the reader, which is positioned
+            # right before it since the previous request's body has already been consumed.
+            if head is None or reader.skip(head.size) < head.size:
+                break
+
+            created_at = datetime.datetime.utcnow()
+            request = Request.from_head(head, reader, writer, self, created_at)
+
+            served += 1
+            if self.max_requests_per_connection and served >= self.max_requests_per_connection:
+                request.keep_alive = False
+
+            request._slot = queue.slot()
+
+            if request.version != 'HTTP/1.1':
+                response = HTTPVersionNotSupported()
+                request.keep_alive = False
+
+                await request.send(response, convert=False)
+                break
+
+            if self.is_overloaded():
+                # The request's body is left unread, so the connection can't be used anymore.
+                if await request._slot.wait():
+                    await self._shed(writer)
+
+                request._slot.release(keep_alive=False)
+                break
+
+            self.app.dispatch('request', request, self)
+            log.info(f'[Worker-{self.id}] Received a {request.method!r} request to {request.url.path!r} from {peername}')
+
+            if request.is_websocket():
+                if not await request._slot.wait():
+                    break
+
+                websocket = websockets.create_websocket(writer, reader, client_side=False)
+                await request.handshake()
+
+                # The connection now belongs to the websocket.
+                return await self.app._request_handler(request=request, websocket=websocket)
+
+            if request.headers.get('Upgrade'):
+                # The upgrade was not accepted, so the connection keeps speaking HTTP.
+                parser.resume()
+
+            await semaphore.acquire()
+            self._inflight_requests += 1
+
+            task = self.loop.create_task(self._handle_request(request, semaphore))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+            if not request.keep_alive:
+                break
+
+            if request.has_body():
+                # The body sits between this request and the next one, so it has to be
+                # consumed before anything else can be read off the connection.
+                await task
 
-        request = await Request.parse(status_line, reader, writer, self, created_at)
-        
-        if request.version != 'HTTP/1.1':
-            response = HTTPVersionNotSupported()
-            return await request.send(response, convert=False)
+                try:
+                    await request.discard(timeout=self.keep_alive_timeout)
+                except (asyncio.TimeoutError, PartialRead, HTTPException):
+                    break
 
-        self.app.dispatch('request', request, self)
-        log.info(f'[Worker-{self.id}] Received a {request.method!r} request to {request.url.path!r} from {peername}')
+                if not request.is_body_consumed():
+                    break
 
-        websocket = None
+            timeout = self.keep_alive_timeout
 
-        if request.is_websocket():
-            websocket = websockets.create_websocket(writer, reader, client_side=False)
-            await request.handshake()
+        if pending:
+            await asyncio.wait(pending)
 
-        await self.app._request_handler(request=request, websocket=websocket)
-        
\ No newline at end of file
+        writer.close()
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from subway.errors import HTTPParserError
+from subway.parser import ParserState, RequestParser, parse_chunk_size
+
+
+def parse(data: bytes):
+    loop = asyncio.new_event_loop()
+    try:
+        parser = RequestParser(loop=loop)
+        parser.feed_data(data)
+
+        return parser, list(parser._heads)
+    finally:
+        loop.close()
+
+
+def test_lowercase_content_length_frames_body():
+    body = b'GET /secret HTTP/1.1\r\nHost: x\r\n\r\n'
+    parser, heads = parse(
+        b'POST /echo HTTP/1.1\r\nHost: x\r\ncontent-length: ' + str(len(body)).encode() + b'\r\n\r\n' + body
+    )
+
+    assert len(heads) == 1
+    assert heads[0].path == '/echo'
+    assert heads[0].content_length == len(body)
+    assert heads[0].headers['Content-Length'] == str(len(body))
+    assert parser.state is ParserState.HEAD
+
+
+def test_lowercase_transfer_encoding_frames_body():
+    parser, heads = parse(
+        b'POST /echo HTTP/1.1\r\nHost: x\r\ntransfer-encoding: chunked\r\n\r\n'
+        b'5\r\nhello\r\n0\r\n\r\n'
+        b'GET /next HTTP/1.1\r\nHost: x\r\n\r\n'
+    )
+
+    assert [head.path for head in heads] == ['/echo', '/next']
+    assert heads[0].chunked
+
+
+@pytest.mark.parametrize('headers', [
+    b'Content-Length: 5\r\ntransfer-encoding: chunked\r\n',
+    b'content-length: 5\r\nContent-Length: 6\r\n',
+    b'Content-Length: 5, 6\r\n',
+    b'Content-Length: +5\r\n',
+    b'Transfer-Encoding: gzip\r\n',
+])
+def test_ambiguous_framing_is_rejected(headers):
+    parser, heads = parse(b'POST /echo HTTP/1.1\r\nHost: x\r\n' + headers + b'\r\nhello')
+
+    assert not heads
+    assert parser.state is ParserState.ERROR
+    assert isinstance(parser._error, HTTPParserError)
+    assert parser._error.status == 400
+
+
+def test_repeated_identical_content_length_is_accepted():
+    _, heads = parse(b'POST /echo HTTP/1.1\r\nContent-Length: 5\r\ncontent-length: 5\r\n\r\nhello')
+
+    assert len(heads) == 1
+    assert heads[0].content_length == 5
+
+
+@pytest.mark.parametrize('body', [
+    b'0\n\r\n',
+    b'5\nhello\r\n0\r\n\r\n',
+    b'5\r\nhello\n0\r\n\r\n',
+    b'0\r\nTrailer: x\n\r\n',
+])
+def test_chunk_lines_must_end_with_crlf(body):
+    parser, heads = parse(
+        b'POST /echo HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n' + body +
+        b'GET /a HTTP/1.1\r\n\r\nGET /b HTTP/1.1\r\n\r\n'
+    )
+
+    assert [head.path for head in heads] == ['/echo']
+    assert parser.state is ParserState.ERROR
+    assert parser._error.status == 400
+
+
+@pytest.mark.parametrize('size', [b'0x5', b'5_0', b'+5', b' 5', b'5 ', b'', b'-1', b'12345678901234567'])
+def test_invalid_chunk_sizes_are_rejected(size):
+    parser, _ = parse(b'POST /echo HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n' + size + b'\r\nhello\r\n0\r\n\r\n')
+
+    assert parser.state is ParserState.ERROR
+    assert parser._error.status == 400
+
+
+def test_chunk_extensions_are_ignored():
+    parser, heads = parse(
+        b'POST /echo HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n'
+        b'5;name=value\r\nhello\r\n0\r\n\r\n'
+        b'GET /next HTTP/1.1\r\n\r\n'
+    )
+
+    assert [head.path for head in heads] == ['/echo', '/next']
+    assert parser.state is ParserState.HEAD
+
+
+@pytest.mark.parametrize('line, size', [(b'0', 0), (b'1f', 31), (b'A;ext', 10)])
+def test_parse_chunk_size(line, size):
+    assert parse_chunk_size(line) == size
+
+
+@pytest.mark.parametrize('line', [b'0x5', b'5_0', b'+5', b' 5', b'5\n', b'0;ext\n'])
+def test_parse_chunk_size_is_strict(line):
+    with pytest.raises(ValueError):
+        parse_chunk_size(line)